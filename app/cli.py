@@ -0,0 +1,160 @@
+"""Zamanlanmış (cron) ve toplu taramalar için komut satırı arayüzü.
+
+    python -m app.scraper crawl --site https://www.hurriyet.com.tr \
+        --from 2025-06-01 --to 2025-06-07 --workers 16 --out haberler.csv
+
+Çıktı biçimi dosya uzantısından seçilir (.csv, .jsonl, .parquet); `--out -`
+(varsayılan) haberleri JSON Lines olarak standart çıktıya yazar. Dolu bir
+çıktı dosyasının üzerine yazılmaz; önceki taramanın sonuna eklemek için
+`--append` verilmelidir (CSV'de başlık sütunları aynı olmalıdır). Durum
+mesajları ve tarama sonundaki verim istatistikleri standart hataya yazılır.
+Hızlı başlangıç için ağır modüller argümanlar okunduktan sonra yüklenir;
+streamlit ve plotly hiç yüklenmez.
+"""
+import argparse
+import contextlib
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+
+
+def _parse_datetime(value, end_of_day=False):
+    """'2025-06-17' veya '2025-06-17 15:30' / ISO biçimindeki argümanı çevirir"""
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Geçersiz tarih: {value} (örnek: 2025-06-17 veya 2025-06-17T15:30)")
+    if end_of_day and len(value) <= 10:
+        # Yalnızca gün verildiyse günün sonuna kadar al
+        parsed = parsed.replace(hour=23, minute=59, second=59)
+    return parsed.replace(tzinfo=None)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m app.scraper', description="YEB haber tarayıcısı")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    crawl = commands.add_parser('crawl', help="Siteleri zaman aralığına göre tarar")
+    crawl.add_argument('--site', action='append', required=True,
+                       help="Taranacak site URL'si (birden fazla site için tekrarlanabilir)")
+    crawl.add_argument('--from', dest='start', type=_parse_datetime,
+                       help="Başlangıç tarihi/saati (varsayılan: 24 saat önce)")
+    crawl.add_argument('--to', dest='end', type=lambda value: _parse_datetime(value, end_of_day=True),
+                       help="Bitiş tarihi/saati (varsayılan: şimdi)")
+    crawl.add_argument('--workers', type=int, default=16, help="Eşzamanlı haber indirme sayısı")
+    crawl.add_argument('--per-host', type=int, default=4, help="Host başına aynı anda en fazla istek")
+    crawl.add_argument('--interval', type=float, default=0.5, help="Aynı host'a istekler arası minimum saniye")
+    crawl.add_argument('--max-pages', type=int, default=3, help="Site başına en fazla listeleme sayfası (sitemap modunda sayfa başına 30 link)")
+    crawl.add_argument('--out', default='-', help="Çıktı dosyası (.csv, .jsonl, .parquet) veya '-' (stdout JSONL)")
+    crawl.add_argument('--append', action='store_true',
+                       help="Çıktı dosyası doluysa sonuna ekle (verilmezse dolu dosyaya yazılmaz)")
+    crawl.add_argument('--batch-size', type=int, default=50, help="Diske yazma partisi boyutu")
+    crawl.add_argument('--parser', default='auto', help="HTML parser arka ucu (bkz. app/parsers.py)")
+    crawl.add_argument('--no-cache', action='store_true', help="HTTP önbelleğini kullanma")
+    crawl.add_argument('--no-state', action='store_true', help="Kalıcı tarama durumunu kullanma")
+    crawl.add_argument('--verbose', '-v', action='store_true', help="Durum mesajlarını standart hataya yaz")
+    return parser
+
+
+class _StdoutJsonlSink:
+    """Haberleri standart çıktıya JSON Lines olarak yazar (her satırda flush)"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.written = 0
+
+    def write(self, item):
+        self.stream.write(json.dumps(item, ensure_ascii=False) + '\n')
+        self.stream.flush()
+        self.written += 1
+
+    def close(self):
+        pass
+
+
+def run_crawl(args):
+    # Ağır modüller yalnızca tarama gerçekten başlayacaksa yüklenir
+    from .crawl_state import CrawlStateStore
+    from .http_cache import HttpResponseCache
+    from .orchestrator import MultiSiteCrawler
+    from .scraper import load_learned_selectors
+    from .site_configs import get_site_config
+    from .sinks import has_existing_output, open_sink
+
+    end_time = args.end or datetime.now()
+    start_time = args.start or end_time - timedelta(days=1)
+    if start_time >= end_time:
+        print("Başlangıç tarihi bitiş tarihinden önce olmalıdır.", file=sys.stderr)
+        return 2
+
+    if args.out != '-' and not args.append and has_existing_output(args.out):
+        print(f"{args.out} zaten veri içeriyor; sonuna eklemek için --append verin "
+              f"veya başka bir çıktı dosyası seçin.", file=sys.stderr)
+        return 2
+
+    stdout = sys.stdout
+    try:
+        sink = _StdoutJsonlSink(stdout) if args.out == '-' else open_sink(args.out, batch_size=args.batch_size)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    cache = None if args.no_cache else HttpResponseCache()
+    crawl_state = None if args.no_state else CrawlStateStore()
+    configs = [load_learned_selectors(get_site_config(site)) for site in args.site]
+    crawler = MultiSiteCrawler(configs, max_workers=args.workers, max_in_flight_per_host=args.per_host,
+                               min_request_interval=args.interval, cache=cache, crawl_state=crawl_state,
+                               parser=args.parser)
+
+    def report(message):
+        if args.verbose:
+            print(message, file=sys.stderr)
+
+    started = time.monotonic()
+    interrupted = False
+    # Tarayıcının print çıktıları stdout'taki JSONL akışını bozmasın
+    with contextlib.redirect_stdout(sys.stderr):
+        try:
+            for news_item in crawler.crawl(start_time, end_time, args.max_pages, status_callback=report):
+                sink.write(news_item)
+        except KeyboardInterrupt:
+            interrupted = True
+        finally:
+            sink.close()
+            for config in configs:
+                config.save()
+            if cache:
+                cache.close()
+            if crawl_state:
+                crawl_state.close()
+
+    _print_stats(crawler, sink.written, time.monotonic() - started, cache)
+    return 130 if interrupted else 0
+
+
+def _print_stats(crawler, written, elapsed, cache):
+    """Site bazında ve toplam verim istatistiklerini standart hataya yazar"""
+    stats = crawler.get_stats()
+    requests_total = sum(row['İstek'] for row in stats)
+    print("\nSite                      Haber  İstek   Süre(sn)  Haber/sn  İstek/sn", file=sys.stderr)
+    for row in stats:
+        print(f"{row['Site'][:24]:<24}{row['Haber']:>7}{row['İstek']:>7}{row['Süre (sn)']:>11.1f}"
+              f"{row['Haber/sn']:>10.2f}{row['İstek/sn']:>10.2f}"
+              + (f"  Hata: {row['Hata']}" if row['Hata'] else ''), file=sys.stderr)
+    print(f"Toplam: {written} haber, {requests_total} istek, {elapsed:.1f} sn, "
+          f"{written / elapsed if elapsed else 0:.2f} haber/sn, "
+          f"{requests_total / elapsed if elapsed else 0:.2f} istek/sn", file=sys.stderr)
+    if cache:
+        print(f"Önbellek: {cache.hits} isabet, {cache.revalidations} yeniden doğrulama, {cache.misses} ıska",
+              file=sys.stderr)
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command == 'crawl':
+        return run_crawl(args)
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
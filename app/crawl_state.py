@@ -0,0 +1,126 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+
+# URL kimliğini değiştirmeyen takip parametreleri
+TRACKING_PARAMS = {'fbclid', 'gclid', 'yclid', 'mc_cid', 'mc_eid', 'ref', 'utm_source',
+                   'utm_medium', 'utm_campaign', 'utm_term', 'utm_content'}
+
+
+def normalize_url(url):
+    """URL'yi karşılaştırma anahtarına çevirir.
+
+    Şema ve host küçük harfe çevrilir, fragment ve takip parametreleri
+    atılır, kalan sorgu parametreleri sıralanır, sondaki '/' kaldırılır.
+    """
+    parsed = urlparse(url.strip())
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith('utm_')
+    )
+    path = parsed.path.rstrip('/') or '/'
+    return urlunparse((parsed.scheme.lower(), parsed.netloc.lower(), path, parsed.params, urlencode(query), ''))
+
+
+def content_hash(content):
+    return hashlib.sha1(content.encode('utf-8')).hexdigest() if content else None
+
+
+class CrawlStateStore:
+    """Çalıştırmalar arası kalıcı tarama durumu (SQLite).
+
+    Normalize edilmiş URL anahtarıyla bilinen yayın tarihini, içerik özetini
+    (hash), son görülme zamanını ve tamamlanmış haberlerin alanlarını saklar.
+    Böylece tarayıcı bilinen haberleri ağa çıkmadan eleyebilir veya kayıtlı
+    veriden tamamlayabilir.
+    """
+
+    def __init__(self, path: str = '.yeb_cache/crawl_state.sqlite'):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS articles (
+                url_key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                published_at TEXT,
+                title TEXT,
+                content TEXT,
+                source TEXT,
+                content_hash TEXT,
+                last_seen REAL NOT NULL
+            )
+        ''')
+        self._conn.commit()
+
+    def get(self, url):
+        """URL için kayıtlı durumu döndürür (yoksa None) ve son görülme zamanını günceller"""
+        key = normalize_url(url)
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT url, published_at, title, content, source, content_hash FROM articles WHERE url_key = ?',
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute('UPDATE articles SET last_seen = ? WHERE url_key = ?', (time.time(), key))
+            self._conn.commit()
+
+        stored_url, published_at, title, content, source, digest = row
+        return {
+            'url': stored_url,
+            'published_at': datetime.fromisoformat(published_at) if published_at else None,
+            'title': title,
+            'content': content,
+            'source': source,
+            'content_hash': digest
+        }
+
+    def record(self, url, published_at=None, title=None, content=None, source=None):
+        """Bir haberin durumunu yazar; verilmeyen alanlar mevcut değerleriyle korunur"""
+        key = normalize_url(url)
+        with self._lock:
+            self._conn.execute(
+                'INSERT INTO articles (url_key, url, published_at, title, content, source, content_hash, last_seen) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT(url_key) DO UPDATE SET '
+                'url = excluded.url, '
+                'published_at = COALESCE(excluded.published_at, published_at), '
+                'title = COALESCE(excluded.title, title), '
+                'content = COALESCE(excluded.content, content), '
+                'source = COALESCE(excluded.source, source), '
+                'content_hash = COALESCE(excluded.content_hash, content_hash), '
+                'last_seen = excluded.last_seen',
+                (key, url, published_at.isoformat() if published_at else None, title, content, source,
+                 content_hash(content), time.time())
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def is_complete(state):
+        """Kayıtlı durumdan tam bir haber satırı üretilebilir mi?"""
+        return bool(state and state['published_at'] and state['title'] and state['content'])
+
+    @staticmethod
+    def to_news_item(state):
+        """Kayıtlı durumu scraper çıktı satırına dönüştürür"""
+        return {
+            'Haber Başlığı': state['title'],
+            'Haber Metni': state['content'],
+            'Haber Linki': state['url'],
+            'Tarih': state['published_at'].strftime('%Y-%m-%d %H:%M'),
+            'Kaynak': state['source'] or "Kaynak bulunamadı"
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
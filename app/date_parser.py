@@ -0,0 +1,229 @@
+"""Tarih ayrıştırma motoru.
+
+Scraper'ın tarih çözümleme sırası korunur: ISO 8601, (açıksa) Türkçe
+kalıplar, ardından yaygın `strptime` formatları. Bunun üzerine:
+
+    * Tüm düzenli ifadeler modül yüklenirken bir kez derlenir.
+    * Her `DateParser` (site başına bir tane) metnin "şeklini" (rakamlar
+      '9' ile değiştirilmiş hali) hangi stratejinin çözdüğünü hatırlar;
+      aynı şekildeki sonraki metinlerde önce o strateji denenir.
+    * Aynı metin tekrar geldiğinde sonuç önbellekten döner.
+    * `parse_series` bir pandas sütununu toplu çözer: tekrar eden değerler
+      bir kez çözülür, ISO ve `strptime` formatlı şekiller `pd.to_datetime`
+      ile vektörel olarak dönüştürülür.
+"""
+import re
+from datetime import datetime
+from functools import lru_cache
+
+
+MONTHS = {
+    'ocak': 1, 'şubat': 2, 'mart': 3, 'nisan': 4,
+    'mayıs': 5, 'haziran': 6, 'temmuz': 7, 'ağustos': 8,
+    'eylül': 9, 'ekim': 10, 'kasım': 11, 'aralık': 12,
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4,
+    'may': 5, 'jun': 6, 'jul': 7, 'aug': 8,
+    'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+
+# (kalıp, ay adı mı?) - sıra önemlidir, ilk eşleşen kullanılır
+TURKISH_PATTERNS = [
+    (re.compile(r'(\d{1,2})\s+(\w+)\s+(\d{4})\s+(\d{1,2}):(\d{2})'), True),   # 17 haziran 2025 15:30
+    (re.compile(r'(\d{1,2})\s+(\w+)\s+(\d{4})'), True),                       # 17 haziran 2025
+    (re.compile(r'(\d{2})\.(\d{2})\.(\d{4})\s*-?\s*(\d{1,2}):(\d{2})'), False),  # 17.06.2025 - 15:30
+    (re.compile(r'(\d{2})\.(\d{2})\.(\d{4})'), False),                        # 17.06.2025
+    (re.compile(r'(\d{2})/(\d{2})/(\d{4})\s+(\d{1,2}):(\d{2})'), False),      # 17/06/2025 15:30
+    (re.compile(r'(\d{2})/(\d{2})/(\d{4})'), False)                           # 17/06/2025
+]
+
+STRPTIME_FORMATS = [
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d %H:%M',
+    '%Y-%m-%d',
+    '%d.%m.%Y %H:%M:%S',
+    '%d.%m.%Y %H:%M',
+    '%d.%m.%Y',
+    '%d/%m/%Y %H:%M:%S',
+    '%d/%m/%Y %H:%M',
+    '%d/%m/%Y',
+    '%Y/%m/%d %H:%M:%S',
+    '%Y/%m/%d %H:%M',
+    '%Y/%m/%d'
+]
+
+_DIGIT_TABLE = str.maketrans('0123456789', '9999999999')
+# ISO metinlerinin sonundaki saat dilimi; fromisoformat(...).replace(tzinfo=None) ile aynı sonuç için atılır
+_ISO_OFFSET_RE = r'(?:Z|[+-]\d{2}:?\d{2})$'
+
+
+def date_shape(text):
+    """'2025-06-17 15:30' -> '9999-99-99 99:99' (format çıkarımı anahtarı)"""
+    return text.translate(_DIGIT_TABLE)
+
+
+def _parse_iso(text):
+    if 'T' not in text:
+        return None
+    try:
+        return datetime.fromisoformat(text.replace('Z', '+00:00')).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
+def parse_turkish_date(text):
+    """Türkçe (ve kısa İngilizce ay adlı) tarih metnini çözer; çözemezse None"""
+    try:
+        if 'T' in text and ('Z' in text or '+' in text):
+            return datetime.fromisoformat(text.replace('Z', '+00:00')).replace(tzinfo=None)
+
+        text = text.lower().strip()
+        for pattern, named_month in TURKISH_PATTERNS:
+            match = pattern.search(text)
+            if match:
+                return _build_turkish_date(match.groups(), named_month)
+    except (ValueError, OverflowError):
+        pass
+    return None
+
+
+def _build_turkish_date(groups, named_month):
+    day, month, year = groups[:3]
+    month = MONTHS.get(month, 1) if named_month else int(month)
+    if len(groups) == 5:
+        return datetime(int(year), month, int(day), int(groups[3]), int(groups[4]))
+    return datetime(int(year), month, int(day))
+
+
+def _format_from_match(match):
+    """Sayısal Türkçe kalıp eşleşmesini eşdeğer strptime formatına çevirir ('17.06.2025' -> '%d.%m.%Y')"""
+    text = match.string
+    pieces = []
+    position = 0
+    for index, directive in enumerate(('%d', '%m', '%Y', '%H', '%M')[:len(match.groups())], start=1):
+        start, end = match.span(index)
+        pieces.append(text[position:start].replace('%', '%%'))
+        pieces.append(directive)
+        position = end
+    pieces.append(text[position:].replace('%', '%%'))
+    return ''.join(pieces)
+
+
+def _parse_strptime(text, fmt):
+    try:
+        return datetime.strptime(text, fmt)
+    except ValueError:
+        return None
+
+
+class DateParser:
+    """Site başına tarih ayrıştırıcı; format çıkarımı ve memoization içerir.
+
+    Stratejiler: 'iso', 'turkish' ve `STRPTIME_FORMATS` içindeki formatlar.
+    Bir şekil için kazanan strateji önce denenir; tutmazsa tam sıra
+    çalıştırılır, bu yüzden sonuç her zaman sıralı denemeyle aynıdır
+    (aynı şekildeki metinlerin aynı formatta olduğu varsayımıyla).
+    """
+
+    def __init__(self, turkish: bool = True, cache_size: int = 4096):
+        self.turkish = turkish
+        self._strategies = ['iso'] + (['turkish'] if turkish else []) + STRPTIME_FORMATS
+        self._shape_strategy = {}  # şekil -> son başarılı strateji
+        self.parse = lru_cache(maxsize=cache_size)(self._parse)
+
+    def _apply(self, strategy, text):
+        if strategy == 'iso':
+            return _parse_iso(text)
+        if strategy == 'turkish':
+            return parse_turkish_date(text)
+        return _parse_strptime(text, strategy)
+
+    def _parse(self, text):
+        """Metni datetime'a çevirir; çözülemezse None (sonuçlar önbelleklenir)"""
+        if not text:
+            return None
+        text = str(text).strip()
+        shape = date_shape(text)
+
+        known = self._shape_strategy.get(shape)
+        if known is not None:
+            parsed = self._apply(known, text)
+            if parsed is not None:
+                return parsed
+
+        for strategy in self._strategies:
+            if strategy == known:
+                continue
+            parsed = self._apply(strategy, text)
+            if parsed is not None:
+                self._shape_strategy[shape] = strategy
+                return parsed
+        return None
+
+    def parse_series(self, values):
+        """Ham tarih metinleri sütununu `datetime64` sütununa çevirir (çözülemeyenler NaT)"""
+        import numpy as np
+        import pandas as pd
+
+        values = pd.Series(values)
+        texts = values.where(values.notna(), '').astype(str).str.strip()
+        codes, uniques = pd.factorize(texts)
+        uniques = pd.Series(uniques)
+        parsed = np.full(len(uniques), np.datetime64('NaT'), dtype='datetime64[ns]')
+
+        # Tekil değerleri şekle göre grupla; strptime formatlı şekiller vektörel çözülür
+        shapes = uniques.str.translate(_DIGIT_TABLE)
+        for shape, group in uniques.groupby(shapes, sort=False):
+            first = self.parse(group.iloc[0])
+            strategy = self._shape_strategy.get(shape)
+            converted = self._convert_group(group, strategy, shape, group.iloc[0]) if first is not None else None
+            if converted is None:
+                converted = pd.to_datetime([self.parse(text) for text in group])
+            else:
+                # Vektörel dönüşümün çözemediği değerler tek tek çözülür
+                missing = converted.isna()
+                if missing.any():
+                    converted[missing] = pd.to_datetime([self.parse(text) for text in group[missing]])
+            parsed[group.index.to_numpy()] = np.asarray(converted, dtype='datetime64[ns]')
+
+        return pd.Series(parsed[codes], index=values.index)
+
+    def _convert_group(self, group, strategy, shape, sample):
+        """Aynı şekildeki metinleri stratejiye göre vektörel çevirir; mümkün değilse None"""
+        import pandas as pd
+
+        if strategy == 'iso':
+            return pd.to_datetime(group.str.replace(_ISO_OFFSET_RE, '', regex=True),
+                                  format='ISO8601', errors='coerce')
+        if strategy in STRPTIME_FORMATS:
+            return pd.to_datetime(group, format=strategy, errors='coerce')
+        if strategy != 'turkish' or 'T' in shape:
+            return None
+
+        # Aynı şekildeki metinlerde ilk eşleşen Türkçe kalıp da aynıdır; örnekten bulunur
+        sample = sample.lower().strip()
+        for pattern, named_month in TURKISH_PATTERNS:
+            match = pattern.search(sample)
+            if match:
+                break
+        else:
+            return None
+
+        if not named_month and match.span() == (0, len(sample)) and sample == group.iloc[0]:
+            # Tüm metni kaplayan sayısal kalıp: eşdeğer strptime formatıyla C hızında çevir
+            return pd.to_datetime(group, format=_format_from_match(match), errors='coerce')
+
+        parts = group.str.lower().str.strip().str.extract(pattern)
+        if parts[0].isna().any():
+            return None
+        month = parts[1].map(MONTHS).fillna(1) if named_month else parts[1]
+        fields = pd.DataFrame({'year': parts[2], 'month': month, 'day': parts[0]}).astype(int)
+        if parts.shape[1] == 5:
+            fields['hour'] = parts[3].astype(int)
+            fields['minute'] = parts[4].astype(int)
+        return pd.Series(pd.to_datetime(fields, errors='coerce').to_numpy(), index=group.index)
+
+    def normalize_column(self, df, column: str = 'Tarih', output_format: str = '%Y-%m-%d %H:%M'):
+        """DataFrame'deki tarih sütununu tek biçime çevirir; çözülemeyen değerler olduğu gibi kalır"""
+        parsed = self.parse_series(df[column])
+        df[column] = parsed.dt.strftime(output_format).where(parsed.notna(), df[column])
+        return df
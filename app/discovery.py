@@ -0,0 +1,197 @@
+import zlib
+import xml.etree.ElementTree as ET
+from datetime import timedelta
+from email.utils import parsedate_to_datetime
+from urllib.parse import urljoin
+
+import requests
+
+from .politeness import RequestCancelled
+
+
+DEFAULT_SITEMAP_PATHS = ['/news-sitemap.xml', '/sitemap-news.xml', '/sitemap_news.xml']
+DEFAULT_FEED_PATHS = ['/rss', '/rss.xml', '/feed']
+
+# Saat dilimi farkları için zaman aralığına eklenen tolerans
+DATE_SLACK = timedelta(days=1)
+
+
+def _local_name(tag):
+    """'{namespace}loc' -> 'loc'"""
+    return tag.rsplit('}', 1)[-1].lower()
+
+
+def _child_text(element, *names):
+    for child in element:
+        if _local_name(child.tag) in names and child.text and child.text.strip():
+            return child.text.strip()
+    return None
+
+
+class SitemapFeedDiscovery:
+    """Sitemap ve RSS/Atom akışlarından haber linki keşfeder.
+
+    XML belgeleri `XMLPullParser` ile parça parça okunur; işlenen elemanlar
+    hemen temizlendiği için büyük sitemap'lerde bellek sabit kalır. Girdiler
+    herhangi bir haber sayfası indirilmeden önce zaman aralığına göre
+    süzülür. Sitemap index dosyalarında yalnızca `lastmod` değeri aralıkla
+    uyumlu olan alt sitemap'ler açılır.
+    """
+
+    def __init__(self, scraper, max_entries: int = 1000, max_documents: int = 20):
+        self.scraper = scraper
+        self.max_entries = max_entries
+        self.max_documents = max_documents
+
+    def discover(self, start_time, end_time, status_callback=None, cancel_event=None):
+        """Aralıktaki haber linklerini URL -> yayın tarihi (bilinmiyorsa None) olarak döndürür.
+
+        `cancel_event` set edildiğinde yeni belge açılmaz; o ana kadar bulunan linkler döner.
+        """
+        config = self.scraper.config
+        sources = self._robots_sitemaps(config.base_url, cancel_event)
+        for path in (config.sitemap_paths or []) + (config.feed_paths or []):
+            url = urljoin(config.base_url, path)
+            if url not in sources:
+                sources.append(url)
+
+        entries = {}
+        visited = set()
+        pending = list(sources)
+        while pending and len(visited) < self.max_documents and len(entries) < self.max_entries:
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            url = pending.pop(0)
+            if url in visited:
+                continue
+            visited.add(url)
+
+            try:
+                child_sitemaps, found = self._read_document(url, start_time, end_time, cancel_event)
+            except RequestCancelled:
+                break
+            except requests.HTTPError:
+                continue  # Sitede bu yol yok, sıradakini dene
+            except Exception as e:
+                if status_callback:
+                    status_callback(f"Sitemap/RSS okunamadı {url}: {e}")
+                continue
+
+            pending.extend(child for child in child_sitemaps if child not in visited)
+            for entry_url, published in found:
+                if len(entries) >= self.max_entries:
+                    break
+                if entries.get(entry_url) is None:
+                    entries[entry_url] = published
+
+            if status_callback and found:
+                status_callback(f"{url}: aralıkta {len(found)} haber bulundu")
+
+        return entries
+
+    def _robots_sitemaps(self, base_url, cancel_event=None):
+        """robots.txt içindeki 'Sitemap:' satırlarını döndürür (haber sitemap'leri önce)"""
+        try:
+            response = self.scraper._get(urljoin(base_url, '/robots.txt'), url_class='listing',
+                                         cancel_event=cancel_event)
+        except Exception:
+            return []
+
+        sitemaps = []
+        for line in response.text.splitlines():
+            key, _, value = line.partition(':')
+            if key.strip().lower() == 'sitemap' and value.strip():
+                sitemaps.append(value.strip())
+        return sorted(sitemaps, key=lambda url: 'news' not in url.lower())
+
+    def _iter_chunks(self, response, url):
+        """Yanıt gövdesini parça parça döndürür; .gz sitemap'leri akış halinde açar"""
+        gzipped = url.lower().endswith('.gz') and 'gzip' not in response.headers.get('Content-Encoding', '')
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS) if gzipped else None
+        for chunk in response.iter_content(chunk_size=16384):
+            yield decompressor.decompress(chunk) if decompressor else chunk
+        if decompressor:
+            yield decompressor.flush()
+
+    def _read_document(self, url, start_time, end_time, cancel_event=None):
+        """Tek bir sitemap/akış belgesini okur; (alt sitemap'ler, aralıktaki girdiler) döndürür"""
+        response = self.scraper._get(url, url_class='listing', cancel_event=cancel_event, stream=True)
+        parser = ET.XMLPullParser(events=('end',))
+        child_sitemaps = []
+        found = []
+
+        try:
+            for chunk in self._iter_chunks(response, url):
+                parser.feed(chunk)
+                for _, element in parser.read_events():
+                    name = _local_name(element.tag)
+                    if name == 'sitemap':
+                        self._handle_child_sitemap(element, start_time, child_sitemaps)
+                    elif name in ('url', 'item', 'entry'):
+                        entry = self._parse_entry(element, name)
+                        if entry and self._entry_in_window(entry, start_time, end_time):
+                            found.append((entry[0], entry[1] if entry[2] == 'published' else None))
+                    else:
+                        continue
+                    element.clear()
+            parser.close()
+        finally:
+            response.close()
+
+        return child_sitemaps, found
+
+    def _handle_child_sitemap(self, element, start_time, child_sitemaps):
+        loc = _child_text(element, 'loc')
+        if not loc:
+            return
+        lastmod = self._parse_date(_child_text(element, 'lastmod'))
+        # Aralığın başından önce son değişmiş bir sitemap yeni haber içeremez
+        if lastmod is None or lastmod >= start_time - DATE_SLACK:
+            child_sitemaps.append(loc)
+
+    def _parse_entry(self, element, name):
+        """Girdi elemanından (url, tarih, tarih türü) üçlüsü çıkarır"""
+        if name == 'url':
+            loc = _child_text(element, 'loc')
+            published = None
+            for child in element.iter():
+                if _local_name(child.tag) == 'publication_date' and child.text:
+                    published = self._parse_date(child.text.strip())
+                    break
+            if published:
+                return loc, published, 'published'
+            return loc, self._parse_date(_child_text(element, 'lastmod')), 'modified'
+
+        if name == 'item':
+            link = _child_text(element, 'link', 'guid')
+            return link, self._parse_date(_child_text(element, 'pubdate', 'date')), 'published'
+
+        # Atom: <link href="..."/>
+        link = None
+        for child in element:
+            if _local_name(child.tag) == 'link' and child.get('href') and child.get('rel', 'alternate') == 'alternate':
+                link = child.get('href')
+                break
+        published = self._parse_date(_child_text(element, 'published'))
+        if published:
+            return link, published, 'published'
+        return link, self._parse_date(_child_text(element, 'updated')), 'modified'
+
+    def _entry_in_window(self, entry, start_time, end_time):
+        url, date, kind = entry
+        if not url or not self.scraper._is_valid_news_url(url):
+            return False
+        if date is None:
+            return True
+        if kind == 'modified':
+            # Yayın tarihi son değişiklikten sonra olamaz; sonradan güncellenen haberler kalır
+            return date >= start_time - DATE_SLACK
+        return start_time - DATE_SLACK <= date <= end_time + DATE_SLACK
+
+    def _parse_date(self, value):
+        if not value:
+            return None
+        try:
+            return parsedate_to_datetime(value).replace(tzinfo=None)  # RSS: RFC 822
+        except (TypeError, ValueError, IndexError):
+            return self.scraper._parse_any_date_format(value)
@@ -0,0 +1,155 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+class HttpResponseCache:
+    """SQLite tabanlı kalıcı HTTP yanıt önbelleği.
+
+    Gövdeyi, ETag ve Last-Modified başlıklarını saklar. Her URL sınıfı için
+    (listeleme sayfası, haber sayfası) ayrı bir tazelik süresi (TTL) vardır;
+    süresi dolan kayıtlar `If-None-Match` / `If-Modified-Since` ile yeniden
+    doğrulanır. Toplam boyut `max_size_bytes` değerini aşınca en uzun süredir
+    kullanılmayan kayıtlar silinir (LRU).
+    """
+
+    DEFAULT_TTLS = {
+        'listing': 5 * 60,              # Listeleme sayfaları sık değişir
+        'article': 7 * 24 * 60 * 60,    # Haber sayfaları neredeyse hiç değişmez
+        'default': 60 * 60
+    }
+
+    STORED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+    def __init__(self, path: str = '.yeb_cache/http_cache.sqlite', ttls: dict = None,
+                 max_size_bytes: int = 512 * 1024 * 1024):
+        self.path = path
+        self.ttls = dict(self.DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.max_size_bytes = max_size_bytes
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                headers TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+        ''')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access)')
+        self._conn.commit()
+        self._total_size = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+
+    def get(self, url):
+        """Önbellekteki kaydı döndürür (yoksa None) ve erişim zamanını günceller"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT body, headers, etag, last_modified, fetched_at FROM responses WHERE url = ?',
+                (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute('UPDATE responses SET last_access = ? WHERE url = ?', (time.time(), url))
+            self._conn.commit()
+
+        body, headers, etag, last_modified, fetched_at = row
+        return {
+            'url': url,
+            'body': body,
+            'headers': json.loads(headers),
+            'etag': etag,
+            'last_modified': last_modified,
+            'fetched_at': fetched_at
+        }
+
+    def is_fresh(self, entry, url_class: str = 'default'):
+        """Kaydın URL sınıfının TTL süresi içinde olup olmadığını kontrol eder"""
+        ttl = self.ttls.get(url_class, self.ttls['default'])
+        return (time.time() - entry['fetched_at']) < ttl
+
+    def conditional_headers(self, entry):
+        """Yeniden doğrulama için koşullu istek başlıklarını üretir"""
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, url, response):
+        """Başarılı bir yanıtı önbelleğe yazar ve gerekirse LRU temizliği yapar"""
+        body = response.content
+        headers = {name: response.headers[name] for name in self.STORED_HEADERS if name in response.headers}
+        now = time.time()
+
+        with self._lock:
+            previous = self._conn.execute('SELECT size FROM responses WHERE url = ?', (url,)).fetchone()
+            self._conn.execute(
+                'INSERT OR REPLACE INTO responses (url, body, headers, etag, last_modified, fetched_at, last_access, size) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (url, body, json.dumps(headers), headers.get('ETag'), headers.get('Last-Modified'), now, now, len(body))
+            )
+            self._total_size += len(body) - (previous[0] if previous else 0)
+            self._evict_locked()
+            self._conn.commit()
+
+    def mark_revalidated(self, url, response):
+        """304 yanıtından sonra kaydın tazelik zamanını (ve değiştiyse doğrulayıcıları) yeniler"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                'UPDATE responses SET fetched_at = ?, last_access = ?, '
+                'etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified) WHERE url = ?',
+                (now, now, response.headers.get('ETag'), response.headers.get('Last-Modified'), url)
+            )
+            self._conn.commit()
+
+    def _evict_locked(self):
+        """Boyut sınırı aşıldıysa en eski erişilen kayıtları siler (kilit alınmış olmalı)"""
+        if self._total_size <= self.max_size_bytes:
+            return
+        # Sık temizlik yapmamak için sınırın %90'ına kadar boşalt
+        target = int(self.max_size_bytes * 0.9)
+        rows = self._conn.execute('SELECT url, size FROM responses ORDER BY last_access ASC').fetchall()
+        evicted = []
+        for url, size in rows:
+            if self._total_size <= target:
+                break
+            evicted.append((url,))
+            self._total_size -= size
+        self._conn.executemany('DELETE FROM responses WHERE url = ?', evicted)
+
+    def build_response(self, entry):
+        """Önbellek kaydından `requests.Response` nesnesi oluşturur"""
+        response = requests.Response()
+        response.status_code = 200
+        response.url = entry['url']
+        response._content = entry['body']
+        response._content_consumed = True  # iter_content gövdeyi bellekten dilimlesin
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.from_cache = True
+        return response
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,228 @@
+"""Arka planda çalışan tarama işleri.
+
+Streamlit her widget etkileşiminde betiği baştan çalıştırır; tarama betiğin
+içinde çalışırsa yeniden çalıştırma taramayı yarıda keser ya da tekrarlar.
+`CrawlJobManager` taramaları arka plan thread'lerinde, iş kimliğiyle
+çalıştırır. Arayüz ilerlemeyi, o ana kadar bulunan haberleri ve iptali iş
+kimliği üzerinden yoklayarak (polling) okur:
+
+    manager = CrawlJobManager()
+    job_id = manager.submit(configs, start, end, cache=cache)
+    job = manager.get(job_id)
+    job.status, job.found, job.last_message, job.results_since(0)
+    manager.cancel(job_id)
+
+Aynı anda en fazla `max_concurrent_jobs` iş çalışır, fazlası sırada bekler.
+Tüm işler ortak bir host zamanlayıcısı kullanır; böylece aynı siteyi tarayan
+eşzamanlı kullanıcılar sitenin nezaket sınırını aşmaz.
+"""
+import itertools
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from .politeness import HostPolitenessScheduler
+
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+CANCELLED = 'cancelled'
+FAILED = 'failed'
+
+FINISHED_STATUSES = (DONE, CANCELLED, FAILED)
+
+# Ortak zamanlayıcı tarafından belirlendiği için iş başına verilemeyen MultiSiteCrawler argümanları
+SCHEDULER_KWARGS = frozenset({'scheduler', 'max_in_flight_per_host', 'min_request_interval'})
+
+
+class CrawlJob:
+    """Tek bir tarama işinin durumu ve o ana kadarki sonuçları (thread güvenli)"""
+
+    def __init__(self, job_id: str, configs: list, start_time, end_time, max_listing_pages: int = 3,
+                 owner: str = None, crawler_kwargs: dict = None):
+        self.job_id = job_id
+        self.configs = list(configs)
+        self.start_time = start_time
+        self.end_time = end_time
+        self.max_listing_pages = max_listing_pages
+        self.owner = owner
+        self.crawler_kwargs = dict(crawler_kwargs or {})
+
+        self.status = QUEUED
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.messages = deque(maxlen=50)  # Son durum mesajları
+        self.crawler = None
+
+        self._results = []
+        self._lock = threading.Lock()
+        self._cancel_event = threading.Event()
+
+    @property
+    def sites(self):
+        return [config.base_url for config in self.configs]
+
+    @property
+    def found(self):
+        """Şu ana kadar bulunan haber sayısı"""
+        with self._lock:
+            return len(self._results)
+
+    @property
+    def last_message(self):
+        with self._lock:
+            return self.messages[-1] if self.messages else ''
+
+    @property
+    def is_finished(self):
+        return self.status in FINISHED_STATUSES
+
+    @property
+    def cancel_requested(self):
+        return self._cancel_event.is_set()
+
+    @property
+    def elapsed(self):
+        if self.started_at is None:
+            return 0.0
+        end = self.finished_at if self.finished_at is not None else time.time()
+        return end - self.started_at
+
+    def add_result(self, news_item: dict):
+        with self._lock:
+            self._results.append(news_item)
+
+    def add_message(self, message: str):
+        with self._lock:
+            self.messages.append(message)
+
+    def results_since(self, offset: int = 0):
+        """`offset` sırasından sonraki haberleri döndürür (arayüz yalnızca yenileri alır)"""
+        with self._lock:
+            return self._results[offset:]
+
+    def get_stats(self):
+        """Site bazında verim istatistikleri; iş başlamadıysa boş liste"""
+        return self.crawler.get_stats() if self.crawler is not None else []
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def snapshot(self):
+        """Arayüzde gösterilecek özet bilgiler"""
+        return {
+            'İş': self.job_id,
+            'Durum': self.status,
+            'Siteler': ', '.join(self.sites),
+            'Haber': self.found,
+            'Süre (sn)': round(self.elapsed, 1),
+            'Mesaj': self.error or self.last_message
+        }
+
+
+class CrawlJobManager:
+    """Tarama işlerini arka plan thread'lerinde kuyruklayıp çalıştırır.
+
+    İşler `max_concurrent_jobs` boyutlu bir havuzda çalışır. Biten işler
+    sonuçları okunabilsin diye saklanır; en fazla `max_finished_jobs` tanesi
+    tutulur, daha eskileri atılır.
+    """
+
+    def __init__(self, max_concurrent_jobs: int = 2, max_finished_jobs: int = 20,
+                 max_in_flight_per_host: int = 4, min_request_interval: float = 0.5):
+        self.max_finished_jobs = max(1, int(max_finished_jobs))
+        self.scheduler = HostPolitenessScheduler(
+            max_in_flight_per_host=max_in_flight_per_host,
+            min_interval=min_request_interval
+        )
+        self._executor = ThreadPoolExecutor(max_workers=max(1, int(max_concurrent_jobs)),
+                                            thread_name_prefix='crawl-job')
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._sequence = itertools.count(1)
+
+    def submit(self, configs: list, start_time, end_time, max_listing_pages: int = 3,
+               owner: str = None, **crawler_kwargs):
+        """Yeni bir tarama işi kuyruğa ekler ve iş kimliğini döndürür.
+
+        `crawler_kwargs` MultiSiteCrawler'a aynen geçirilir (cache,
+        crawl_state, max_workers, parser...). Tüm işler yöneticinin ortak
+        host zamanlayıcısını kullandığından nezaket ayarları
+        (`max_in_flight_per_host`, `min_request_interval`) iş başına
+        verilemez; yönetici oluşturulurken ayarlanır.
+        """
+        scheduler_kwargs = sorted(SCHEDULER_KWARGS & crawler_kwargs.keys())
+        if scheduler_kwargs:
+            raise ValueError(f"{', '.join(scheduler_kwargs)} iş başına verilemez; tüm işler ortak host "
+                             f"zamanlayıcısını kullanır (CrawlJobManager oluşturulurken ayarlayın)")
+        job_id = f"{next(self._sequence):04d}-{uuid.uuid4().hex[:8]}"
+        job = CrawlJob(job_id, configs, start_time, end_time, max_listing_pages, owner, crawler_kwargs)
+        with self._lock:
+            self._jobs[job_id] = job
+            self._prune_finished()
+        self._executor.submit(self._run, job)
+        return job_id
+
+    def get(self, job_id: str):
+        """İşi döndürür; bilinmiyorsa (veya temizlendiyse) None"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self, owner: str = None):
+        """İşleri oluşturulma sırasıyla döndürür; `owner` verilirse yalnızca onun işleri"""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return [job for job in jobs if owner is None or job.owner == owner]
+
+    def cancel(self, job_id: str):
+        """İşi iptal eder; sıradaki iş hiç başlamaz, çalışan iş ilk fırsatta durur"""
+        job = self.get(job_id)
+        if job is None or job.is_finished:
+            return False
+        job.cancel()
+        return True
+
+    def shutdown(self, cancel: bool = True):
+        if cancel:
+            for job in self.jobs():
+                job.cancel()
+        self._executor.shutdown(wait=True)
+
+    def _prune_finished(self):
+        finished = [job for job in self._jobs.values() if job.is_finished]
+        for job in finished[:max(0, len(finished) - self.max_finished_jobs)]:
+            del self._jobs[job.job_id]
+
+    def _run(self, job: CrawlJob):
+        if job.cancel_requested:
+            job.status = CANCELLED
+            job.finished_at = time.time()
+            return
+
+        # Tarama modülleri yalnızca ilk iş çalıştığında yüklenir
+        from .orchestrator import MultiSiteCrawler
+
+        job.status = RUNNING
+        job.started_at = time.time()
+        try:
+            job.crawler = MultiSiteCrawler(job.configs, scheduler=self.scheduler, **job.crawler_kwargs)
+            for news_item in job.crawler.crawl(job.start_time, job.end_time, job.max_listing_pages,
+                                               status_callback=job.add_message,
+                                               cancel_event=job._cancel_event):
+                job.add_result(news_item)
+            job.status = CANCELLED if job.cancel_requested else DONE
+        except Exception as e:
+            job.error = str(e)
+            job.status = FAILED
+        finally:
+            job.finished_at = time.time()
+            for config in job.configs:
+                try:
+                    config.save()  # Seçici istatistikleri sonraki taramalarda kullanılır
+                except OSError as e:
+                    job.add_message(f"Site konfigürasyonu kaydedilemedi: {e}")
@@ -0,0 +1,229 @@
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from .crawl_state import CrawlStateStore, normalize_url
+from .http_cache import HttpResponseCache
+from .politeness import HostPolitenessScheduler
+from .scraper import NewsSiteConfig, UniversalNewsScraper
+
+
+class SiteCrawlStats:
+    """Tek bir sitenin tarama istatistikleri"""
+
+    def __init__(self, site: str):
+        self.site = site
+        self.articles = 0
+        self.duplicates = 0
+        self.requests = 0
+        self.started_at = None
+        self.finished_at = None
+        self.error = None
+
+    @property
+    def elapsed(self):
+        if self.started_at is None:
+            return 0.0
+        end = self.finished_at if self.finished_at is not None else time.monotonic()
+        return end - self.started_at
+
+    @property
+    def articles_per_second(self):
+        return self.articles / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def requests_per_second(self):
+        return self.requests / self.elapsed if self.elapsed > 0 else 0.0
+
+    def as_dict(self):
+        return {
+            'Site': self.site,
+            'Haber': self.articles,
+            'Tekrar': self.duplicates,
+            'İstek': self.requests,
+            'Süre (sn)': round(self.elapsed, 2),
+            'Haber/sn': round(self.articles_per_second, 3),
+            'İstek/sn': round(self.requests_per_second, 3),
+            'Hata': self.error or ''
+        }
+
+
+class MultiSiteCrawler:
+    """Birden fazla NewsSiteConfig'i paralel tarayan orkestratör.
+
+    Her host kendi sürücü thread'inde listeleme sayfalarını tarar; haber
+    sayfaları host başına ayrı bir havuzda çekilir. Nezaket beklemesi işçi
+    thread'inde yapıldığı için ortak bir havuzda bir hostun bekleyen işleri
+    diğer hostların işçilerini de tüketirdi; ayrı havuzlarla her host
+    yalnızca kendi payını bekletir. `max_workers` tüm hostlar için ortak
+    bütçedir: host başına işçi sayısı bütçenin eşit payıdır (en az bir, en
+    fazla `max_in_flight_per_host`) ve aynı anda yalnızca havuzları bütçeye
+    sığan kadar host taranır; diğerleri sırada bekler ve bir host bitince
+    başlar. Böylece toplam işçi sayısı hiçbir zaman `max_workers`'ı aşmaz.
+    Aynı hosttaki siteler aynı sürücüde sırayla taranır. Sonuçlar
+    geldikçe, URL bazında tekilleştirilerek döndürülür.
+    """
+
+    def __init__(self, configs: list, max_workers: int = 16,
+                 max_in_flight_per_host: int = 4, min_request_interval: float = 0.5,
+                 cache: HttpResponseCache = None, crawl_state: CrawlStateStore = None,
+                 parser: str = 'auto', scheduler: HostPolitenessScheduler = None):
+        self.configs = list(configs)
+        self.cache = cache
+        self.crawl_state = crawl_state
+        self.parser = parser
+        self.max_workers = max(1, int(max_workers))
+        # Eşzamanlı taramalar (ör. arka plan işleri) aynı host'u ortak bir zamanlayıcıyla paylaşabilir
+        self.scheduler = scheduler or HostPolitenessScheduler(
+            max_in_flight_per_host=max_in_flight_per_host,
+            min_interval=min_request_interval
+        )
+        self.site_stats = {}
+
+    def _site_name(self, config: NewsSiteConfig):
+        return urlparse(config.base_url).netloc or config.base_url
+
+    def _host_workers(self, host_count: int):
+        """Host başına işçi sayısı: bütçenin eşit payı, host slot sayısıyla sınırlı"""
+        share = self.max_workers // max(1, host_count)
+        return max(1, min(self.scheduler.max_in_flight_per_host, share))
+
+    def _run_host(self, site, configs, start_time, end_time, max_listing_pages,
+                  host_workers, host_slots, events, stop_event):
+        """Bir hostun sitelerini sırayla tarar ve olayları ortak kuyruğa yazar (sürücü thread'i).
+
+        Havuz, `host_slots` bütçesinden yer açılınca kurulur; bekleme iptalle kesilir.
+        """
+        requests = 0
+        try:
+            while not host_slots.acquire(timeout=0.25):
+                if stop_event.is_set():
+                    return
+            try:
+                events.put(('start', site, None))
+                with ThreadPoolExecutor(max_workers=host_workers, thread_name_prefix=f"fetch-{site}") as executor:
+                    for config in configs:
+                        if stop_event.is_set():
+                            break
+                        scraper = UniversalNewsScraper(config, max_workers=host_workers,
+                                                       scheduler=self.scheduler, cache=self.cache,
+                                                       crawl_state=self.crawl_state, parser=self.parser)
+                        try:
+                            self._run_site(scraper, site, start_time, end_time, max_listing_pages,
+                                           executor, events, stop_event)
+                        finally:
+                            requests += scraper.request_count
+            finally:
+                host_slots.release()
+        finally:
+            events.put(('done', site, requests))
+
+    def _run_site(self, scraper, site, start_time, end_time, max_listing_pages,
+                  executor, events, stop_event):
+        """Tek bir siteyi tarar ve olayları ortak kuyruğa yazar"""
+        def report(message):
+            events.put(('status', site, message))
+
+        news_iter = scraper._iter_news_by_time_range(
+            start_time, end_time, max_listing_pages,
+            status_callback=report, executor=executor, cancel_event=stop_event
+        )
+        try:
+            for news_item in news_iter:
+                if stop_event.is_set():
+                    break
+                events.put(('item', site, news_item))
+        except Exception as e:
+            events.put(('error', site, e))
+        finally:
+            news_iter.close()
+
+    def crawl(self, start_time, end_time, max_listing_pages: int = 3, status_callback=None,
+              cancel_event=None):
+        """Tüm siteleri paralel tarar; tekilleştirilmiş haberleri geldikçe döndürür.
+
+        `status_callback` yalnızca bu generator'ı tüketen thread'den çağrılır.
+        `cancel_event` set edildiğinde (başka bir thread'den) siteler yeni
+        istek açmadan durdurulur ve generator sona erer.
+        """
+        events = queue.Queue()
+        stop_event = threading.Event()
+        seen_urls = set()
+        self.site_stats = {}
+
+        # Aynı hosttaki siteler tek sürücü ve havuzu paylaşır; aynı anda çalışan havuzlar bütçeye sığar
+        configs_by_site = {}
+        for config in self.configs:
+            configs_by_site.setdefault(self._site_name(config), []).append(config)
+        host_workers = self._host_workers(len(configs_by_site))
+        host_slots = threading.BoundedSemaphore(max(1, self.max_workers // host_workers))
+        drivers = []
+        try:
+            for site, configs in configs_by_site.items():
+                self.site_stats[site] = SiteCrawlStats(site)
+                driver = threading.Thread(
+                    target=self._run_host,
+                    args=(site, configs, start_time, end_time, max_listing_pages,
+                          host_workers, host_slots, events, stop_event),
+                    name=f"crawl-{site}",
+                    daemon=True
+                )
+                drivers.append(driver)
+                driver.start()
+
+            remaining = len(drivers)
+            while remaining:
+                if cancel_event is not None and cancel_event.is_set():
+                    break
+                try:
+                    kind, site, payload = events.get(timeout=0.25)
+                except queue.Empty:
+                    continue
+                stats = self.site_stats[site]
+
+                if kind == 'start':
+                    stats.started_at = time.monotonic()  # Sırada beklenen süre verime katılmaz
+                elif kind == 'status':
+                    if status_callback:
+                        status_callback(f"[{site}] {payload}")
+                elif kind == 'item':
+                    key = normalize_url(payload['Haber Linki'])
+                    if key in seen_urls:
+                        stats.duplicates += 1
+                        continue
+                    seen_urls.add(key)
+                    stats.articles += 1
+                    yield payload
+                elif kind == 'error':
+                    stats.error = str(payload)
+                    if status_callback:
+                        status_callback(f"[{site}] Tarama hatası: {payload}")
+                elif kind == 'done':
+                    stats.requests = payload
+                    stats.finished_at = time.monotonic()
+                    remaining -= 1
+                    if status_callback:
+                        status_callback(
+                            f"[{site}] Tamamlandı: {stats.articles} haber, "
+                            f"{stats.elapsed:.1f} sn ({stats.articles_per_second:.2f} haber/sn)"
+                        )
+        finally:
+            stop_event.set()
+            for driver in drivers:
+                driver.join()
+            # Erken çıkışta (iptal) tüketilmeyen 'done' olaylarıyla site istatistiklerini kapat
+            while not events.empty():
+                kind, site, payload = events.get_nowait()
+                if kind == 'done':
+                    self.site_stats[site].requests = payload
+                    self.site_stats[site].finished_at = time.monotonic()
+
+    def crawl_all(self, start_time, end_time, max_listing_pages: int = 3, status_callback=None):
+        """`crawl` sonuçlarını liste olarak döndürür"""
+        return list(self.crawl(start_time, end_time, max_listing_pages, status_callback))
+
+    def get_stats(self):
+        """Site bazında verim istatistiklerini sözlük listesi olarak döndürür"""
+        return [stats.as_dict() for stats in self.site_stats.values()]
@@ -0,0 +1,247 @@
+"""HTML ayrıştırıcı (parser) arka uçları.
+
+Scraper'daki çıkarım metotları BeautifulSoup API'sinin küçük bir alt kümesini
+kullanır: `select`, `select_one`, `get`, `get_text`, `name` ve `parent`.
+Her arka uç bu alt kümeyi sağlayan düğümler döndürür; böylece başlık, tarih,
+içerik ve link çıkarımı hangi arka uç seçilirse seçilsin aynı kodla çalışır.
+Derlenmiş seçici planları (bkz. app/selector_plan.py) ağacı Python'da dolaşan
+BeautifulSoup arka uçlarında indeksle çalışır; bu arka uçlar `iter_element_keys`
+(tek geçişte eleman anahtarları) ve `matcher` (tek düğüm üzerinde seçici
+doğrulama) sağlar. Yerel (C) seçici motoru olan arka uçlarda `indexed_plans`
+False'tur ve plan her seçiciyi en fazla bir kez yerel motora sorar.
+
+Arka uçlar:
+    'html.parser' : BeautifulSoup + Python'un dahili parser'ı (en yavaş, bağımlılıksız)
+    'bs4-lxml'    : BeautifulSoup + lxml
+    'lxml'        : lxml.html + cssselect (hızlı)
+    'selectolax'  : selectolax lexbor (en hızlı)
+    'auto'        : kurulu olanlar arasından sırasıyla lxml, selectolax, html.parser
+"""
+import re
+from functools import lru_cache
+
+
+# Silinecek etiket adları geçerli HTML etiket adı olmalı
+_TAG_NAME_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9-]*$')
+_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([a-zA-Z0-9_-]+)', re.IGNORECASE)
+_XML_DECLARATION_RE = re.compile(r'^\s*<\?xml[^>]*\?>')
+
+
+def _valid_tag_names(tags):
+    return [tag for tag in tags if _TAG_NAME_RE.match(tag)]
+
+
+def _decode_html(content):
+    """Bayt içeriği <meta charset> (yoksa UTF-8) ile metne çevirir"""
+    if isinstance(content, str):
+        return content
+    match = _CHARSET_RE.search(content[:4096])
+    encoding = match.group(1).decode('ascii') if match else 'utf-8'
+    try:
+        return content.decode(encoding, errors='replace')
+    except LookupError:
+        return content.decode('utf-8', errors='replace')
+
+
+class BeautifulSoupBackend:
+    """BeautifulSoup arka ucu; düğümler doğrudan bs4 Tag nesneleridir"""
+
+    indexed_plans = True
+
+    def __init__(self, features: str = 'html.parser'):
+        if features == 'lxml':
+            import lxml  # noqa: F401 - kurulu değilse erken hata ver
+        self.features = features
+        self.name = 'html.parser' if features == 'html.parser' else f'bs4-{features}'
+
+    def parse(self, content):
+        from bs4 import BeautifulSoup  # Hızlı başlangıç için yalnızca gerektiğinde yüklenir
+        return BeautifulSoup(content, self.features)
+
+    def remove_tags(self, document, tags):
+        for unwanted in document(tags):
+            unwanted.decompose()
+
+    def iter_element_keys(self, document):
+        for tag in document.find_all(True):
+            yield tag, tag.name, tag.get('id'), tag.get('class') or (), tag.attrs.keys()
+
+    def matcher(self, document, selector):
+        return _compile_soupsieve(selector).match
+
+
+@lru_cache(maxsize=1024)
+def _compile_soupsieve(selector):
+    import soupsieve
+    return soupsieve.compile(selector)
+
+
+class _LxmlNode:
+    __slots__ = ('_element',)
+
+    def __init__(self, element):
+        self._element = element
+
+    @property
+    def name(self):
+        return self._element.tag if isinstance(self._element.tag, str) else None
+
+    @property
+    def parent(self):
+        parent = self._element.getparent()
+        return _LxmlNode(parent) if parent is not None else None
+
+    def get(self, attribute, default=None):
+        return self._element.get(attribute, default)
+
+    def get_text(self):
+        return self._element.text_content()
+
+    def select(self, selector):
+        element = self._element
+        # cssselect elemanın kendisini de eşleştirir; bs4 ile aynı olması için hariç tut
+        return [_LxmlNode(match) for match in _compile_css(selector)(element) if match is not element]
+
+    def select_one(self, selector):
+        element = self._element
+        for match in _compile_css(selector)(element):
+            if match is not element:
+                return _LxmlNode(match)
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _compile_css(selector):
+    from lxml.cssselect import CSSSelector
+    return CSSSelector(selector)
+
+
+class LxmlBackend:
+    """lxml.html + cssselect arka ucu"""
+
+    name = 'lxml'
+    indexed_plans = False
+
+    def __init__(self):
+        import lxml.html  # noqa: F401 - kurulu değilse erken hata ver
+        import cssselect  # noqa: F401
+
+    def parse(self, content):
+        import lxml.html
+        text = _XML_DECLARATION_RE.sub('', _decode_html(content), count=1)
+        if not text.strip():
+            text = '<html></html>'
+        return _LxmlNode(lxml.html.document_fromstring(text))
+
+    def remove_tags(self, document, tags):
+        names = _valid_tag_names(tags)
+        if not names:
+            return
+        for element in list(document._element.iter(*names)):
+            element.drop_tree()
+
+
+class _SelectolaxNode:
+    __slots__ = ('_node',)
+
+    def __init__(self, node):
+        self._node = node
+
+    @property
+    def name(self):
+        return self._node.tag
+
+    @property
+    def parent(self):
+        parent = self._node.parent
+        return _SelectolaxNode(parent) if parent is not None else None
+
+    def get(self, attribute, default=None):
+        value = self._node.attributes.get(attribute, default)
+        # Değersiz nitelikler (ör. <input disabled>) bs4'te boş metin olarak gelir
+        return '' if value is None and attribute in self._node.attributes else value
+
+    def get_text(self):
+        return self._node.text(deep=True, separator='', strip=False)
+
+    def select(self, selector):
+        return [_SelectolaxNode(match) for match in self._node.css(selector)]
+
+    def select_one(self, selector):
+        match = self._node.css_first(selector)
+        return _SelectolaxNode(match) if match is not None else None
+
+
+class SelectolaxBackend:
+    """selectolax (lexbor) arka ucu"""
+
+    name = 'selectolax'
+    indexed_plans = False
+
+    def __init__(self):
+        from selectolax.lexbor import LexborHTMLParser  # noqa: F401 - kurulu değilse erken hata ver
+
+    def parse(self, content):
+        from selectolax.lexbor import LexborHTMLParser
+        tree = LexborHTMLParser(_decode_html(content))
+        return _SelectolaxDocument(tree)
+
+    def remove_tags(self, document, tags):
+        names = _valid_tag_names(tags)
+        if names:
+            document._tree.strip_tags(names)
+
+
+class _SelectolaxDocument(_SelectolaxNode):
+    __slots__ = ('_tree',)
+
+    def __init__(self, tree):
+        super().__init__(tree.root)
+        self._tree = tree
+
+    @property
+    def name(self):
+        return '[document]'
+
+    def select(self, selector):
+        return [_SelectolaxNode(match) for match in self._tree.css(selector)]
+
+    def select_one(self, selector):
+        match = self._tree.css_first(selector)
+        return _SelectolaxNode(match) if match is not None else None
+
+
+_BACKENDS = {
+    'html.parser': lambda: BeautifulSoupBackend('html.parser'),
+    'bs4-lxml': lambda: BeautifulSoupBackend('lxml'),
+    'lxml': LxmlBackend,
+    'selectolax': SelectolaxBackend
+}
+
+# 'auto' seçildiğinde denenecek sıra (tercih sırası)
+_AUTO_ORDER = ['lxml', 'selectolax', 'html.parser']
+
+
+def available_backends():
+    """Bu ortamda kullanılabilen arka uç adlarını döndürür"""
+    names = []
+    for name, factory in _BACKENDS.items():
+        try:
+            factory()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def get_parser_backend(name: str = 'auto'):
+    """Adı verilen parser arka ucunu oluşturur; 'auto' kurulu hızlı bir arka uç seçer"""
+    if name == 'auto':
+        for candidate in _AUTO_ORDER:
+            try:
+                return _BACKENDS[candidate]()
+            except ImportError:
+                continue
+    if name not in _BACKENDS:
+        raise ValueError(f"Bilinmeyen parser arka ucu: {name}. Seçenekler: {', '.join(_BACKENDS)}")
+    return _BACKENDS[name]()
@@ -0,0 +1,73 @@
+import random
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+
+class RequestCancelled(Exception):
+    """İstek, slot beklenirken iptal edildi (ağa çıkılmadı)"""
+
+
+class _HostState:
+    def __init__(self, max_in_flight: int):
+        self.semaphore = threading.BoundedSemaphore(max_in_flight)
+        self.lock = threading.Lock()
+        self.next_allowed = 0.0
+
+
+class HostPolitenessScheduler:
+    """Host başına nezaket kurallarını uygular.
+
+    Her host için aynı anda en fazla `max_in_flight_per_host` istek yapılmasına
+    izin verir ve aynı hosta giden iki isteğin başlangıcı arasında en az
+    `min_interval` (+ rastgele `jitter`) saniye bırakır. Farklı hostlara giden
+    istekler birbirini beklemez; böylece toplam hız host sayısıyla ölçeklenir.
+    """
+
+    def __init__(self, max_in_flight_per_host: int = 4, min_interval: float = 0.5, jitter: float = 0.5):
+        self.max_in_flight_per_host = max(1, int(max_in_flight_per_host))
+        self.min_interval = max(0.0, float(min_interval))
+        self.jitter = max(0.0, float(jitter))
+        self._lock = threading.Lock()
+        self._hosts = {}
+
+    def _get_host_state(self, host):
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                state = _HostState(self.max_in_flight_per_host)
+                self._hosts[host] = state
+            return state
+
+    @contextmanager
+    def slot(self, url, cancel_event=None):
+        """İstek yapılabilecek ana kadar bekler; blok boyunca hostun bir slotunu tutar.
+
+        `cancel_event` (threading.Event) bekleme sırasında set edilirse
+        beklemeden hemen çıkılır ve `RequestCancelled` yükseltilir.
+        """
+        state = self._get_host_state(urlparse(url).netloc.lower())
+        if cancel_event is None:
+            state.semaphore.acquire()
+        else:
+            while not state.semaphore.acquire(timeout=0.1):
+                if cancel_event.is_set():
+                    raise RequestCancelled(url)
+        try:
+            # Sıradaki istek zamanını kilit altında rezerve et, beklemeyi kilit dışında yap
+            with state.lock:
+                now = time.monotonic()
+                start_at = max(now, state.next_allowed)
+                state.next_allowed = start_at + self.min_interval + random.uniform(0, self.jitter)
+            wait = start_at - now
+            if wait > 0:
+                if cancel_event is None:
+                    time.sleep(wait)
+                else:
+                    cancel_event.wait(wait)  # İptalde beklemeden uyanır
+            if cancel_event is not None and cancel_event.is_set():
+                raise RequestCancelled(url)
+            yield
+        finally:
+            state.semaphore.release()
@@ -1,15 +1,65 @@
 import requests
-from bs4 import BeautifulSoup
-import csv
+import json
+import os
 from datetime import datetime, timedelta
-import time
 import re
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from email.utils import parsedate_to_datetime
 from urllib.parse import urljoin, urlparse
-import pandas as pd
 import random
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from .crawl_state import CrawlStateStore, normalize_url
+from .date_parser import DateParser, parse_turkish_date
+from .discovery import DEFAULT_FEED_PATHS, DEFAULT_SITEMAP_PATHS, SitemapFeedDiscovery
+from .http_cache import HttpResponseCache
+from .parsers import get_parser_backend
+from .politeness import HostPolitenessScheduler, RequestCancelled
+from .selector_plan import SelectorPlan
+from .selector_stats import SELECTOR_GROUPS, SelectorStats, merge_counts
+from .sinks import CsvSink
+
+
+# Yayın tarihini taşıyan meta etiketleri (en güvenilir kaynak)
+META_DATE_SELECTORS = [
+    'meta[property="article:published_time"]',
+    'meta[name="datePublished"]',
+    'meta[name="publishdate"]',
+    'meta[name="date"]',
+    'meta[property="og:updated_time"]'
+]
+
+# Yazar bilgisini taşıyan meta etiketleri
+AUTHOR_SELECTORS = [
+    'meta[name="author"]',
+    'meta[name="articleAuthor"]',
+    'meta[property="article:author"]'
+]
+
+JSON_LD_SELECTOR = 'script[type="application/ld+json"]'
+
+# İçerik çıkarımından önce ağaçtan silinen etiketler
+UNWANTED_CONTENT_TAGS = ['script', 'style', 'nav', 'header', 'footer', 'aside', '.ad', '.advertisement', '.social-share']
+
+# Öğrenilmiş site konfigürasyonlarının varsayılan klasörü
+SITE_CONFIG_DIR = '.yeb_cache/site_configs'
+
+# URL içine gömülü tarih kalıpları: /2025/06/17/, 2025-06-17, /20250617/
+URL_DATE_PATTERNS = [
+    re.compile(r'/(20\d{2})/(\d{1,2})/(\d{1,2})(?:/|$)'),
+    re.compile(r'(?<!\d)(20\d{2})-(\d{2})-(\d{2})(?!\d)'),
+    re.compile(r'/(20\d{2})(\d{2})(\d{2})(?:[/_-]|$)')
+]
+
+# <head> bulunamazsa kısmi okumanın duracağı üst sınır
+HEAD_PROBE_MAX_BYTES = 256 * 1024
+
+# Listeleme sayfası başına kontrol edilen en fazla haber linki; sitemap/RSS
+# keşfinde toplam link sınırı `max_listing_pages` ile bu değerin çarpımıdır
+LINKS_PER_LISTING_PAGE = 30
+
 
 class NewsSiteConfig:
     def __init__(self,
@@ -19,7 +69,12 @@ class NewsSiteConfig:
                  content_selectors: list,
                  date_selectors: list,
                  listing_page_paths: list = None,
-                 turkish_date_parsing_enabled: bool = True):
+                 turkish_date_parsing_enabled: bool = True,
+                 early_date_filter: bool = True,
+                 discovery_mode: str = 'listing',
+                 sitemap_paths: list = None,
+                 feed_paths: list = None,
+                 selector_stats: dict = None):
         self.base_url = base_url
         self.article_link_selectors = article_link_selectors
         self.title_selectors = title_selectors
@@ -27,12 +82,148 @@ class NewsSiteConfig:
         self.date_selectors = date_selectors
         self.listing_page_paths = listing_page_paths if listing_page_paths is not None else ["/"]
         self.turkish_date_parsing_enabled = turkish_date_parsing_enabled
+        # Tam indirme öncesi ucuz tarih kontrolü (listeleme <time>, URL tarihi, <head> meta)
+        self.early_date_filter = early_date_filter
+        # Link keşfi: 'listing' (HTML listeleme sayfaları) veya 'sitemap' (sitemap/RSS, bulunamazsa listeleme)
+        self.discovery_mode = discovery_mode
+        self.sitemap_paths = sitemap_paths if sitemap_paths is not None else list(DEFAULT_SITEMAP_PATHS)
+        self.feed_paths = feed_paths if feed_paths is not None else list(DEFAULT_FEED_PATHS)
+        # Seçici isabet istatistikleri; seçiciler buna göre sıralanır (bkz. apply_selector_ranking)
+        self.selector_stats = SelectorStats(selector_stats)
+
+    def apply_selector_ranking(self, min_trials: int = 20, prune: bool = True):
+        """Seçici gruplarını isabet oranına göre yeniden sıralar; elenen seçicileri döndürür"""
+        pruned = {}
+        for group in SELECTOR_GROUPS:
+            ranked, dropped = self.selector_stats.rank(group, getattr(self, group), min_trials, prune)
+            setattr(self, group, ranked)
+            if dropped:
+                pruned[group] = dropped
+        return pruned
+
+    def adopt_selector_stats(self, other: 'NewsSiteConfig'):
+        """Kayıtlı bir konfigürasyonun istatistiklerini alır ve sıralamayı uygular.
+
+        Koddaki seçici listeleri esas kalır; yeni eklenen seçiciler denenmemiş
+        olarak başlar.
+        """
+        self.selector_stats = SelectorStats(other.selector_stats.to_dict())
+        return self.apply_selector_ranking()
+
+    def to_dict(self):
+        return {
+            'base_url': self.base_url,
+            'article_link_selectors': list(self.article_link_selectors),
+            'title_selectors': list(self.title_selectors),
+            'content_selectors': list(self.content_selectors),
+            'date_selectors': list(self.date_selectors),
+            'listing_page_paths': list(self.listing_page_paths),
+            'turkish_date_parsing_enabled': self.turkish_date_parsing_enabled,
+            'early_date_filter': self.early_date_filter,
+            'discovery_mode': self.discovery_mode,
+            'sitemap_paths': list(self.sitemap_paths),
+            'feed_paths': list(self.feed_paths),
+            'selector_stats': self.selector_stats.to_dict()
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(**data)
+
+    def save(self, path: str = None):
+        """Konfigürasyonu (öğrenilmiş sıralama ve istatistiklerle) JSON olarak yazar.
+
+        Aynı siteyi tarayan eşzamanlı işler birbirinin sayımlarını ezmesin
+        diye dosyadaki istatistikler yeniden okunur ve bu konfigürasyonun son
+        kayıttan bu yana biriktirdiği sayımlar üzerine eklenir. Kayıtlar
+        dosya başına kilitle sıralanır; dosya geçici dosyaya yazılıp atomik
+        olarak yer değiştirir, böylece yarım yazılmış JSON okunmaz.
+        """
+        path = path or site_config_path(self.base_url)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with _config_file_lock(path):
+            saved, pending = self.selector_stats.split_pending()
+            stored = _read_stored_selector_stats(path)
+            data = self.to_dict()
+            data['selector_stats'] = merge_counts(saved if stored is None else stored, pending)
+
+            temporary = path + '.tmp'
+            with open(temporary, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(temporary, path)
+            self.selector_stats.mark_saved(pending)
+        return path
+
+    @classmethod
+    def load(cls, path: str):
+        with open(path, encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+
+# Aynı konfigürasyon dosyasına yapılan kayıtları sıralayan kilitler (dosya yolu -> kilit)
+_config_file_locks = {}
+_config_file_locks_guard = threading.Lock()
+
+
+def _config_file_lock(path: str):
+    with _config_file_locks_guard:
+        return _config_file_locks.setdefault(os.path.abspath(path), threading.Lock())
+
+
+def _read_stored_selector_stats(path: str):
+    """Kayıtlı konfigürasyondaki seçici istatistikleri; dosya yoksa veya bozuksa None"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            stored = json.load(f).get('selector_stats')
+    except (OSError, ValueError, AttributeError):
+        return None
+    return stored if isinstance(stored, dict) else None
+
+
+def site_config_path(base_url: str, directory: str = SITE_CONFIG_DIR):
+    """Site konfigürasyonunun kaydedileceği dosya yolu (domain başına bir dosya)"""
+    domain = urlparse(base_url).netloc or base_url
+    return os.path.join(directory, re.sub(r'[^\w.-]', '_', domain) + '.json')
+
+
+def load_learned_selectors(config: NewsSiteConfig, directory: str = SITE_CONFIG_DIR):
+    """Site için kayıtlı istatistik varsa konfigürasyona uygular (yoksa dokunmaz)"""
+    path = site_config_path(config.base_url, directory)
+    if os.path.exists(path):
+        try:
+            config.adopt_selector_stats(NewsSiteConfig.load(path))
+        except (OSError, ValueError, TypeError):
+            pass  # Bozuk kayıt: varsayılan sıralamayla devam et
+    return config
 
 
 class UniversalNewsScraper:
-    def __init__(self, config: NewsSiteConfig = None):
+    def __init__(self, config: NewsSiteConfig = None, max_workers: int = 8,
+                 max_in_flight_per_host: int = 4, min_request_interval: float = 0.5,
+                 scheduler: HostPolitenessScheduler = None, cache: HttpResponseCache = None,
+                 crawl_state: CrawlStateStore = None, parser: str = 'auto'):
         self.config = config
         self.base_url = config.base_url if config else None
+        self.max_workers = max(1, int(max_workers))
+
+        # Host başına eşzamanlılık ve istekler arası minimum bekleme
+        self.scheduler = scheduler or HostPolitenessScheduler(
+            max_in_flight_per_host=max_in_flight_per_host,
+            min_interval=min_request_interval
+        )
+        # Opsiyonel kalıcı yanıt önbelleği (bkz. HttpResponseCache)
+        self.cache = cache
+        # Opsiyonel çalıştırmalar arası tarama durumu (bkz. CrawlStateStore)
+        self.crawl_state = crawl_state
+        # Haber ve listeleme sayfalarının parser arka ucu (bkz. app/parsers.py)
+        self.parser = get_parser_backend(parser)
+        self._selector_plans = {}
+        self._date_parser = None
+        self.request_count = 0
+        self._request_count_lock = threading.Lock()
         
         self.user_agents = [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -51,13 +242,58 @@ class UniversalNewsScraper:
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=frozenset({'GET', 'POST'})
         )
-        adapter = HTTPAdapter(max_retries=retries)
+        adapter = HTTPAdapter(max_retries=retries, pool_maxsize=max(10, self.max_workers))
         self.session.mount('http://', adapter)
         self.session.mount('https://', adapter)
 
     def _get_random_user_agent(self):
         return random.choice(self.user_agents)
 
+    def _get(self, url, url_class: str = 'default', cancel_event=None, **kwargs):
+        """Nezaket zamanlayıcısından slot alarak GET isteği yapar.
+
+        User-Agent istek başına gönderilir; oturum başlıkları thread'ler
+        arasında paylaşıldığı için değiştirilmez. Önbellek tanımlıysa taze
+        kayıtlar ağa çıkmadan döndürülür, bayat kayıtlar koşullu istekle
+        yeniden doğrulanır. `url_class` ('listing', 'article') TTL seçimi içindir.
+        `cancel_event` slot alınmadan önce veya slot beklenirken set edilirse
+        istek yapılmaz ve `RequestCancelled` yükseltilir.
+        """
+        if cancel_event is not None and cancel_event.is_set():
+            raise RequestCancelled(url)
+        headers = {'User-Agent': self._get_random_user_agent()}
+        headers.update(kwargs.pop('headers', None) or {})
+        kwargs.setdefault('timeout', 15)
+
+        cached = None
+        if self.cache:
+            cached = self.cache.get(url)
+            if cached and self.cache.is_fresh(cached, url_class):
+                self.cache.hits += 1
+                return self.cache.build_response(cached)
+            if cached:
+                headers.update(self.cache.conditional_headers(cached))
+
+        with self.scheduler.slot(url, cancel_event):
+            response = self.session.get(url, headers=headers, **kwargs)
+        with self._request_count_lock:
+            self.request_count += 1
+
+        if self.cache:
+            if response.status_code == 304 and cached:
+                self.cache.revalidations += 1
+                self.cache.mark_revalidated(url, response)
+                return self.cache.build_response(cached)
+            response.raise_for_status()
+            self.cache.misses += 1
+            # Akış (stream) yanıtlarını gövde tamamen okunduktan sonra çağıran kaydeder
+            if not kwargs.get('stream'):
+                self.cache.store(url, response)
+            return response
+
+        response.raise_for_status()
+        return response
+
     def auto_detect_site_structure(self, url: str, status_callback=None):
         """Otomatik olarak site yapısını analiz eder ve uygun seçicileri bulur"""
         try:
@@ -69,10 +305,9 @@ class UniversalNewsScraper:
             base_url = f"{parsed_url.scheme}://{domain}"
             
             # Site ana sayfasını çek
-            self.session.headers.update({'User-Agent': self._get_random_user_agent()})
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
+            response = self._get(url)
             
+            from bs4 import BeautifulSoup  # Hızlı başlangıç için yalnızca gerektiğinde yüklenir
             soup = BeautifulSoup(response.content, 'html.parser')
             
             # Otomatik link seçicilerini bul
@@ -96,7 +331,7 @@ class UniversalNewsScraper:
             if status_callback:
                 status_callback(f"Site analizi tamamlandı. {len(link_selectors)} link seçici bulundu.")
             
-            return NewsSiteConfig(
+            config = NewsSiteConfig(
                 base_url=base_url,
                 listing_page_paths=listing_paths,
                 article_link_selectors=link_selectors,
@@ -105,6 +340,8 @@ class UniversalNewsScraper:
                 date_selectors=date_selectors,
                 turkish_date_parsing_enabled=turkish_parsing
             )
+            # Önceki taramalardan öğrenilen sıralama varsa uygula
+            return load_learned_selectors(config)
             
         except Exception as e:
             if status_callback:
@@ -294,319 +531,537 @@ class UniversalNewsScraper:
             turkish_date_parsing_enabled=True
         )
 
-    def parse_date_from_article(self, article_url):
-        """Haber sayfasından tarih bilgisini çıkarır - geliştirilmiş versiyon"""
+    def _get_selector_plan(self, selectors):
+        """Seçici listesi için derlenmiş planı döndürür (config değişirse yeniden derlenir)"""
+        key = tuple(selectors)
+        plan = self._selector_plans.get(key)
+        if plan is None:
+            plan = SelectorPlan(key)
+            self._selector_plans[key] = plan
+        return plan
+
+    def _match_article_selectors(self, soup):
+        """Haber sayfasındaki tüm başlık, tarih, içerik ve kaynak seçicilerini tek geçişte eşleştirir"""
+        plan = self._get_selector_plan(
+            self.config.title_selectors + META_DATE_SELECTORS + self.config.date_selectors
+            + [JSON_LD_SELECTOR] + self.config.content_selectors + AUTHOR_SELECTORS
+        )
+        return plan.run(self.parser, soup)
+
+    def _fetch_article_document(self, article_url, start_time=None, end_time=None, cancel_event=None):
+        """Haber sayfasını tek seferde indirir ve parse edilmiş ağacı döndürür.
+
+        Zaman aralığı verilirse sayfa akış olarak okunur: Last-Modified başlığı
+        ya da `<head>` içindeki meta tarih aralık dışını gösteriyorsa bağlantı
+        kapatılır ve gövdenin geri kalanı indirilmeden None döner.
+        """
+        if start_time is None or not self.config.early_date_filter:
+            response = self._get(article_url, url_class='article', cancel_event=cancel_event)
+            return self.parser.parse(response.content)
+
+        response = self._get(article_url, url_class='article', cancel_event=cancel_event, stream=True)
+        if getattr(response, 'from_cache', False):
+            return self.parser.parse(response.content)
+
         try:
-            self.session.headers.update({'User-Agent': self._get_random_user_agent()})
-            time.sleep(random.uniform(1, 3))
-            
-            response = self.session.get(article_url, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Yayın tarihi son değişiklik tarihinden sonra olamaz (saat dilimi için bir gün pay)
+            last_modified = self._parse_http_date(response.headers.get('Last-Modified'))
+            if last_modified and last_modified < start_time - timedelta(days=1):
+                return None
 
-            # Önce meta tag'leri kontrol et (en güvenilir)
-            meta_selectors = [
-                'meta[property="article:published_time"]',
-                'meta[name="datePublished"]',
-                'meta[name="publishdate"]',
-                'meta[name="date"]',
-                'meta[property="og:updated_time"]'
-            ]
-            
-            for selector in meta_selectors:
-                meta_tag = soup.select_one(selector)
-                if meta_tag:
-                    date_content = meta_tag.get('content', '')
-                    parsed_date = self._parse_any_date_format(date_content)
-                    if parsed_date:
-                        return parsed_date
-
-            # Sonra normal seçicileri dene
-            for selector in self.config.date_selectors:
-                date_element = soup.select_one(selector)
-                if date_element:
-                    date_text = date_element.get('datetime') or date_element.get_text().strip()
-                    parsed_date = self._parse_any_date_format(date_text)
-                    if parsed_date:
-                        return parsed_date
-
-            # JSON-LD structured data kontrol et
-            json_ld_scripts = soup.find_all('script', type='application/ld+json')
-            for script in json_ld_scripts:
-                try:
-                    import json
-                    data = json.loads(script.string)
-                    if isinstance(data, dict):
-                        date_published = data.get('datePublished') or data.get('dateCreated')
-                        if date_published:
-                            parsed_date = self._parse_any_date_format(date_published)
-                            if parsed_date:
-                                return parsed_date
-                except:
+            chunks = []
+            head_checked = False
+            received = 0
+            for chunk in response.iter_content(chunk_size=8192):
+                chunks.append(chunk)
+                received += len(chunk)
+                if head_checked:
+                    continue
+
+                head_end = b''.join(chunks).lower().find(b'</head>')
+                if head_end == -1 and received < HEAD_PROBE_MAX_BYTES:
                     continue
 
+                head_checked = True
+                head_bytes = b''.join(chunks)[:head_end + 7] if head_end != -1 else b''.join(chunks)
+                head_date = self._extract_meta_date(self.parser.parse(head_bytes))
+                if head_date and not (start_time <= head_date <= end_time):
+                    if self.crawl_state:
+                        self.crawl_state.record(article_url, published_at=head_date)
+                    return None
+
+            body = b''.join(chunks)
+        finally:
+            response.close()
+
+        # Tam okunan sayfayı normal yanıt gibi önbelleğe yaz
+        response._content = body
+        response._content_consumed = True
+        if self.cache:
+            self.cache.store(article_url, response)
+
+        return self.parser.parse(body)
+
+    def _parse_http_date(self, value):
+        """HTTP tarih başlığını (RFC 7231) saat dilimsiz datetime'a çevirir"""
+        if not value:
+            return None
+        try:
+            return parsedate_to_datetime(value).replace(tzinfo=None)
+        except (TypeError, ValueError):
+            return None
+
+    def parse_date_from_article(self, article_url):
+        """Haber sayfasından tarih bilgisini çıkarır - geliştirilmiş versiyon"""
+        try:
+            soup = self._fetch_article_document(article_url)
+            return self._extract_date(soup)
         except Exception as e:
             print(f"Tarih parse edilemedi {article_url}: {e}")
         return None
 
-    def _parse_any_date_format(self, date_str):
-        """Herhangi bir tarih formatını parse etmeye çalışır"""
-        if not date_str:
-            return None
-            
-        date_str = str(date_str).strip()
-        
-        # ISO format (en yaygın)
-        try:
-            if 'T' in date_str:
-                return datetime.fromisoformat(date_str.replace('Z', '+00:00')).replace(tzinfo=None)
-        except:
-            pass
-        
-        # Türkçe tarih formatları
-        if self.config.turkish_date_parsing_enabled:
-            turkish_date = self.parse_turkish_date(date_str)
-            if turkish_date:
-                return turkish_date
-        
-        # Diğer yaygın formatlar
-        formats = [
-            '%Y-%m-%d %H:%M:%S',
-            '%Y-%m-%d %H:%M',
-            '%Y-%m-%d',
-            '%d.%m.%Y %H:%M:%S',
-            '%d.%m.%Y %H:%M',
-            '%d.%m.%Y',
-            '%d/%m/%Y %H:%M:%S',
-            '%d/%m/%Y %H:%M',
-            '%d/%m/%Y',
-            '%Y/%m/%d %H:%M:%S',
-            '%Y/%m/%d %H:%M',
-            '%Y/%m/%d'
-        ]
-        
-        for fmt in formats:
+    def _extract_date(self, soup, matches=None):
+        """Parse edilmiş sayfadan tarih bilgisini çıkarır"""
+        matches = matches or self._match_article_selectors(soup)
+
+        # Önce meta tag'leri kontrol et (en güvenilir)
+        parsed_date = self._extract_meta_date(soup, matches)
+        if parsed_date:
+            return parsed_date
+
+        # Sonra normal seçicileri dene
+        selectors = self.config.date_selectors
+        for index, selector in enumerate(selectors):
+            date_element = matches.first(selector)
+            if date_element:
+                date_text = date_element.get('datetime') or date_element.get_text().strip()
+                parsed_date = self._parse_any_date_format(date_text)
+                if parsed_date:
+                    self.config.selector_stats.record_attempts('date_selectors', selectors[:index + 1], selector)
+                    return parsed_date
+        self.config.selector_stats.record_attempts('date_selectors', selectors)
+
+        # JSON-LD structured data kontrol et
+        json_ld_scripts = matches.all(JSON_LD_SELECTOR)
+        for script in json_ld_scripts:
             try:
-                return datetime.strptime(date_str, fmt)
+                data = json.loads(script.get_text())
+                if isinstance(data, dict):
+                    date_published = data.get('datePublished') or data.get('dateCreated')
+                    if date_published:
+                        parsed_date = self._parse_any_date_format(date_published)
+                        if parsed_date:
+                            return parsed_date
             except:
                 continue
-                
+
         return None
 
-    def parse_turkish_date(self, date_str):
-        """Türkçe tarih formatını parse eder - geliştirilmiş"""
-        try:
-            # ISO format kontrolü
-            if 'T' in date_str and ('Z' in date_str or '+' in date_str):
-                return datetime.fromisoformat(date_str.replace('Z', '+00:00')).replace(tzinfo=None)
-
-            # Türkçe ay isimleri
-            months = {
-                'ocak': '01', 'şubat': '02', 'mart': '03', 'nisan': '04',
-                'mayıs': '05', 'haziran': '06', 'temmuz': '07', 'ağustos': '08',
-                'eylül': '09', 'ekim': '10', 'kasım': '11', 'aralık': '12',
-                'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
-                'may': '05', 'jun': '06', 'jul': '07', 'aug': '08',
-                'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'
-            }
-
-            date_str = date_str.lower().strip()
-
-            # Çeşitli Türkçe tarih formatları
-            patterns = [
-                r'(\d{1,2})\s+(\w+)\s+(\d{4})\s+(\d{1,2}):(\d{2})',  # 17 haziran 2025 15:30
-                r'(\d{1,2})\s+(\w+)\s+(\d{4})',  # 17 haziran 2025
-                r'(\d{2})\.(\d{2})\.(\d{4})\s*-?\s*(\d{1,2}):(\d{2})',  # 17.06.2025 - 15:30
-                r'(\d{2})\.(\d{2})\.(\d{4})',  # 17.06.2025
-                r'(\d{2})/(\d{2})/(\d{4})\s+(\d{1,2}):(\d{2})',  # 17/06/2025 15:30
-                r'(\d{2})/(\d{2})/(\d{4})'  # 17/06/2025
-            ]
+    def _extract_meta_date(self, soup, matches=None):
+        """Meta etiketlerinden yayın tarihini çıkarır (sadece <head> ile de çalışır)"""
+        matches = matches or self._get_selector_plan(META_DATE_SELECTORS).run(self.parser, soup)
+        for selector in META_DATE_SELECTORS:
+            meta_tag = matches.first(selector)
+            if meta_tag:
+                date_content = meta_tag.get('content', '')
+                parsed_date = self._parse_any_date_format(date_content)
+                if parsed_date:
+                    return parsed_date
+        return None
 
-            for i, pattern in enumerate(patterns):
-                match = re.search(pattern, date_str)
-                if match:
-                    groups = match.groups()
-                    if i == 0:  # Türkçe ay isimli format
-                        day, month_name, year, hour, minute = groups
-                        month = months.get(month_name, '01')
-                        return datetime(int(year), int(month), int(day), int(hour), int(minute))
-                    elif i == 1:  # Türkçe ay isimli format (saat yok)
-                        day, month_name, year = groups
-                        month = months.get(month_name, '01')
-                        return datetime(int(year), int(month), int(day))
-                    elif i == 2:  # DD.MM.YYYY - HH:MM
-                        day, month, year, hour, minute = groups
-                        return datetime(int(year), int(month), int(day), int(hour), int(minute))
-                    elif i == 3:  # DD.MM.YYYY
-                        day, month, year = groups
-                        return datetime(int(year), int(month), int(day))
-                    elif i == 4:  # DD/MM/YYYY HH:MM
-                        day, month, year, hour, minute = groups
-                        return datetime(int(year), int(month), int(day), int(hour), int(minute))
-                    elif i == 5:  # DD/MM/YYYY
-                        day, month, year = groups
-                        return datetime(int(year), int(month), int(day))
+    def _extract_url_date(self, url):
+        """URL içine gömülü tarihi (gün hassasiyetinde) çıkarır"""
+        path = urlparse(url).path
+        for pattern in URL_DATE_PATTERNS:
+            match = pattern.search(path)
+            if match:
+                try:
+                    return datetime(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+                except ValueError:
+                    continue
+        return None
 
-        except Exception as e:
-            print(f"Türkçe tarih parse hatası: {e}")
+    def _find_listing_date_hint(self, link):
+        """Listeleme sayfasında linkin bulunduğu karttaki <time> etiketinden tarih ipucu çıkarır"""
+        node = link
+        for _ in range(4):
+            if node is None or node.name in ('body', 'html', '[document]'):
+                break
+            time_elem = node if node.name == 'time' else node.select_one('time')
+            if time_elem:
+                # Kart birden fazla habere aitse tarih bu linke atfedilemez
+                hrefs = {a.get('href') for a in node.select('a[href]')}
+                hrefs.add(link.get('href'))
+                if len(hrefs) > 1:
+                    return None
+                return self._parse_any_date_format(time_elem.get('datetime') or time_elem.get_text().strip())
+            node = node.parent
         return None
 
+    def _date_hint_in_window(self, date_hint, start_time, end_time):
+        """Tarih ipucu aralıkla uyumlu mu? Gün hassasiyetinde, temkinli karşılaştırır"""
+        return start_time.date() <= date_hint.date() <= end_time.date()
+
+    def _parse_any_date_format(self, date_str):
+        """Herhangi bir tarih formatını parse etmeye çalışır (bkz. app/date_parser.py)"""
+        return self.date_parser.parse(date_str)
+
+    @property
+    def date_parser(self):
+        """Sitenin Türkçe tarih ayarına uygun, format çıkarımı yapan ayrıştırıcı"""
+        turkish = self.config.turkish_date_parsing_enabled
+        if self._date_parser is None or self._date_parser.turkish != turkish:
+            self._date_parser = DateParser(turkish=turkish)
+        return self._date_parser
+
+    def parse_turkish_date(self, date_str):
+        """Türkçe tarih formatını parse eder - geliştirilmiş"""
+        return parse_turkish_date(date_str)
+
     def get_article_content(self, article_url):
         """Haber içeriğini çeker - geliştirilmiş"""
         try:
-            self.session.headers.update({'User-Agent': self._get_random_user_agent()})
-            time.sleep(random.uniform(1, 3))
-            
-            response = self.session.get(article_url, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # Reklamları ve gereksiz içerikleri temizle
-            for unwanted in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', '.ad', '.advertisement', '.social-share']):
-                unwanted.decompose()
-
-            # İçerik seçicilerini dene
-            for selector in self.config.content_selectors:
-                content_div = soup.select_one(selector)
-                if content_div:
-                    # Paragrafları birleştir
-                    paragraphs = content_div.find_all('p')
-                    if paragraphs:
-                        content = ' '.join([p.get_text().strip() for p in paragraphs if p.get_text().strip()])
-                        if len(content) > 100:  # Yeterince uzun içerik varsa
-                            return content
-                    else:
-                        content = content_div.get_text().strip()
-                        if len(content) > 100:
-                            return content
-
-            # Fallback: Tüm paragrafları al
-            all_paragraphs = soup.find_all('p')
-            if all_paragraphs:
-                content = ' '.join([p.get_text().strip() for p in all_paragraphs if len(p.get_text().strip()) > 20])
-                if len(content) > 100:
-                    return content
-
-            return "İçerik çekilemedi"
-            
+            soup = self._fetch_article_document(article_url)
+            return self._extract_content(soup)
         except Exception as e:
             print(f"İçerik çekme hatası {article_url}: {e}")
             return "İçerik çekilemedi"
 
+    def _extract_content(self, soup, matches=None):
+        """Parse edilmiş sayfadan haber içeriğini çıkarır.
+
+        Not: Reklam ve gereksiz etiketleri ağaçtan siler, bu yüzden aynı ağaç
+        üzerindeki diğer çıkarımlardan sonra çağrılmalıdır.
+        """
+        matches = matches or self._match_article_selectors(soup)
+        selectors = self.config.content_selectors
+
+        if matches.indexed:
+            # İndeks temizlikten önce kuruldu: silinecek etiketlerin içinde kalan adayları
+            # ele; böylece seçim temizlenmiş ağaç üzerinde select_one yapılmış gibi olur
+            removed_tags = set(UNWANTED_CONTENT_TAGS)
+            candidates = [
+                matches.first(selector, accept=lambda node: not self._is_inside_tags(node, removed_tags))
+                for selector in selectors
+            ]
+            self.parser.remove_tags(soup, UNWANTED_CONTENT_TAGS)
+        else:
+            # Reklamları ve gereksiz içerikleri temizle, seçicileri gerektikçe çalıştır
+            self.parser.remove_tags(soup, UNWANTED_CONTENT_TAGS)
+            candidates = (soup.select_one(selector) for selector in selectors)
+
+        # İçerik seçicilerini dene
+        for index, content_div in enumerate(candidates):
+            if content_div:
+                # Paragrafları birleştir
+                paragraphs = content_div.select('p')
+                if paragraphs:
+                    content = ' '.join([p.get_text().strip() for p in paragraphs if p.get_text().strip()])
+                else:
+                    content = content_div.get_text().strip()
+                if len(content) > 100:  # Yeterince uzun içerik varsa
+                    self.config.selector_stats.record_attempts('content_selectors', selectors[:index + 1], selectors[index])
+                    return content
+        self.config.selector_stats.record_attempts('content_selectors', selectors)
+
+        # Fallback: Tüm paragrafları al
+        all_paragraphs = soup.select('p')
+        if all_paragraphs:
+            content = ' '.join([p.get_text().strip() for p in all_paragraphs if len(p.get_text().strip()) > 20])
+            if len(content) > 100:
+                return content
+
+        return "İçerik çekilemedi"
+
+    def _is_inside_tags(self, node, tag_names):
+        """Düğüm ya da atalarından biri verilen etiketlerden mi?"""
+        while node is not None:
+            if node.name in tag_names:
+                return True
+            node = node.parent
+        return False
+
+    def _process_article(self, news_url, start_time, end_time, cancel_event=None):
+        """Haber sayfasını bir kez çeker; başlık, tarih, içerik ve kaynağı aynı ağaçtan çıkarır.
+
+        Haber zaman aralığı dışındaysa ya da tarama iptal edildiyse None döner.
+        """
+        if cancel_event is not None and cancel_event.is_set():
+            return None  # İş kuyrukta beklerken tarama iptal edildi
+        try:
+            soup = self._fetch_article_document(news_url, start_time, end_time, cancel_event)
+        except RequestCancelled:
+            return None
+        if soup is None:
+            return None  # Tarih ön kontrolünde elendi
+
+        # Tüm seçiciler tek ağaç geçişinde eşleştirilir
+        matches = self._match_article_selectors(soup)
+
+        title = self._extract_title(soup, matches)
+        news_date = self._extract_date(soup, matches)
+
+        if not news_date or not (start_time <= news_date <= end_time):
+            # Tarihi bilinen haberler sonraki çalıştırmalarda ağa çıkmadan elenir
+            if self.crawl_state and news_date:
+                self.crawl_state.record(news_url, published_at=news_date, title=title)
+            return None
+
+        # İçerik çıkarımı ağacı değiştirdiği için başlık ve tarihten sonra çalışır
+        content = self._extract_content(soup, matches)
+        source = self._extract_source(soup, content, matches)
+
+        if self.crawl_state:
+            self.crawl_state.record(news_url, published_at=news_date, title=title, content=content, source=source)
+
+        return {
+            'Haber Başlığı': title,
+            'Haber Metni': content,
+            'Haber Linki': news_url,
+            'Tarih': news_date.strftime('%Y-%m-%d %H:%M'),
+            'Kaynak': source
+        }
+
     def scrape_news_by_time_range(self, start_time, end_time, max_listing_pages: int = 3, status_callback=None):
-        """Belirli zaman aralığındaki haberleri çeker - geliştirilmiş"""
+        """Belirli zaman aralığındaki haberleri çeker - geliştirilmiş.
+
+        Haber sayfaları `max_workers` thread ile eşzamanlı çekilir; host başına
+        nezaket kuralları `self.scheduler` tarafından uygulanır. `status_callback`
+        her zaman çağıran thread'den çağrılır.
+        """
+        return list(self.iter_news_by_time_range(start_time, end_time, max_listing_pages, status_callback))
+
+    def iter_news_by_time_range(self, start_time, end_time, max_listing_pages: int = 3, status_callback=None,
+                                cancel_event=None):
+        """Zaman aralığındaki haberleri çıkarıldıkça tek tek döndürür.
+
+        Uzun taramalarda bellek sabit kalır; sonuçlar bir sink'e
+        (bkz. app/sinks.py) yazılarak yarıda kalan tarama kaybedilmez::
+
+            with open_sink('haberler.csv') as sink:
+                sink.write_all(scraper.iter_news_by_time_range(start, end))
+
+        `cancel_event` (threading.Event) set edildiğinde yeni istek açılmaz,
+        bekleyen işler iptal edilir ve generator sona erer.
+        """
+        return self._iter_news_by_time_range(start_time, end_time, max_listing_pages, status_callback,
+                                             cancel_event=cancel_event)
+
+    def _iter_news_by_time_range(self, start_time, end_time, max_listing_pages: int = 3,
+                                 status_callback=None, executor=None, cancel_event=None):
+        """Zaman aralığındaki haberleri çıkarıldıkça döndüren generator.
+
+        `executor` verilirse haber sayfaları bu paylaşılan havuzda çekilir
+        (çoklu site taramasında ortak işçi bütçesi için); havuz kapatılmaz.
+        """
         if not self.config:
             if status_callback:
                 status_callback("Hata: Site konfigürasyonu bulunamadı")
-            return []
+            return
 
-        news_list = []
-        pages_visited = 0
+        # Önceki sayfalarda/çalıştırmalarda en çok isabet alan seçiciler önce denenir
+        pruned = self.config.apply_selector_ranking()
+        if pruned and status_callback:
+            status_callback(f"Hiç isabet almayan {sum(map(len, pruned.values()))} seçici konfigürasyondan çıkarıldı.")
+
+        found_count = 0
+        skipped_count = 0
         processed_urls = set()  # Duplicate URL'leri önlemek için
+        futures = {}  # Bekleyen işler; sonucu alınan iş buradan çıkarılır
+        submitted_count = 0
+        done_count = 0
+        # Çekilip henüz tüketilmemiş haber sayısının üst sınırı (bellek sabit kalsın)
+        max_pending = self.max_workers * 4
 
-        print(f"[SCRAPER] Başlangıç tarihi: {start_time}, Bitiş tarihi: {end_time}")
-        print(f"[SCRAPER] Maksimum ziyaret edilecek listeleme sayfası: {max_listing_pages}")
+        own_executor = executor is None
+        if own_executor:
+            executor = ThreadPoolExecutor(max_workers=self.max_workers)
 
-        try:
-            for page_path in self.config.listing_page_paths:
-                if pages_visited >= max_listing_pages:
-                    if status_callback:
-                        status_callback(f"Maksimum {max_listing_pages} listeleme sayfası ziyaret edildi.")
-                    break
+        def cancelled():
+            return cancel_event is not None and cancel_event.is_set()
 
-                page_url = urljoin(self.config.base_url, page_path)
+        def collect_finished(block):
+            """Tamamlanan işlerin haberlerini döndürür; `block` ise en az biri bitene kadar bekler"""
+            nonlocal done_count
+            if not futures:
+                return
+            finished, _ = wait(futures, timeout=None if block else 0, return_when=FIRST_COMPLETED)
+            for future in finished:
+                news_url = futures.pop(future)
+                done_count += 1
                 if status_callback:
-                    status_callback(f"Sayfa kontrol ediliyor: {page_url}")
+                    status_callback(f"Haber kontrol edildi ({done_count}/{submitted_count}): {news_url[:50]}...")
 
                 try:
-                    self.session.headers.update({'User-Agent': self._get_random_user_agent()})
-                    time.sleep(random.uniform(2, 4))
-
-                    response = self.session.get(page_url, timeout=15)
-                    response.raise_for_status()
-                    
-                    soup = BeautifulSoup(response.content, 'html.parser')
-
-                    # Haber linklerini bul
-                    news_links = set()
-                    for selector in self.config.article_link_selectors:
-                        try:
-                            links = soup.select(selector)
-                            for link in links:
-                                href = link.get('href')
-                                if href:
-                                    full_url = urljoin(self.config.base_url, href)
-                                    if self._is_valid_news_url(full_url):
-                                        news_links.add(full_url)
-                        except Exception as e:
-                            continue  # Bu seçici çalışmadı, diğerini dene
+                    news_item = future.result()
+                except Exception as e:
+                    if status_callback:
+                        status_callback(f"Haber işleme hatası: {e}")
+                    continue
 
+                if news_item:
                     if status_callback:
-                        status_callback(f"Bulunan benzersiz haber linki: {len(news_links)}")
+                        status_callback(f"✓ Haber zaman aralığında: {news_item['Haber Başlığı'][:30]}...")
+                    yield news_item
+
+        print(f"[SCRAPER] Başlangıç tarihi: {start_time}, Bitiş tarihi: {end_time}")
+        print(f"[SCRAPER] Maksimum ziyaret edilecek listeleme sayfası: {max_listing_pages}")
+
+        try:
+            link_batches = self._iter_link_batches(start_time, end_time, max_listing_pages, status_callback,
+                                                   cancel_event)
+            for news_links, link_limit in link_batches:
+                # Her haberi kuyruğa ekle; link kaynakları taranırken haberler paralel çekilir
+                for news_url in list(news_links)[:link_limit]:
+                    if cancelled():
+                        break
+                    url_key = normalize_url(news_url)
+                    if url_key in processed_urls:
+                        continue
+                    processed_urls.add(url_key)
 
-                    # Her haberi kontrol et
-                    for i, news_url in enumerate(list(news_links)[:30]):  # İlk 30 haberi kontrol et
-                        if news_url in processed_urls:
+                    # Listeleme sayfası, sitemap veya URL'den gelen tarih ipucu aralık dışındaysa indirme
+                    if self.config.early_date_filter:
+                        date_hint = news_links[news_url] or self._extract_url_date(news_url)
+                        if date_hint and not self._date_hint_in_window(date_hint, start_time, end_time):
+                            skipped_count += 1
                             continue
-                        processed_urls.add(news_url)
-
-                        if status_callback:
-                            status_callback(f"Haber kontrol ediliyor ({i + 1}/30): {news_url[:50]}...")
-
-                        try:
-                            # Haber sayfasını çek
-                            self.session.headers.update({'User-Agent': self._get_random_user_agent()})
-                            time.sleep(random.uniform(1, 3))
-
-                            response = self.session.get(news_url, timeout=15)
-                            response.raise_for_status()
-                            
-                            soup = BeautifulSoup(response.content, 'html.parser')
-
-                            # Başlık
-                            title = self._extract_title(soup)
-                            
-                            # Tarih
-                            news_date = self.parse_date_from_article(news_url)
-                            
-                            if news_date and start_time <= news_date <= end_time:
-                                if status_callback:
-                                    status_callback(f"✓ Haber zaman aralığında: {title[:30]}...")
-
-                                # İçeriği çek
-                                content = self.get_article_content(news_url)
-                                
-                                # Kaynak bilgisi
-                                source = self._extract_source(soup, content)
-
-                                news_list.append({
-                                    'Haber Başlığı': title,
-                                    'Haber Metni': content,
-                                    'Haber Linki': news_url,
-                                    'Tarih': news_date.strftime('%Y-%m-%d %H:%M'),
-                                    'Kaynak': source
-                                })
-
-                        except Exception as e:
-                            if status_callback:
-                                status_callback(f"Haber işleme hatası: {e}")
+
+                    # Önceki çalıştırmalarda görülen haberleri kayıtlı durumdan değerlendir
+                    state = self.crawl_state.get(news_url) if self.crawl_state else None
+                    if state and state['published_at']:
+                        if not (start_time <= state['published_at'] <= end_time):
+                            skipped_count += 1
+                            continue
+                        if CrawlStateStore.is_complete(state):
+                            found_count += 1
+                            yield CrawlStateStore.to_news_item(state)
                             continue
 
-                    pages_visited += 1
+                    # Bekleyen iş sınırı dolduysa önce biten haberleri teslim et
+                    while len(futures) >= max_pending and not cancelled():
+                        for news_item in collect_finished(block=True):
+                            found_count += 1
+                            yield news_item
 
-                except Exception as e:
-                    if status_callback:
-                        status_callback(f"Sayfa erişim hatası {page_url}: {e}")
-                    continue
+                    future = executor.submit(self._process_article, news_url, start_time, end_time, cancel_event)
+                    futures[future] = news_url
+                    submitted_count += 1
+
+                # Link kaynakları taranırken bitmiş haberleri beklemeden teslim et
+                for news_item in collect_finished(block=False):
+                    found_count += 1
+                    yield news_item
+                if cancelled():
+                    break
+
+            # Kalan haberleri bittikçe teslim et
+            while futures and not cancelled():
+                for news_item in collect_finished(block=True):
+                    found_count += 1
+                    yield news_item
 
         except Exception as e:
             if status_callback:
                 status_callback(f"Genel scraping hatası: {e}")
 
-        print(f"[SCRAPER] Scraping tamamlandı. Toplam bulunan haber: {len(news_list)}")
-        return news_list
+        finally:
+            # Tüketici erken bırakırsa bekleyen işleri iptal et
+            for future in futures:
+                future.cancel()
+            if own_executor:
+                executor.shutdown(wait=True)
+
+        if cancelled() and status_callback:
+            status_callback("Tarama iptal edildi.")
+        if skipped_count and status_callback:
+            status_callback(f"Tarihi önceden bilinen ve aralık dışında kalan {skipped_count} haber indirilmeden atlandı.")
+        print(f"[SCRAPER] Scraping tamamlandı. Toplam bulunan haber: {found_count}")
+
+    def _iter_link_batches(self, start_time, end_time, max_listing_pages, status_callback=None, cancel_event=None):
+        """Haber linklerini (URL -> tarih ipucu sözlüğü, işlenecek en fazla link) grupları halinde üretir.
+
+        'sitemap' modunda önce sitemap/RSS akışları denenir; aralıkta link
+        bulunamazsa HTML listeleme sayfalarına geri dönülür. Her iki modda da
+        en fazla `max_listing_pages * LINKS_PER_LISTING_PAGE` haber linki
+        işlenir.
+        """
+        if self.config.discovery_mode == 'sitemap':
+            if status_callback:
+                status_callback("Sitemap ve RSS akışları taranıyor...")
+            link_limit = max_listing_pages * LINKS_PER_LISTING_PAGE
+            discovery = SitemapFeedDiscovery(self, max_entries=link_limit)
+            entries = discovery.discover(start_time, end_time, status_callback, cancel_event)
+            if entries:
+                if status_callback:
+                    status_callback(f"Sitemap/RSS ile aralıkta bulunan haber linki: {len(entries)}")
+                yield entries, link_limit
+                return
+            if status_callback:
+                status_callback("Sitemap/RSS'te haber bulunamadı, listeleme sayfalarına geçiliyor.")
+
+        pages_visited = 0
+        for page_path in self.config.listing_page_paths:
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            if pages_visited >= max_listing_pages:
+                if status_callback:
+                    status_callback(f"Maksimum {max_listing_pages} listeleme sayfası ziyaret edildi.")
+                break
+
+            page_url = urljoin(self.config.base_url, page_path)
+            if status_callback:
+                status_callback(f"Sayfa kontrol ediliyor: {page_url}")
+
+            try:
+                news_links = self._collect_article_links(page_url, cancel_event)
+            except RequestCancelled:
+                return
+            except Exception as e:
+                if status_callback:
+                    status_callback(f"Sayfa erişim hatası {page_url}: {e}")
+                continue
+
+            if status_callback:
+                status_callback(f"Bulunan benzersiz haber linki: {len(news_links)}")
+
+            pages_visited += 1
+            yield news_links, LINKS_PER_LISTING_PAGE  # Sayfa başına ilk linkleri kontrol et
+
+    def _collect_article_links(self, page_url, cancel_event=None):
+        """Listeleme sayfasını çeker; geçerli haber linklerini tarih ipuçlarıyla döndürür.
+
+        Dönen sözlük URL -> listeleme sayfasında bulunan tarih (yoksa None) şeklindedir.
+        """
+        response = self._get(page_url, url_class='listing', cancel_event=cancel_event)
+        return self._extract_article_links(self.parser.parse(response.content))
+
+    def _extract_article_links(self, soup):
+        """Parse edilmiş listeleme sayfasından haber linklerini tarih ipuçlarıyla çıkarır"""
+        matches = self._get_selector_plan(self.config.article_link_selectors).run(self.parser, soup)
+
+        news_links = {}
+        for selector in self.config.article_link_selectors:
+            found = False
+            try:
+                links = matches.all(selector)
+                for link in links:
+                    href = link.get('href')
+                    if href:
+                        full_url = urljoin(self.config.base_url, href)
+                        if self._is_valid_news_url(full_url):
+                            found = True
+                            if news_links.get(full_url) is None:
+                                news_links[full_url] = (
+                                    self._find_listing_date_hint(link) if self.config.early_date_filter else None
+                                )
+            except Exception as e:
+                continue  # Bu seçici çalışmadı, diğerini dene
+            finally:
+                # Link seçicileri birlikte çalışır: geçerli link bulan her seçici isabet alır
+                self.config.selector_stats.record('article_link_selectors', selector, found)
+
+        return news_links
 
     def _is_valid_news_url(self, url):
         """URL'nin geçerli bir haber URL'i olup olmadığını kontrol eder"""
@@ -626,11 +1081,13 @@ class UniversalNewsScraper:
             
         return True
 
-    def _extract_title(self, soup):
+    def _extract_title(self, soup, matches=None):
         """Sayfadan başlığı çıkarır"""
-        for selector in self.config.title_selectors:
+        matches = matches or self._match_article_selectors(soup)
+        selectors = self.config.title_selectors
+        for index, selector in enumerate(selectors):
             try:
-                title_elem = soup.select_one(selector)
+                title_elem = matches.first(selector)
                 if title_elem:
                     if title_elem.name == 'meta':
                         title = title_elem.get('content', '').strip()
@@ -638,22 +1095,20 @@ class UniversalNewsScraper:
                         title = title_elem.get_text().strip()
                     
                     if title and len(title) > 10:  # Çok kısa başlıkları atla
+                        self.config.selector_stats.record_attempts('title_selectors', selectors[:index + 1], selector)
                         return title
             except:
                 continue
+        self.config.selector_stats.record_attempts('title_selectors', selectors)
         return "Başlık bulunamadı"
 
-    def _extract_source(self, soup, content):
+    def _extract_source(self, soup, content, matches=None):
         """Kaynak bilgisini çıkarır"""
+        matches = matches or self._match_article_selectors(soup)
+
         # Meta tag'lerden yazar bilgisi
-        author_selectors = [
-            'meta[name="author"]',
-            'meta[name="articleAuthor"]',
-            'meta[property="article:author"]'
-        ]
-        
-        for selector in author_selectors:
-            meta_author = soup.select_one(selector)
+        for selector in AUTHOR_SELECTORS:
+            meta_author = matches.first(selector)
             if meta_author:
                 return meta_author.get('content', '').strip()
         
@@ -667,11 +1122,35 @@ class UniversalNewsScraper:
         return "Kaynak bulunamadı"
 
     def save_to_csv(self, news_list, filename):
-        """Haberleri CSV dosyasına kaydeder"""
-        if not news_list:
+        """Haberleri CSV dosyasına kaydeder (liste veya iter_news_by_time_range generator'ı).
+
+        Dosya baştan yazılır; ancak ilk parti geçici dosyaya yazılana kadar
+        mevcut dosyaya dokunulmaz. Kaydedilecek haber yoksa eski dosya kalır.
+        """
+        temporary = filename + '.tmp'
+        if os.path.exists(temporary):
+            os.remove(temporary)  # Önceki yarım kalmış kayıt
+
+        count = 0
+        with CsvSink(temporary) as sink:
+            for news_item in news_list:
+                sink.write(news_item)
+                count += 1
+                if sink.written and sink.path == temporary:
+                    # İlk parti yazıldı: eski dosya şimdi değiştirilir, sonraki partiler doğrudan eklenir
+                    os.replace(temporary, filename)
+                    sink.path = filename
+        if sink.path == temporary and sink.written:
+            os.replace(temporary, filename)  # Tek partiden kısa çıktı kapanışta yazıldı
+
+        if not count:
             print("Kaydedilecek haber bulunamadı.")
             return
+        print(f"✓ {count} haber {filename} dosyasına kaydedildi.") 
+
 
-        df = pd.DataFrame(news_list)
-        df.to_csv(filename, index=False, encoding='utf-8-sig')
-        print(f"✓ {len(news_list)} haber {filename} dosyasına kaydedildi.") 
\ No newline at end of file
+if __name__ == '__main__':
+    # python -m app.scraper crawl --site ... (bkz. app/cli.py)
+    import sys
+    from app.cli import main
+    sys.exit(main())
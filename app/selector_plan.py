@@ -0,0 +1,198 @@
+"""Derlenmiş seçici planları.
+
+Bir NewsSiteConfig'teki onlarca CSS seçici her sayfada ayrı ayrı `select_one`
+ile çalıştırıldığında ağaç her seferinde baştan dolaşılır. `SelectorPlan`
+seçicileri bir kez derler: her seçicinin en sağdaki bileşeninden bir anahtar
+(id, class, nitelik veya etiket adı) çıkarır. Sayfa başına ağaç yalnızca bir
+kez dolaşılıp bu anahtarlara göre aday düğümler indekslenir; ardından
+seçiciler öncelik sırasıyla yalnızca kendi adayları üzerinde doğrulanır.
+
+lxml ve selectolax gibi seçicileri C'de çalıştıran arka uçlarda Python'da
+ağaç dolaşmak yerel `select`'ten yavaştır; bu arka uçlarda (`indexed_plans`
+False) plan indeks kurmaz, her seçiciyi ilk ihtiyaç anında bir kez çalıştırıp
+sonucu sayfa boyunca tekrar kullanır.
+"""
+import re
+from collections import defaultdict
+
+
+_COMPOUND_RE = re.compile(r'^(?P<tag>\*|[a-zA-Z][\w-]*)?(?P<rest>.*)$', re.DOTALL)
+_PART_RE = re.compile(
+    r'#(?P<id>[\w-]+)'
+    r'|\.(?P<cls>[\w-]+)'
+    r'|\[\s*(?P<attr>[\w:-]+)\s*(?P<op>[~|^$*]?=\s*(?:"[^"]*"|\'[^\']*\'|[^\]\s]+)\s*(?:[iIsS]\s*)?)?\]'
+    r'|(?P<pseudo>::?[\w-]+(?:\([^)]*\))?)'
+)
+
+
+def _split_compounds(selector):
+    """Seçiciyi kombinatörlerden (boşluk, >, +, ~) böler; köşeli parantez ve tırnak içini korur"""
+    compounds = []
+    current = []
+    depth = 0
+    quote = None
+    for char in selector.strip():
+        if quote:
+            current.append(char)
+            if char == quote:
+                quote = None
+            continue
+        if char in ('"', "'"):
+            quote = char
+        elif char in '[(':
+            depth += 1
+        elif char in '])':
+            depth -= 1
+        elif depth == 0 and (char.isspace() or char in '>+~'):
+            if current:
+                compounds.append(''.join(current))
+                current = []
+            continue
+        current.append(char)
+    if current:
+        compounds.append(''.join(current))
+    return compounds
+
+
+class CompiledSelector:
+    """Tek bir seçicinin indeks anahtarı ve doğrulama gereksinimi"""
+
+    __slots__ = ('selector', 'key', 'simple')
+
+    def __init__(self, selector: str):
+        self.selector = selector
+        self.key = None       # ('id'|'class'|'attr'|'tag', değer) ya da None (indekslenemez)
+        self.simple = False   # Anahtar eşleşmesi tek başına yeterli mi?
+        if ',' in selector:
+            return  # Seçici listeleri doğrudan select ile çalıştırılır
+
+        compounds = _split_compounds(selector)
+        if not compounds:
+            return
+        match = _COMPOUND_RE.match(compounds[-1])
+        tag, rest = match.group('tag'), match.group('rest')
+
+        ids, classes, attrs = [], [], []
+        has_value_or_pseudo = False
+        position = 0
+        while position < len(rest):
+            part = _PART_RE.match(rest, position)
+            if not part:
+                return  # Tanınmayan sözdizimi: indekslenemez
+            if part.group('id'):
+                ids.append(part.group('id'))
+            elif part.group('cls'):
+                classes.append(part.group('cls'))
+            elif part.group('attr'):
+                attrs.append(part.group('attr').lower())
+                has_value_or_pseudo = has_value_or_pseudo or bool(part.group('op'))
+            else:
+                has_value_or_pseudo = True
+            position = part.end()
+
+        # En seçici anahtar: id > class > nitelik > etiket
+        if ids:
+            self.key = ('id', ids[0])
+        elif classes:
+            self.key = ('class', classes[0])
+        elif attrs:
+            self.key = ('attr', attrs[0])
+        elif tag and tag != '*':
+            self.key = ('tag', tag.lower())
+        else:
+            return
+
+        components = len(ids) + len(classes) + len(attrs) + (1 if tag and tag != '*' else 0)
+        self.simple = len(compounds) == 1 and components == 1 and not has_value_or_pseudo
+
+
+class SelectorPlan:
+    """Seçici listelerinden derlenen, sayfa başına tek geçişte çalışan çıkarım planı"""
+
+    def __init__(self, selectors):
+        self.compiled = {}
+        for selector in selectors:
+            if selector not in self.compiled:
+                self.compiled[selector] = CompiledSelector(selector)
+
+        self._needed = {'id': set(), 'class': set(), 'attr': set(), 'tag': set()}
+        for compiled in self.compiled.values():
+            if compiled.key:
+                self._needed[compiled.key[0]].add(compiled.key[1])
+
+    def run(self, backend, document):
+        """Belgeyi bir kez dolaşıp aday indeksini kurar"""
+        if not getattr(backend, 'indexed_plans', False):
+            return PlanMatches(self, backend, document, None)
+
+        ids, classes, attrs, tags = (self._needed['id'], self._needed['class'],
+                                     self._needed['attr'], self._needed['tag'])
+        index = defaultdict(list)
+        for node, tag, element_id, class_names, attr_names in backend.iter_element_keys(document):
+            if tag in tags:
+                index[('tag', tag)].append(node)
+            if element_id and element_id in ids:
+                index[('id', element_id)].append(node)
+            for class_name in class_names:
+                if class_name in classes:
+                    index[('class', class_name)].append(node)
+            for attr_name in attr_names:
+                if attr_name in attrs:
+                    index[('attr', attr_name)].append(node)
+        return PlanMatches(self, backend, document, index)
+
+
+class PlanMatches:
+    """Bir sayfa için plan sonucu; seçici eşleşmelerini `select_one`/`select` sırasıyla verir"""
+
+    def __init__(self, plan, backend, document, index):
+        self.plan = plan
+        self.backend = backend
+        self.document = document
+        self._index = index
+        self.indexed = index is not None
+        self._matchers = {}
+        self._selected = {}  # İndekssiz çalışmada seçici -> select sonucu
+
+    def _compiled(self, selector):
+        compiled = self.plan.compiled.get(selector)
+        return compiled if compiled is not None else CompiledSelector(selector)
+
+    def _select(self, selector):
+        matches = self._selected.get(selector)
+        if matches is None:
+            matches = self.document.select(selector)
+            self._selected[selector] = matches
+        return matches
+
+    def _iter_matches(self, selector):
+        compiled = self._compiled(selector)
+        if self._index is None or compiled.key is None:
+            yield from self._select(selector)
+            return
+
+        candidates = self._index.get(compiled.key, ())
+        if compiled.simple:
+            yield from candidates
+            return
+
+        matcher = self._matchers.get(selector)
+        if matcher is None:
+            matcher = self.backend.matcher(self.document, selector)
+            self._matchers[selector] = matcher
+        for node in candidates:
+            if matcher(node):
+                yield node
+
+    def first(self, selector, accept=None):
+        """Belge sırasında ilk eşleşen düğüm (`accept` verilirse onu da sağlayan ilk düğüm)"""
+        if self._index is None and accept is None and selector not in self._selected:
+            return self.document.select_one(selector)
+        for node in self._iter_matches(selector):
+            if accept is None or accept(node):
+                return node
+        return None
+
+    def all(self, selector):
+        """Belge sırasında tüm eşleşen düğümler"""
+        return list(self._iter_matches(selector))
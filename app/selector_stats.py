@@ -0,0 +1,108 @@
+import threading
+
+
+# Sıralaması öğrenilen NewsSiteConfig seçici grupları
+SELECTOR_GROUPS = ('article_link_selectors', 'title_selectors', 'date_selectors', 'content_selectors')
+
+
+class SelectorStats:
+    """Site bazında seçici isabet/ıska istatistikleri.
+
+    Başlık, tarih ve içerik seçicileri sırayla denenir ve ilk işe yarayanda
+    durulur; bu yüzden her sayfada kazanan seçici bir isabet, ondan önce
+    denenenler birer ıska alır. Link seçicileri birlikte çalıştığı için her
+    biri geçerli link bulup bulmamasına göre sayılır. İstatistikler
+    NewsSiteConfig ile birlikte JSON olarak saklanır; sonraki çalıştırmalarda
+    seçiciler isabet oranına göre sıralanır ve hiç isabet almayanlar elenir.
+
+    Aynı siteyi eşzamanlı tarayan işler dosyaya yazarken birbirinin
+    sayımlarını ezmesin diye, son kayıttan bu yana biriken sayımlar ayrıca
+    izlenir (bkz. `split_pending`, `NewsSiteConfig.save`).
+    """
+
+    def __init__(self, data: dict = None):
+        # {grup: {seçici: [isabet, ıska]}}
+        self._data = {group: {selector: list(counts) for selector, counts in selectors.items()}
+                      for group, selectors in (data or {}).items()}
+        # Kaydedilmiş (ya da kayıttan yüklenmiş) sayımlar; farkı henüz yazılmamış sayımlardır
+        self._saved = merge_counts({}, self._data)
+        self._lock = threading.Lock()
+
+    def record(self, group, selector, hit):
+        with self._lock:
+            counts = self._data.setdefault(group, {}).setdefault(selector, [0, 0])
+            counts[0 if hit else 1] += 1
+
+    def record_attempts(self, group, tried, winner=None):
+        """Sırayla denenen seçicileri yazar: kazanan isabet, diğerleri ıska"""
+        with self._lock:
+            selectors = self._data.setdefault(group, {})
+            for selector in tried:
+                counts = selectors.setdefault(selector, [0, 0])
+                counts[0 if selector == winner else 1] += 1
+
+    def counts(self, group, selector):
+        """(isabet, ıska) çifti; hiç denenmemişse (0, 0)"""
+        with self._lock:
+            hits, misses = self._data.get(group, {}).get(selector, (0, 0))
+        return hits, misses
+
+    def hit_rate(self, group, selector):
+        """Laplace düzeltmeli isabet oranı; denenmemiş seçiciler 0.5 ile başlar"""
+        hits, misses = self.counts(group, selector)
+        return (hits + 1) / (hits + misses + 2)
+
+    def rank(self, group, selectors, min_trials: int = 20, prune: bool = True):
+        """Seçicileri isabet oranına göre sıralar; (yeni sıra, elenenler) döndürür.
+
+        Eşit oranlarda mevcut sıra korunur. `prune` açıksa en az `min_trials`
+        kez denenip hiç isabet almayan seçiciler, grupta isabet alan başka
+        bir seçici olduğu sürece listeden çıkarılır.
+        """
+        ordered = sorted(selectors, key=lambda selector: -self.hit_rate(group, selector))
+        if not prune or not any(self.counts(group, selector)[0] for selector in ordered):
+            return ordered, []
+
+        kept, pruned = [], []
+        for selector in ordered:
+            hits, misses = self.counts(group, selector)
+            if hits == 0 and misses >= min_trials:
+                pruned.append(selector)
+            else:
+                kept.append(selector)
+        return kept, pruned
+
+    def split_pending(self):
+        """(kaydedilmiş sayımlar, son kayıttan bu yana biriken sayımlar) çifti"""
+        with self._lock:
+            pending = {}
+            for group, selectors in self._data.items():
+                saved = self._saved.get(group, {})
+                for selector, (hits, misses) in selectors.items():
+                    saved_hits, saved_misses = saved.get(selector, (0, 0))
+                    if hits != saved_hits or misses != saved_misses:
+                        pending.setdefault(group, {})[selector] = [hits - saved_hits, misses - saved_misses]
+            return merge_counts({}, self._saved), pending
+
+    def mark_saved(self, pending: dict):
+        """`split_pending` ile alınan sayımları kaydedilmiş sayar"""
+        with self._lock:
+            self._saved = merge_counts(self._saved, pending)
+
+    def to_dict(self):
+        with self._lock:
+            return {group: {selector: list(counts) for selector, counts in selectors.items()}
+                    for group, selectors in self._data.items()}
+
+
+def merge_counts(base: dict, extra: dict):
+    """İki {grup: {seçici: [isabet, ıska]}} sözlüğünün toplamını yeni sözlük olarak döndürür"""
+    merged = {group: {selector: list(counts) for selector, counts in selectors.items()}
+              for group, selectors in base.items()}
+    for group, selectors in extra.items():
+        target = merged.setdefault(group, {})
+        for selector, (hits, misses) in selectors.items():
+            counts = target.setdefault(selector, [0, 0])
+            counts[0] += hits
+            counts[1] += misses
+    return merged
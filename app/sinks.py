@@ -0,0 +1,175 @@
+"""Haber sonuçları için yalnızca sona ekleyen (append-only) yazıcılar.
+
+Tarayıcı haberleri tek tek döndürdükçe sink'e yazılır; kayıtlar bellekte
+yalnızca `batch_size` kadar bekletilir ve her partide diske yazılıp
+`fsync` ile kalıcı hale getirilir. Böylece binlerce haberlik taramalarda
+bellek sabit kalır ve tarama yarıda kesilse bile tamamlanan partiler
+kaybolmaz.
+
+    with open_sink('haberler.csv') as sink:
+        for news_item in scraper.iter_news_by_time_range(start, end):
+            sink.write(news_item)
+"""
+import csv
+import json
+import os
+
+
+# Scraper çıktı satırlarının sütun sırası
+NEWS_COLUMNS = ['Haber Başlığı', 'Haber Metni', 'Haber Linki', 'Tarih', 'Kaynak']
+
+
+class _BatchSink:
+    """Kayıtları partiler halinde yazan sink'lerin ortak tabanı"""
+
+    def __init__(self, path: str, batch_size: int = 50, columns: list = None):
+        self.path = path
+        self.batch_size = max(1, int(batch_size))
+        self.columns = list(columns or NEWS_COLUMNS)
+        self.written = 0
+        self._buffer = []
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def write(self, item: dict):
+        self._buffer.append(item)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def write_all(self, items):
+        """Bir iterable'daki tüm kayıtları yazar; yazılan kayıt sayısını döndürür"""
+        count = 0
+        for item in items:
+            self.write(item)
+            count += 1
+        self.flush()
+        return count
+
+    def flush(self):
+        if not self._buffer:
+            return
+        self._write_batch([{column: item.get(column) for column in self.columns} for item in self._buffer])
+        self.written += len(self._buffer)
+        self._buffer = []
+
+    def _write_batch(self, rows):
+        raise NotImplementedError
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _append_text(path, encoding, write):
+    """Dosyayı ekleme kipinde açar, yazar ve diske kalıcı olarak işler"""
+    with open(path, 'a', encoding=encoding, newline='') as f:
+        write(f)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+class CsvSink(_BatchSink):
+    """CSV sink'i; dosya yoksa başlık satırı yazılır, varsa sonuna eklenir.
+
+    Mevcut bir dosyaya eklerken başlık satırı `columns` ile aynı olmalıdır;
+    farklıysa satırlar yanlış sütunlara düşmesin diye ValueError yükseltilir.
+    Varsayılan kodlama Excel'in Türkçe karakterleri doğru açması için
+    'utf-8-sig' (BOM yalnızca dosya başına yazılır).
+    """
+
+    def __init__(self, path: str, batch_size: int = 50, columns: list = None, encoding: str = 'utf-8-sig'):
+        super().__init__(path, batch_size, columns)
+        self.encoding = encoding
+        self._check_existing_header()
+
+    def _check_existing_header(self):
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            return
+        with open(self.path, 'r', encoding=self.encoding, newline='') as f:
+            header = next(csv.reader(f), [])
+        if header and header[0].startswith('\ufeff'):
+            header[0] = header[0][1:]  # BOM'lu dosya farklı kodlamayla açıldıysa
+        if header != self.columns:
+            raise ValueError(f"{self.path} başlığı beklenen sütunlarla uyuşmuyor: "
+                             f"{header} != {self.columns}")
+
+    def _write_batch(self, rows):
+        write_header = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+
+        def write(f):
+            writer = csv.DictWriter(f, fieldnames=self.columns)
+            if write_header:
+                writer.writeheader()
+            writer.writerows(rows)
+
+        _append_text(self.path, self.encoding, write)
+
+
+class JsonlSink(_BatchSink):
+    """JSON Lines sink'i; her satır bir haber"""
+
+    def _write_batch(self, rows):
+        def write(f):
+            for row in rows:
+                f.write(json.dumps(row, ensure_ascii=False) + '\n')
+
+        _append_text(self.path, 'utf-8', write)
+
+
+class ParquetSink(_BatchSink):
+    """Parquet sink'i (pyarrow gerekir).
+
+    Parquet dosyasının alt bilgisi (footer) kapanışta yazıldığı için tek
+    dosyaya eklemek çökme anında tüm veriyi kaybettirir. Bu yüzden `path`
+    bir klasördür ve her parti ayrı bir `part-NNNNN.parquet` dosyası olarak
+    atomik yazılır; klasör `pd.read_parquet(path)` ile tek tablo olarak okunur.
+    """
+
+    def __init__(self, path: str, batch_size: int = 500, columns: list = None):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            raise ImportError("Parquet çıktısı için pyarrow gerekli: pip install pyarrow") from e
+        super().__init__(path, batch_size, columns)
+        os.makedirs(path, exist_ok=True)
+        self._part = len([name for name in os.listdir(path) if name.endswith('.parquet')])
+
+    def _write_batch(self, rows):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pylist(rows, schema=pa.schema([(column, pa.string()) for column in self.columns]))
+        target = os.path.join(self.path, f'part-{self._part:05d}.parquet')
+        temporary = target + '.tmp'
+        pq.write_table(table, temporary)
+        os.replace(temporary, target)  # Yarım yazılmış parça okunmaz
+        self._part += 1
+
+
+_SINKS = {
+    '.csv': CsvSink,
+    '.jsonl': JsonlSink,
+    '.parquet': ParquetSink
+}
+
+
+def has_existing_output(path: str):
+    """Çıktı yolunda daha önce yazılmış veri var mı (dolu dosya veya parça içeren Parquet klasörü)"""
+    if os.path.isdir(path):
+        return any(name.endswith('.parquet') for name in os.listdir(path))
+    return os.path.exists(path) and os.path.getsize(path) > 0
+
+
+def open_sink(path: str, **kwargs):
+    """Dosya uzantısına göre (.csv, .jsonl, .parquet) uygun sink'i oluşturur"""
+    extension = os.path.splitext(path.rstrip('/\\'))[1].lower()
+    if extension not in _SINKS:
+        raise ValueError(f"Desteklenmeyen çıktı biçimi: {extension or path}. Seçenekler: {', '.join(_SINKS)}")
+    return _SINKS[extension](path, **kwargs)
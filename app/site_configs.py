@@ -0,0 +1,91 @@
+"""Bilinen haber siteleri için hazır NewsSiteConfig tanımları.
+
+Arayüz (streamlit_app.py) ve komut satırı (app/cli.py) aynı tanımları
+kullanır; bu modül streamlit gibi arayüz bağımlılıklarını içe aktarmaz.
+"""
+from urllib.parse import urlparse
+
+from .scraper import NewsSiteConfig
+
+
+def _hurriyet_config(domain):
+    return NewsSiteConfig(
+        base_url=f"https://{domain}",
+        listing_page_paths=["/gundem/", "/", "/son-dakika/"],
+        article_link_selectors=[
+            'a[href*="/gundem/"]',
+            'a[href*="/haber/"]',
+            '.news-item a',
+            '.article-link'
+        ],
+        title_selectors=['h1', '.news-title', '.article-title'],
+        content_selectors=[
+            '.news-content',
+            '.article-content',
+            '.content',
+            '.news-text',
+            'div[data-news-content]'
+        ],
+        discovery_mode='sitemap',  # news-sitemap/RSS, bulunamazsa listeleme sayfaları
+        date_selectors=[
+            'time[datetime]',
+            '.news-datetime',
+            '.article-date',
+            '[data-date]',
+            '.date-time'
+        ],
+        turkish_date_parsing_enabled=True
+    )
+
+
+def _ntv_config(domain):
+    return NewsSiteConfig(
+        base_url=f"https://{domain}",
+        listing_page_paths=["/", "/son-dakika", "/turkiye", "/dunya"], # NTV için ana sayfalar
+        article_link_selectors=[
+            'a[data-story-channel="headline"]',
+            'li.related-news-item a.card-link',
+            'h3.ntv-main-slider-item-first-title a',
+            'a[href*=".ntv.com.tr/"]' # Daha genel bir link seçici
+        ],
+        title_selectors=['h1', 'meta[property="og:title"]', 'meta[name="title"]'],
+        content_selectors=['div.category-detail-content', 'div[itemprop="articleBody"]', 'div#contentBodyArea'],
+        date_selectors=['meta[name="datePublished"]', 'span.date', 'time', '.pubdate'],
+        discovery_mode='sitemap',
+        turkish_date_parsing_enabled=False # NTV ISO formatını kullandığı için
+    )
+
+
+def _generic_config(url):
+    # Varsayılan veya genel bir konfigürasyon, özelleştirme gerekebilir
+    return NewsSiteConfig(
+        base_url=url,
+        listing_page_paths=["/"] ,
+        article_link_selectors=['a[href]', '.news-link a', '.article-card a', '.article-item a', '.post-link'],
+        title_selectors=['h1', 'h2.title', '.article-title', 'meta[property="og:title"]', 'meta[name="title"]'],
+        content_selectors=['div.content-body', '.article-content', 'div[itemprop="articleBody"]', 'div.entry-content', 'div.single-post-content'],
+        date_selectors=['time', '.date', '.pubdate', '[data-timestamp]', 'span.post-date', 'div.date-time'],
+        turkish_date_parsing_enabled=False # Varsayılan olarak Türkçe olmayan siteler için False
+    )
+
+
+# Domain parçası -> konfigürasyon üreticisi
+SITE_CONFIGS = {
+    'hurriyet.com.tr': _hurriyet_config,
+    'ntv.com.tr': _ntv_config
+}
+
+
+def is_known_site(url: str) -> bool:
+    """URL için özel bir konfigürasyon tanımlı mı?"""
+    domain = urlparse(url).netloc
+    return any(key in domain for key in SITE_CONFIGS)
+
+
+def get_site_config(url: str) -> NewsSiteConfig:
+    """Verilen URL'ye göre uygun NewsSiteConfig'i döndürür; bilinmeyen siteler için genel seçiciler"""
+    domain = urlparse(url).netloc
+    for key, factory in SITE_CONFIGS.items():
+        if key in domain:
+            return factory(domain)
+    return _generic_config(url)
@@ -1,8 +1,87 @@
 import streamlit as st
 import pandas as pd
-from .trend_analyzer import TrendAnalyzer
+from .trend_analyzer import PEAK_HOUR_LABELS, TrendAnalyzer
+from .trend_ingest import read_trends_files
+import hashlib
 import io
-import plotly.express as px
+
+# plotly.express (~0.3 sn) yalnızca grafik çizilecekken yüklenir; bu modülün
+# kendisi de portalda yalnızca Google Trends aracı seçildiğinde içe aktarılır.
+
+SAMPLE_DATA_PATH = "ornekdata.csv"
+TREND_STORE_PATH = ".yeb_cache/trends_store"
+
+
+def file_fingerprint(*contents: bytes) -> str:
+    """Yüklenen dosyaların (sırasıyla) içerik özeti; önbellek anahtarı olarak kullanılır"""
+    digest = hashlib.sha1()
+    for data in contents:
+        digest.update(hashlib.sha1(data).digest())
+    return digest.hexdigest()
+
+
+@st.cache_data(max_entries=4, show_spinner="Veri okunuyor...")
+def load_trends_data(fingerprint: str, _contents: list) -> pd.DataFrame:
+    """CSV dosyalarını parça parça okuyup 'Zaman' üzerinde tek tabloda birleştirir.
+
+    'Zaman' okuma sırasında bir kez çözülür (bkz. app/trend_ingest.py).
+    Önbellek anahtarı yalnızca `fingerprint`tir; `_contents` (büyük dosya
+    içerikleri) her yeniden çalıştırmada yeniden özetlenmez.
+    """
+    return read_trends_files([io.BytesIO(data) for data in _contents])
+
+
+@st.cache_resource
+def get_trend_store():
+    """Kalıcı Trends deposu (tüm oturumlarda ortak); pyarrow yoksa None"""
+    from .trend_store import TrendStore
+    try:
+        return TrendStore(TREND_STORE_PATH)
+    except ImportError:
+        return None
+
+
+@st.cache_data(max_entries=32, show_spinner="Depodan okunuyor...")
+def load_store_range(version: str, start_datetime, end_datetime) -> pd.DataFrame:
+    """Depodan yalnızca seçilen aralığı okur; `version` depo her güncellendiğinde değişir"""
+    return get_trend_store().query(start_datetime, end_datetime)
+
+
+@st.cache_resource(max_entries=4, show_spinner="Veri hazırlanıyor...")
+def get_base_analyzer(fingerprint: str, _df: pd.DataFrame) -> TrendAnalyzer:
+    """Tüm veri için bir kez kurulan, sıralı DatetimeIndex üzerindeki analyzer.
+
+    Nesne yeniden çalıştırmalar arasında kopyalanmadan paylaşılır; aralık
+    analizleri bundan `between` ile (ikili aramayla) türetilir ve onu değiştirmez.
+    """
+    return TrendAnalyzer(_df)
+
+
+@st.cache_data(max_entries=32, show_spinner="Analiz ediliyor...")
+def analyze_time_range(fingerprint: str, start_datetime, end_datetime, _df: pd.DataFrame) -> dict:
+    """Seçilen aralık için filtreleme, ön işleme ve analiz sonuçları.
+
+    Anahtar (dosya özeti, başlangıç, bitiş) olduğu için aynı aralığa dönmek
+    veya grafiklerle etkileşmek tüm hattı yeniden çalıştırmaz.
+    """
+    # Aralık, sıralı indeks üzerinde ikili aramayla kesilir (tüm satırları tarayan maske yok);
+    # dilim yeniden dönüştürülmez, yalnızca 'Tarih' ve 'Saat' sütunları kurulur
+    analyzer = get_base_analyzer(fingerprint, _df).between(start_datetime, end_datetime)
+    filtered_df = analyzer.df
+    if filtered_df.empty:
+        return {'filtered_df': filtered_df, 'average_counts': {}, 'summary': pd.DataFrame(),
+                'overall_daily_peaks': pd.DataFrame(), 'hourly_profile': pd.DataFrame()}
+
+    analyzer.add_total_column('Toplam Aranma')
+    return {
+        'filtered_df': filtered_df,
+        'average_counts': analyzer.get_average_search_counts(),
+        'summary': analyzer.get_summary(),  # Grafiklerdeki ortalama ve zirve değerleri
+        'overall_daily_peaks': analyzer.get_overall_daily_peaks(),
+        # Ortalamalar, günlük zirveler ve profil saatlik satırlar yerine toplam tablolarından (rollup) okunur
+        'hourly_profile': analyzer.get_hourly_profile()
+    }
+
 
 def run_trends_app():
     # st.set_page_config(
@@ -16,40 +95,71 @@ def run_trends_app():
     st.markdown("Bu uygulama, yüklediğiniz Google Trends verilerini analiz ederek anahtar kelimelerin günlük ve genel arama eğilimlerini, zirve noktalarını ve ortalama arama hacimlerini interaktif grafiklerle görselleştirir.")
 
     st.header("Veri Yükleme")
-    uploaded_file = st.file_uploader("Analiz etmek istediğiniz Google Trends verilerini içeren bir CSV dosyası yükleyin.", type=["csv"])
+    uploaded_files = st.file_uploader("Analiz etmek istediğiniz Google Trends verilerini içeren CSV dosyalarını yükleyin (birden fazla dosya 'Zaman' üzerinde birleştirilir).", type=["csv"], accept_multiple_files=True)
 
+    store = get_trend_store()
     df = None
-    if uploaded_file is not None:
+    fingerprint = None
+    store_version = None  # Kayıtlı veri kullanılıyorsa depo sürümü
+    if uploaded_files:
+        st.session_state.pop('trends_use_sample', None)
+        st.session_state.pop('trends_use_store', None)
         try:
-            df = pd.read_csv(uploaded_file, skiprows=2)
-            st.success("CSV dosyası başarıyla yüklendi!")
+            # Dosya özeti yükleme başına bir kez hesaplanır
+            contents = [uploaded_file.getvalue() for uploaded_file in uploaded_files]
+            file_ids = tuple(uploaded_file.file_id for uploaded_file in uploaded_files)
+            cached = st.session_state.get('trends_upload')
+            if cached is None or cached[0] != file_ids:
+                st.session_state['trends_upload'] = (file_ids, file_fingerprint(*contents))
+            fingerprint = st.session_state['trends_upload'][1]
+            df = load_trends_data(fingerprint, contents)
+            st.success(f"{len(uploaded_files)} CSV dosyası başarıyla yüklendi!" if len(uploaded_files) > 1
+                       else "CSV dosyası başarıyla yüklendi!")
             with st.expander("Yüklenen Verinin İlk 5 Satırını Görüntüle"):
                 st.dataframe(df.head())
+            if store is not None and st.button("Yüklenen Veriyi Depoya Ekle"):
+                # Yalnızca verinin düştüğü aylar yeniden yazılır; sonraki oturumlarda yeniden yükleme gerekmez
+                months = store.append(df)
+                st.success(f"Veri depoya eklendi ({len(months)} ay güncellendi).")
 
         except Exception as e:
             st.error(f"Dosya yüklenirken bir hata oluştu: {e}")
             st.info("Lütfen dosyanın doğru CSV formatında olduğundan ve 'Zaman' sütununun bulunduğundan emin olun.")
-    elif st.button("Örnek Veri 'ornekdata.csv' Kullan"):
+    elif store is not None and not store.is_empty() and (
+            st.session_state.get('trends_use_store') or st.button("Kayıtlı Veriyi Kullan (Depo)")):
+        st.session_state.pop('trends_use_sample', None)
+        # Zaman aralığı değiştirildiğinde kayıtlı veri seçili kalsın
+        st.session_state['trends_use_store'] = True
+        store_version = store.version()
+        st.success(f"Kayıtlı veri kullanılıyor ({len(store.months())} ay, {len(store.keywords())} anahtar kelime).")
+    elif st.button("Örnek Veri 'ornekdata.csv' Kullan") or st.session_state.get('trends_use_sample'):
         try:
-            df = pd.read_csv("ornekdata.csv", skiprows=2)
+            with open(SAMPLE_DATA_PATH, 'rb') as f:
+                data = f.read()
+            fingerprint = file_fingerprint(data)
+            df = load_trends_data(fingerprint, [data])
+            # Zaman aralığı değiştirildiğinde örnek veri seçili kalsın
+            st.session_state['trends_use_sample'] = True
             st.success("Örnek veri 'ornekdata.csv' başarıyla yüklendi!")
             with st.expander("Örnek Verinin İlk 5 Satırını Görüntüle"):
                 st.dataframe(df.head())
         except FileNotFoundError:
+            st.session_state.pop('trends_use_sample', None)
             st.error("`ornekdata.csv` dosyası bulunamadı. Lütfen projenin kök dizininde olduğundan emin olun.")
         except Exception as e:
+            st.session_state.pop('trends_use_sample', None)
             st.error(f"Örnek veri yüklenirken bir hata oluştu: {e}")
 
-    if df is not None and not df.empty:
-        # 'Zaman' sütununu datetime objesine dönüştür, analiz ve filtreleme için gerekli
-        df['Zaman'] = pd.to_datetime(df['Zaman'], format='%Y-%m-%dT%H')
-
+    if (df is not None and not df.empty) or store_version is not None:
         st.markdown("---")
         st.header("2. Zaman Aralığı Seçimi ve Analiz")
 
-        # Zaman aralığı seçimi için min/max değerleri
-        min_datetime_data = df['Zaman'].min()
-        max_datetime_data = df['Zaman'].max()
+        # Zaman aralığı seçimi için min/max değerleri (depoda yalnızca Parquet istatistikleri,
+        # yüklenen veride sıralı indeksin iki ucu okunur)
+        if store_version is not None:
+            min_datetime_data, max_datetime_data = store.time_bounds()
+        else:
+            min_datetime_data, max_datetime_data = get_base_analyzer(fingerprint, df).time_bounds()
 
         col1, col2 = st.columns(2)
 
@@ -70,115 +180,67 @@ def run_trends_app():
         start_datetime_filter = datetime.combine(start_date_input, start_time_input)
         end_datetime_filter = datetime.combine(end_date_input, end_time_input)
 
-        # Seçilen zaman aralığına göre DataFrame'i filtrele
-        filtered_df = df[(df['Zaman'] >= start_datetime_filter) & (df['Zaman'] <= end_datetime_filter)]
-
-        # 'Tarih' ve 'Saat' sütunlarını burada oluştur
-        filtered_df['Tarih'] = filtered_df['Zaman'].dt.date
-        filtered_df['Saat'] = filtered_df['Zaman'].dt.hour
+        if store_version is not None:
+            # Depodan yalnızca seçilen aralığa düşen aylar/satır grupları okunur
+            df = load_store_range(store_version, start_datetime_filter, end_datetime_filter)
+            # Depodan okunan tablo aralığa özgüdür; temel analyzer da aralık başına kurulur
+            fingerprint = f"store-{store_version}-{start_datetime_filter}-{end_datetime_filter}"
+        analysis = analyze_time_range(fingerprint, start_datetime_filter, end_datetime_filter, df)
+        filtered_df = analysis['filtered_df']
 
         if filtered_df.empty:
             st.warning("Seçilen tarih aralığında veri bulunamadı. Lütfen farklı bir aralık seçin.")
         else:
-            search_columns = [col for col in filtered_df.columns if col not in ['Zaman', 'Tarih', 'Saat']]
-            if search_columns:
-                filtered_df['Toplam Aranma'] = filtered_df[search_columns].sum(axis=1)
-            
-            analyzer = TrendAnalyzer(filtered_df)
+            average_counts = analysis['average_counts']
+            summary = analysis['summary']
 
             st.subheader("Analiz Sonuçları")
             
             st.write("Aşağıda seçilen zaman aralığına göre anahtar kelimelerin ortalama aranma sayıları ve günlük en yüksek zirve noktaları bulunmaktadır.")
 
             st.markdown("**Ortalama Aranma Sayıları**")
-            avg_counts = analyzer.get_average_search_counts()
-            if avg_counts:
-                avg_df = pd.DataFrame([avg_counts]).T.reset_index()
+            if average_counts:
+                avg_df = pd.DataFrame([average_counts]).T.reset_index()
                 avg_df.columns = ['Parametre', 'Ortalama Değer']
                 st.dataframe(avg_df)
             else:
                 st.info("Ortalama aranma sayıları hesaplanamadı.")
 
             st.markdown("**Günlük En Yüksek Zirve Noktaları**")
-            overall_daily_peaks_df = analyzer.get_overall_daily_peaks()
+            overall_daily_peaks_df = analysis['overall_daily_peaks']
 
             if not overall_daily_peaks_df.empty:
                 st.dataframe(overall_daily_peaks_df)
             else:
                 st.info("Günlük genel zirve saatleri bulunamadı. Yeterli veri veya arama hacmi olmayabilir.")
 
+            st.markdown("**Günün Saatlerine Göre Ortalama Aranma**")
+            hourly_profile = analysis['hourly_profile']
+            if not hourly_profile.empty:
+                hourly_profile = hourly_profile.set_axis(PEAK_HOUR_LABELS[hourly_profile.index], axis=0)
+                st.dataframe(hourly_profile.round(2))
+            else:
+                st.info("Saatlik profil hesaplanamadı.")
+
             st.markdown("---")
             st.header("Görsel Analizler")
+            # plotly yalnızca grafik çizilecekken yüklenir; seriler çizilmeden önce seyreltilir (bkz. app/trend_charts.py)
+            from .trend_charts import build_leaders_figure, build_total_figure
 
             # Toplam Aranma Hacmi Grafiği
             search_columns = [col for col in filtered_df.columns if col not in ['Zaman', 'Tarih', 'Saat']]
             if search_columns:
-                fig_total = px.line(filtered_df, x='Zaman', y='Toplam Aranma',
-                                    title='Toplam Aranma Hacmi (Tüm Liderler)',
-                                    labels={'Zaman': 'Tarih ve Saat', 'Toplam Aranma': 'Toplam Aranma Hacmi'},
-                                    hover_data={'Zaman': '|%Y-%m-%d %H:%M', 'Toplam Aranma': True})
-                
-                # Genel ortalama çizgisini ekle
-                general_average = analyzer.get_average_search_counts().get('Genel Ortalama', 0)
-                fig_total.add_hline(y=general_average, line_dash="dash", line_color="red", annotation_text=f"Ortalama: {general_average:.2f}", 
-                                    annotation_position="bottom right", annotation_font_color="red")
-
-                # Mutlak zirve noktasını (en tepe nokta) ekle
-                if not filtered_df.empty:
-                    max_total_value = filtered_df['Toplam Aranma'].max()
-                    max_total_time = filtered_df[filtered_df['Toplam Aranma'] == max_total_value]['Zaman'].iloc[0]
-                    
-                    fig_total.add_annotation(
-                        x=max_total_time,
-                        y=max_total_value,
-                        text=f"Zirve ({int(max_total_value)})",
-                        showarrow=True,
-                        arrowhead=1,
-                        ax=20,
-                        ay=-40,
-                        bgcolor="rgba(255, 255, 255, 0.8)",
-                        bordercolor="purple",
-                        borderwidth=1,
-                        borderpad=4,
-                        font=dict(color="purple", size=10)
-                    )
-
-                fig_total.update_layout(hovermode="x unified", xaxis_rangeslider_visible=True) # Zaman kaydırıcısını etkinleştir
+                fig_total = build_total_figure(filtered_df, 'Toplam Aranma', summary,
+                                               average_counts.get('Genel Ortalama', 0))
                 st.plotly_chart(fig_total, use_container_width=True)
             else:
                 st.info("Toplam aranma hacmi grafiği oluşturulamadı. Lider arama sütunları bulunamadı.")
 
-            # Lider Bazında Aranma Hacmi ve Zirve Noktaları Grafikleri
+            # Lider Bazında Aranma Hacmi ve Zirve Noktaları Grafikleri (lider başına ayrı figür yerine tek figür)
             st.subheader("Liderlere Göre Aranma Hacmi ve Zirve Noktaları")
-            for leader_col in search_columns:
-                fig_leader = px.line(filtered_df, x='Zaman', y=leader_col,
-                                     title=f'{leader_col} Aranma Hacmi',
-                                     labels={'Zaman': 'Tarih ve Saat', leader_col: 'Aranma Hacmi'},
-                                     hover_data={'Zaman': '|%Y-%m-%d %H:%M', leader_col: True})
-
-                # Liderin ortalama çizgisini ekle
-                leader_average = analyzer.get_average_search_counts().get(f'{leader_col} Ortalaması', 0)
-                fig_leader.add_hline(y=leader_average, line_dash="dash", line_color="blue", annotation_text=f"Ort: {leader_average:.2f}", 
-                                     annotation_position="bottom right", annotation_font_color="blue")
-
-                # Mutlak zirve noktasını (en tepe nokta) ekle
-                if not filtered_df.empty:
-                    max_leader_value = filtered_df[leader_col].max()
-                    max_leader_time = filtered_df[filtered_df[leader_col] == max_leader_value]['Zaman'].iloc[0]
-                    
-                    fig_leader.add_annotation(
-                        x=max_leader_time,
-                        y=max_leader_value,
-                        text=f"Zirve ({int(max_leader_value)})",
-                        showarrow=True,
-                        arrowhead=1,
-                        ax=20,
-                        ay=-40,
-                        bgcolor="rgba(255, 255, 255, 0.8)",
-                        bordercolor="red",
-                        borderwidth=1,
-                        borderpad=4,
-                        font=dict(color="red", size=10)
-                    )
-                fig_leader.update_layout(hovermode="x unified", xaxis_rangeslider_visible=True) # Zaman kaydırıcısını etkinleştir
-                st.plotly_chart(fig_leader, use_container_width=True) 
\ No newline at end of file
+            if search_columns:
+                layout = st.radio("Grafik düzeni", ["Ayrı paneller", "Tek grafik"], horizontal=True,
+                                  key='trends_chart_layout')
+                fig_leaders = build_leaders_figure(filtered_df, search_columns, summary, average_counts,
+                                                   layout='facet' if layout == "Ayrı paneller" else 'overlay')
+                st.plotly_chart(fig_leaders, use_container_width=True)
@@ -1,104 +1,441 @@
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 
+from .trend_rollups import TrendRollup, rollup_keys
+
+# Saat -> '15:00-16:00' etiketleri (günlük zirve tablolarında)
+PEAK_HOUR_LABELS = np.array([f"{hour:02d}:00-{hour + 1:02d}:00" for hour in range(24)], dtype=object)
+
+# Analiz dışı (türetilmiş) sütunlar
+NON_SEARCH_COLUMNS = ['Zaman', 'Tarih', 'Saat']
+
+# get_summary() tablosunun sütunları
+SUMMARY_COLUMNS = ['Ortalama', 'Maksimum', 'Zirve Zamanı', 'Q1', 'Medyan', 'Q3', 'Toplam']
+
+def compact_values(values: pd.Series) -> np.ndarray:
+    """Arama değerlerini en küçük uygun tipe çevirir.
+
+    Google Trends değerleri 0-100 arası tam sayılardır ve uint8'e sığar;
+    toplam gibi büyük tam sayılar en küçük uygun tam sayı tipine, kesirli
+    değerler float32'ye çevrilir. Sayıya çevrilemeyen değerler 0 olur.
+    """
+    numeric = pd.to_numeric(values, errors='coerce')
+    array = numeric.to_numpy(dtype='float64', na_value=0.0) if numeric.hasnans else numeric.to_numpy()
+    if array.dtype.kind in 'iub' or np.array_equal(array, np.floor(array)):
+        kind = 'unsigned' if len(array) == 0 or array.min() >= 0 else 'integer'
+        return pd.to_numeric(array, downcast=kind)
+    return array.astype('float32')
+
+
 class TrendAnalyzer:
-    def __init__(self, df: pd.DataFrame):
-        self.df = df.copy()
-        self._preprocess_data()
+    def __init__(self, df: pd.DataFrame, copy: bool = False):
+        """`df` değiştirilmez. Değerler dönüştürülürken zaten yeni diziler
+        oluştuğundan ayrıca tam kopya alınmaz; dönüşmeden aynen alınan
+        sütunların da kopyalanması için `copy=True` verilebilir.
+
+        Veri 'Zaman'a göre sıralanır ve sıralı bir `DatetimeIndex` üzerinde
+        tutulur; zaman aralığı ve gün dilimleri ikili aramayla (O(log n))
+        alınır (bkz. slice_range, slice_day, between)."""
+        self._summary_cache = None  # (veri anahtarı, özet tablo, genel ortalama)
+        self._rollups = {}  # seviye -> TrendRollup (bkz. get_rollup)
+        self._rollup_key = None
+        self._total_columns = {}  # add_total_column ile eklenen sütun -> kaynak sütunlar
+        self._preprocess_data(df, copy)
 
-    def _preprocess_data(self):
+    @classmethod
+    def from_store(cls, store, start=None, end=None, columns: list = None):
+        """[start, end] aralığını Parquet deposundan (bkz. app/trend_store.py) okuyup analiz eder;
+        yalnızca aralığa düşen aylar ve satır grupları diskten okunur."""
+        return cls(store.query(start, end, columns))
+
+    def _preprocess_data(self, df: pd.DataFrame, copy: bool = False):
         # 'Zaman' sütununu datetime objelerine dönüştür
         # CSV'nin başında fazladan satırlar olduğu için skiprows uygulaması kaldırıldı, artık veri Streamlit tarafında doğru okunuyor.
-        self.df['Zaman'] = pd.to_datetime(self.df['Zaman'], format='%Y-%m-%dT%H')
-        # Lider sütunlarını sayısal değere dönüştür, hataları NaN yap
-        for col in self.df.columns:
-            if col != 'Zaman':
-                self.df[col] = pd.to_numeric(self.df[col], errors='coerce').fillna(0) # NaN değerleri 0 ile doldur
-        
+        # (app/trend_ingest.py ile okunan veride zaten çözülmüştür; tekrar çözülmez)
+        times = df['Zaman']
+        if not pd.api.types.is_datetime64_any_dtype(times):
+            times = pd.to_datetime(times, format='%Y-%m-%dT%H')
+        times = times.to_numpy()
+        # Trends dışa aktarımları zaten sıralıdır; değilse satırlar bir kez (kararlı) sıralanır
+        order = None
+        if len(times) > 1 and not (times[1:] >= times[:-1]).all():
+            order = np.argsort(times, kind='stable')
+            times = times[order]
+        columns = {'Zaman': times}
+        # Lider sütunlarını küçük sayısal tiplere dönüştür, hatalı/boş değerler 0 olur
+        for col in df.columns:
+            if col not in NON_SEARCH_COLUMNS:
+                values = compact_values(df[col])
+                columns[col] = values[order] if order is not None else values
+        self.df = pd.DataFrame(columns, index=pd.DatetimeIndex(times), copy=copy)
+
         # Tarih ve Saat sütunlarını burada oluştur, böylece diğer metotlar kullanabilir
-        self.df['Tarih'] = self.df['Zaman'].dt.date
-        self.df['Saat'] = self.df['Zaman'].dt.hour
+        self._add_calendar_columns()
+
+    @classmethod
+    def _from_sorted(cls, df: pd.DataFrame):
+        """Zaten ön işlenmiş ve sıralı bir dilimden analyzer kurar (dönüştürme yapılmaz)"""
+        analyzer = cls.__new__(cls)
+        analyzer._summary_cache = None
+        analyzer._rollups = {}
+        analyzer._rollup_key = None
+        analyzer._total_columns = {}
+        analyzer.df = df
+        analyzer._add_calendar_columns()
+        return analyzer
+
+    def _add_calendar_columns(self):
+        """'Tarih' (gün kategorisi) ve 'Saat' (int8) sütunlarını ve gün başlangıç ofsetlerini oluşturur.
+
+        Veri sıralı olduğundan her gün ardışık bir satır bloğudur; günün
+        satırları `self._day_offsets[i]:self._day_offsets[i + 1]`
+        aralığındadır. Her satır için ayrı `date` nesnesi yerine gün başına
+        bir kategori tutulur.
+        """
+        days = self.df['Zaman'].to_numpy().astype('datetime64[D]')
+        starts = np.flatnonzero(np.r_[True, days[1:] != days[:-1]]) if len(days) else np.empty(0, dtype=np.intp)
+        self._day_offsets = np.append(starts, len(days))
+        codes = np.repeat(np.arange(len(starts), dtype='int32'), np.diff(self._day_offsets))
+        categories = pd.Index(pd.DatetimeIndex(days[starts]).date, dtype=object)
+        self.df['Tarih'] = pd.Categorical.from_codes(codes, categories=categories)
+        self.df['Saat'] = self.df['Zaman'].dt.hour.astype('int8')
+
+    def time_bounds(self):
+        """(en eski, en yeni) zaman; sıralı indeksten O(1) okunur, veri boşsa (None, None)"""
+        if self.df.empty:
+            return None, None
+        return self.df.index[0], self.df.index[-1]
+
+    def _range_positions(self, start=None, end=None, end_side: str = 'right'):
+        # NumPy araması farklı zaman birimlerini (us/ns) ortak birime çevirerek karşılaştırır
+        times = self.df.index.to_numpy()
+        lo = times.searchsorted(pd.Timestamp(start).to_datetime64(), 'left') if start is not None else 0
+        hi = times.searchsorted(pd.Timestamp(end).to_datetime64(), end_side) if end is not None else len(times)
+        return int(lo), int(max(lo, hi))
+
+    def slice_range(self, start=None, end=None):
+        """[start, end] aralığındaki satırlar (iki uç dahil); maske yerine ikili arama kullanır"""
+        lo, hi = self._range_positions(start, end)
+        return self.df.iloc[lo:hi]
+
+    def slice_day(self, day):
+        """Bir günün satırları ('2025-06-17', date veya Timestamp)"""
+        day = pd.Timestamp(day).normalize()
+        lo, hi = self._range_positions(day, day + pd.Timedelta(days=1), end_side='left')
+        return self.df.iloc[lo:hi]
+
+    def between(self, start=None, end=None):
+        """[start, end] aralığı için yeni bir TrendAnalyzer.
+
+        Dilim ikili aramayla alınır ve yeniden dönüştürülmez; yalnızca
+        dilimin 'Tarih'/'Saat' sütunları kurulur. Tüm veri için bir kez
+        kurulan analyzer'dan farklı aralıkları hızlıca analiz etmek içindir.
+        """
+        return self._from_sorted(self.slice_range(start, end))
+
+    def _rollup_data_key(self):
+        # Satırlar değişirse (yeni tablo veya farklı uzunluk) rollup'lar yeniden kurulur;
+        # yalnızca sütun eklenmesi (ör. toplam sütunu) mevcut tabloları genişletir
+        return id(self.df), len(self.df)
+
+    def _get_rollup(self, level: str, columns: list = None):
+        """Seviyenin TrendRollup tablosu; eksik sütunlar yalnızca o sütunlar taranarak eklenir"""
+        columns = self._search_columns() if columns is None else list(columns)
+        if self._rollup_key != self._rollup_data_key():
+            self._rollups = {}
+            self._rollup_key = self._rollup_data_key()
+
+        rollup = self._rollups.get(level)
+        missing = [col for col in columns if rollup is None or col not in rollup.columns]
+        if rollup is None or missing:
+            # Gün ofsetleri zaten bilindiğinden 'day' seviyesinde anahtar karşılaştırması yapılmaz
+            starts = self._day_offsets[:-1] if level == 'day' else None
+            added = TrendRollup.build(level, self.df['Zaman'].to_numpy(), self.df[missing].to_numpy(), missing, starts)
+            rollup = added if rollup is None else rollup.add_columns(added)
+            self._rollups[level] = rollup
+        return rollup.select(columns)
+
+    def get_rollup(self, level: str = 'day', columns: list = None):
+        """Seviyenin ('hour', 'day', 'week', 'hour_of_day') toplam tablosu.
+
+        Sütunlar (istatistik, anahtar kelime) çiftleridir: 'sum', 'mean',
+        'max', 'argmax' (maksimumun ilk görüldüğü zaman). Tablolar ilk
+        istekte bir kez hesaplanır ve önbellekte tutulur; `append` ile
+        eklenen satırlar mevcut tablolara artımlı olarak işlenir.
+        """
+        return self._get_rollup(level, columns).to_frame()
+
+    def get_hourly_profile(self, stat: str = 'mean', columns: list = None):
+        """Günün saatine göre (0-23) anahtar kelime profili; 'hour_of_day' tablosundan okunur"""
+        rollup = self._get_rollup('hour_of_day', columns)
+        return pd.DataFrame(rollup.stat(stat), index=pd.Index(rollup.keys, name='Saat'), columns=rollup.columns)
 
     def get_daily_peak_hours(self):
         # Her gün için en yüksek arama yapılan 1 saatlik aralığı bul
-        # Önce 'Tarih' sütununu oluştur
-        self.df['Tarih'] = self.df['Zaman'].dt.date
-        self.df['Saat'] = self.df['Zaman'].dt.hour
-
-        peak_hours_data = []
-
-        # Her tarih ve lider için en yüksek saati bul
-        for date in self.df['Tarih'].unique():
-            daily_df = self.df[self.df['Tarih'] == date]
-            for col in self.df.columns:
-                if col not in ['Zaman', 'Tarih', 'Saat']:
-                    max_value = daily_df[col].max()
-                    if max_value > 0: # Sadece pozitif arama hacmi olanları dikkate al
-                        peak_hour_row = daily_df[daily_df[col] == max_value]
-                        if not peak_hour_row.empty:
-                            # Aynı max değere sahip birden fazla saat varsa ilkini al
-                            peak_hour = peak_hour_row['Saat'].iloc[0]
-                            peak_hours_data.append({
-                                'Tarih': date,
-                                'Lider': col,
-                                'Peak Saat Aralığı': f"{peak_hour:02d}:00-{peak_hour+1:02d}:00",
-                                'Peak Değer': int(max_value)
-                            })
-        return pd.DataFrame(peak_hours_data)
+        # (ham satırlar yeniden taranmaz; önbellekteki günlük toplam tablosu okunur)
+        search_columns = self._search_columns()
+        if self.df.empty or not search_columns:
+            return pd.DataFrame()
+
+        # Her tarih ve lider için en yüksek saat günlük toplam tablosundan okunur
+        rollup = self._get_rollup('day', search_columns)
+        maxima = rollup.max
+        day_index, column_index = np.nonzero(maxima > 0)  # Sadece pozitif arama hacmi olanları dikkate al
+        if len(day_index) == 0:
+            return pd.DataFrame()
+
+        peak_times = rollup.argmax[day_index, column_index]
+        peak_hours = (peak_times - peak_times.astype('datetime64[D]')).astype('timedelta64[h]').astype('int64')
+        return pd.DataFrame({
+            'Tarih': np.asarray(pd.DatetimeIndex(rollup.keys).date, dtype=object)[day_index],
+            'Lider': np.asarray(search_columns, dtype=object)[column_index],
+            'Peak Saat Aralığı': PEAK_HOUR_LABELS[peak_hours].tolist(),
+            'Peak Değer': maxima[day_index, column_index].astype('int64')
+        })
+
+    def add_total_column(self, name: str = 'Toplam Aranma'):
+        """Tüm arama sütunlarının saatlik toplamını `name` sütunu olarak ekler; arama sütunu yoksa False"""
+        search_columns = self._search_columns()
+        if not search_columns:
+            return False
+        self.df[name] = compact_values(self.df[search_columns].sum(axis=1))
+        self._total_columns[name] = search_columns  # append ile gelen satırlarda da hesaplanır
+        return True
+
+    def append(self, df: pd.DataFrame):
+        """Yeni saatlik satırları ekler (ör. yeni bir Trends dışa aktarımı).
+
+        Çakışan saatlerde yeni dışa aktarımın değeri geçerlidir (bkz.
+        `merge_trend_frames`); eski satır düşülür, saat iki kez sayılmaz.
+        Yeni satırlar aynı anahtar kelimeleri içeriyorsa önbellekteki toplam
+        tabloları (rollup) yalnızca ilk yeni saatin grubundan itibaren
+        yeniden hesaplanır; 'hour_of_day' tablosu çakışma yoksa yeni
+        satırlarla birleştirilir, varsa ilk istekte baştan kurulur. Yeni
+        anahtar kelimeli eklemede tablolar baştan hesaplanır. Eksik anahtar
+        kelimeler 0 kabul edilir.
+        """
+        new = TrendAnalyzer(df).df.drop(columns=['Tarih', 'Saat'])
+        if new.index.has_duplicates:
+            new = new[~new.index.duplicated(keep='last')]
+        for name, sources in self._total_columns.items():
+            if name not in new.columns:
+                new[name] = compact_values(new.reindex(columns=sources, fill_value=0).sum(axis=1))
+        if new.empty:
+            return
+
+        # İlk yeni saatten önceki eski satırlar aynen kalır; sonrakilerden yeni verideki
+        # saatler düşülür, kalanlar yeni satırlarla zaman sırasına dizilir
+        old_times, new_times = self.df['Zaman'].to_numpy(), new['Zaman'].to_numpy()
+        cut = int(old_times.searchsorted(new_times[0], 'left'))
+        kept_tail = np.flatnonzero(~np.isin(old_times[cut:], new_times)) + cut
+        overlap = len(kept_tail) < len(old_times) - cut
+        tail_order = (np.argsort(np.concatenate([old_times[kept_tail], new_times]), kind='stable')
+                      if len(kept_tail) else None)
+
+        base_columns = [col for col in self.df.columns if col not in ('Tarih', 'Saat')]
+        columns = base_columns + [col for col in new.columns if col not in base_columns]
+        data = {}
+        for col in columns:
+            old = self.df[col].to_numpy() if col in self.df.columns else np.zeros(len(self.df), dtype='uint8')
+            added = new[col].to_numpy() if col in new.columns else np.zeros(len(new), dtype='uint8')
+            tail = np.concatenate([old[kept_tail], added])
+            data[col] = np.concatenate([old[:cut], tail if tail_order is None else tail[tail_order]])
+            if col != 'Zaman' and data[col].dtype != old.dtype:
+                data[col] = compact_values(pd.Series(data[col]))
+
+        incremental = columns == base_columns and not self.df.empty
+        original_order = list(self.df.columns)
+        rollups = self._rollups if incremental and self._rollup_key == self._rollup_data_key() else {}
+        if incremental:
+            self.df = pd.DataFrame(data, index=pd.DatetimeIndex(data['Zaman']))
+            self._add_calendar_columns()
+        else:
+            # Sıralama ve tip dönüşümü yeniden yapılır
+            self._preprocess_data(pd.DataFrame(data))
+        # Sütun sırası korunur (ör. toplam sütunu 'Tarih'/'Saat'ten sonra kalır)
+        self.df = self.df[[col for col in original_order if col in self.df.columns]
+                          + [col for col in self.df.columns if col not in original_order]]
+
+        self._rollups = {}
+        times = self.df['Zaman'].to_numpy()
+        for level, rollup in rollups.items():
+            if level == 'hour_of_day':
+                # Gruplar zamana göre ardışık değil; çakışmada eski saatin katkısı çıkarılamaz
+                if not overlap:
+                    self._rollups[level] = rollup.merge(TrendRollup.build(
+                        level, new_times, new[rollup.columns].to_numpy(), rollup.columns))
+                continue
+            # İlk yeni saatin grubu ve sonrası yeniden hesaplanır, öncesi aynen kalır
+            first_key = rollup_keys(new_times[:1], level)[0]
+            lo = int(times.searchsorted(first_key, 'left'))
+            self._rollups[level] = rollup.truncate(first_key).merge(TrendRollup.build(
+                level, times[lo:], self.df[rollup.columns].iloc[lo:].to_numpy(), rollup.columns))
+        self._rollup_key = self._rollup_data_key() if self._rollups else None
+
+    def _search_columns(self):
+        return [col for col in self.df.columns if col not in NON_SEARCH_COLUMNS]
+
+    def _summary_key(self):
+        # DataFrame değiştirilirse, sütun eklenir/çıkarılırsa veya satır sayısı değişirse özet yeniden hesaplanır
+        return id(self.df), self.df.shape, tuple(self.df.columns)
+
+    def invalidate_summary(self):
+        """Özet ve toplam tablosu (rollup) önbelleklerini temizler; self.df değerleri yerinde
+        değiştirildiyse çağrılmalıdır"""
+        self._summary_cache = None
+        self._rollups = {}
+        self._rollup_key = None
+
+    def _compute_summary(self):
+        search_columns = self._search_columns()
+        if not search_columns or self.df.empty:
+            summary = pd.DataFrame(np.nan, index=pd.Index(search_columns), columns=SUMMARY_COLUMNS)
+            summary['Zirve Zamanı'] = pd.NaT
+            return summary, (np.nan if search_columns else 0)
+
+        # Toplam, maksimum ve zirve zamanı günlük toplam tablosundan (rollup) türetilir;
+        # günlük zirveler ve ortalamalarla aynı hesaptan gelir. Zirve, maksimumun
+        # görüldüğü ilk günün ilk maksimum saatidir (eşitlikte en erken saat).
+        rollup = self._get_rollup('day', search_columns)
+        k = len(search_columns)
+        rows = rollup.count.sum()
+        totals = rollup.sum.sum(axis=0)
+        maxima = rollup.max.max(axis=0)
+        peak_days = (rollup.max == maxima).argmax(axis=0)
+        peak_times = rollup.argmax[peak_days, np.arange(k)]
+
+        # Çeyrekler tablodan türetilemez; sütun sütun, saklanan (kompakt) tip üzerinde
+        # hesaplanır, tüm tablonun float64 kopyası alınmaz
+        quantiles = np.empty((3, k))
+        for index, col in enumerate(search_columns):
+            quantiles[:, index] = np.quantile(self.df[col].to_numpy(), [0.25, 0.5, 0.75])
+
+        summary = pd.DataFrame({
+            'Ortalama': totals / rows,
+            'Maksimum': maxima,
+            'Zirve Zamanı': peak_times,
+            'Q1': quantiles[0],
+            'Medyan': quantiles[1],
+            'Q3': quantiles[2],
+            'Toplam': totals
+        }, index=pd.Index(search_columns))
+        return summary, totals.sum() / (rows * k)
+
+    def get_summary(self):
+        """Arama sütunlarının özet istatistikleri (ortalama, maksimum, zirve zamanı, çeyrekler, toplam).
+
+        Toplam, ortalama, maksimum ve zirve zamanı önbellekteki günlük toplam
+        tablosundan (bkz. get_rollup) türetilir; çeyrekler sütun başına
+        saklanan tip üzerinde hesaplanır. Sonuç veri değişene kadar
+        önbellekte tutulur. Satırlar sütun adlarıdır.
+        """
+        key = self._summary_key()
+        if self._summary_cache is None or self._summary_cache[0] != key:
+            summary, overall_mean = self._compute_summary()
+            self._summary_cache = (key, summary, overall_mean)
+        return self._summary_cache[1]
+
+    def get_overall_average(self):
+        """Tüm arama sütunlarındaki değerlerin ortalaması (önbellekli)"""
+        self.get_summary()
+        return self._summary_cache[2]
 
     def get_average_search_counts(self):
         # Toplam ve lider başına ortalama aranma sayısını göster
-        average_data = {}
-
-        # Her lider için ortalama
-        for col in self.df.columns:
-            if col not in ['Zaman', 'Tarih', 'Saat']:
-                average_data[f'{col} Ortalaması'] = self.df[col].mean()
+        # (ham satırlar yerine 24 satırlık gün içi profil tablosunun toplamlarından)
+        search_columns = self._search_columns()
+        rollup = self._get_rollup('hour_of_day', search_columns)
+        rows = rollup.count.sum()
+        totals = rollup.sum.sum(axis=0)
+        means = totals / rows if rows else np.full(len(search_columns), np.nan)
+        average_data = {f'{col} Ortalaması': mean for col, mean in zip(search_columns, means)}
 
         # Tüm liderlerin toplam ortalaması
-        search_columns = [col for col in self.df.columns if col not in ['Zaman', 'Tarih', 'Saat']]
-        if search_columns:
-            average_data['Genel Ortalama'] = self.df[search_columns].values.flatten().mean()
-        else:
+        if not search_columns:
             average_data['Genel Ortalama'] = 0
-
+        else:
+            average_data['Genel Ortalama'] = totals.sum() / (rows * len(search_columns)) if rows else np.nan
         return average_data
 
     def get_outliers(self, column_name):
         """IQR metodunu kullanarak aykırı değerleri (zirveleri) tespit eder."""
-        Q1 = self.df[column_name].quantile(0.25)
-        Q3 = self.df[column_name].quantile(0.75)
-        IQR = Q3 - Q1
-        upper_bound = Q3 + 1.5 * IQR
-
         # Sadece üst aykırı değerleri (zirveleri) alıyoruz
-        outliers = self.df[(self.df[column_name] > upper_bound)]
-        return outliers
+        return self.df[self.get_outlier_mask([column_name])[column_name]]
+
+    def _iqr_upper_bounds(self, quantiles, multiplier):
+        q1, q3 = quantiles
+        return q3 + multiplier * (q3 - q1)
+
+    def get_outlier_mask(self, columns=None, baseline: str = 'global', multiplier: float = 1.5,
+                         window='7D', min_periods: int = 24):
+        """Tüm sütunlar için üst aykırı değer (zirve) maskesini tek seferde hesaplar.
+
+        Değer `Q3 + multiplier * IQR` sınırını aşıyorsa True olur. Eşik
+        `baseline` ile seçilir:
+
+            'global'  - tüm veri (get_outliers ile aynı)
+            'rolling' - her satırdan önceki `window` süresi (ör. '7D'); en az
+                        `min_periods` gözlem yoksa zirve sayılmaz
+            'hour'    - günün aynı saatindeki değerler (mevsimsellik)
+
+        self.df ile aynı indeksli, sütun başına bir bool sütunlu DataFrame döndürür.
+        """
+        columns = list(columns) if columns is not None else self._search_columns()
+        values = self.df[columns]
+
+        if baseline == 'global':
+            # Tüm sütunların çeyrekleri tek quantile çağrısıyla
+            upper = self._iqr_upper_bounds(values.quantile([0.25, 0.75]).to_numpy(), multiplier)
+        elif baseline == 'hour':
+            hourly = values.groupby(self.df['Zaman'].dt.hour.to_numpy()).quantile([0.25, 0.75])
+            q1 = hourly.xs(0.25, level=1).reindex(range(24))
+            q3 = hourly.xs(0.75, level=1).reindex(range(24))
+            upper_by_hour = self._iqr_upper_bounds((q1.to_numpy(), q3.to_numpy()), multiplier)
+            upper = upper_by_hour[self.df['Zaman'].dt.hour.to_numpy()]
+        elif baseline == 'rolling':
+            # Zaman tabanlı pencere sıralı veri ister; self.df zaten sıralı DatetimeIndex üzerindedir
+            rolling = values.rolling(window, min_periods=min_periods, closed='left')
+            upper = self._iqr_upper_bounds(
+                (rolling.quantile(0.25).to_numpy(), rolling.quantile(0.75).to_numpy()), multiplier)
+        else:
+            raise ValueError(f"Geçersiz baseline: {baseline} (seçenekler: 'global', 'rolling', 'hour')")
+
+        # NaN sınırlar (yetersiz geçmiş) zirve üretmez
+        mask = values.to_numpy(dtype='float64') > upper
+        return pd.DataFrame(mask, index=self.df.index, columns=columns)
+
+    def get_outlier_points(self, columns=None, baseline: str = 'global', **kwargs):
+        """Zirveleri uzun biçimde döndürür: her zirve için 'Zaman', 'Lider', 'Değer' satırı.
+
+        Tam DataFrame kopyası yerine yalnızca zirve noktaları döner; yüzlerce
+        anahtar kelimede de küçük kalır. Parametreler için bkz. get_outlier_mask.
+        """
+        mask = self.get_outlier_mask(columns, baseline, **kwargs)
+        rows, column_index = np.nonzero(mask.to_numpy())
+        return pd.DataFrame({
+            'Zaman': self.df['Zaman'].to_numpy()[rows],
+            'Lider': np.asarray(mask.columns, dtype=object)[column_index],
+            'Değer': self.df[list(mask.columns)].to_numpy()[rows, column_index]
+        })
 
     def get_overall_daily_peaks(self):
-        daily_total_peaks = []
         # Ensure 'Toplam Aranma' column exists before proceeding
         if 'Toplam Aranma' not in self.df.columns:
             # This case should ideally not happen if streamlit_trend_app.py pre-calculates it
             # But as a fallback or for direct usage of TrendAnalyzer, calculate it
-            search_columns = [col for col in self.df.columns if col not in ['Zaman', 'Tarih', 'Saat']]
-            if search_columns:
-                self.df['Toplam Aranma'] = self.df[search_columns].sum(axis=1)
-            else:
+            if not self.add_total_column():
                 return pd.DataFrame() # No search columns to calculate total
 
-        for date in self.df['Tarih'].unique():
-            daily_df = self.df[self.df['Tarih'] == date]
-            if not daily_df.empty:
-                max_total_value = daily_df['Toplam Aranma'].max()
-                # Find the row(s) with the max value
-                peak_rows = daily_df[daily_df['Toplam Aranma'] == max_total_value]
-                if not peak_rows.empty:
-                    # Take the first one if multiple hours have the same max value
-                    peak_time_obj = peak_rows['Zaman'].iloc[0]
-                    daily_total_peaks.append({
-                        'Tarih': date,
-                        'Zirve Zamanı': peak_time_obj.strftime('%H:%M'),
-                        'Zirve Değeri': int(max_total_value)
-                    })
-        return pd.DataFrame(daily_total_peaks) 
\ No newline at end of file
+        # Her gün için toplamın ilk maksimum saati günlük toplam tablosundan okunur
+        rollup = self._get_rollup('day', ['Toplam Aranma'])
+        found = ~np.isnan(rollup.max[:, 0])
+        if not found.any():
+            return pd.DataFrame()
+
+        peak_times = pd.DatetimeIndex(rollup.argmax[found, 0])
+        return pd.DataFrame({
+            'Tarih': np.asarray(pd.DatetimeIndex(rollup.keys).date, dtype=object)[found],
+            'Zirve Zamanı': peak_times.strftime('%H:%M'),
+            'Zirve Değeri': rollup.max[found, 0].astype('int64')
+        })
@@ -0,0 +1,182 @@
+"""Trends arayüzü için seyreltilmiş (downsampled) Plotly grafikleri.
+
+Çok yıllık saatlik veride her noktayı grafiğe göndermek grafik başına
+megabaytlarca JSON üretir ve tarayıcıyı yavaşlatır. Bu modül grafikleri
+çizmeden önce seriyi ekran çözünürlüğüne uygun nokta sayısına indirir:
+
+    * Tek seri (toplam aranma) LTTB (Largest-Triangle-Three-Buckets) ile
+      seyreltilir; eğrinin şekli korunur.
+    * Çok sayıda lider serisi tek vektörel geçişte kova başına min/maks
+      noktalarına indirilir.
+
+Her iki yöntemde de serinin mutlak zirvesi her zaman korunur; böylece
+'Zirve' etiketleri çizilen bir noktanın üzerinde ve doğru değerde kalır.
+Seçilen aralık `max_points`'ten kısaysa veri olduğu gibi çizilir. Lider
+grafikleri lider başına ayrı bir figür yerine tek figürde (ortak eksende
+veya paylaşılan x eksenli paneller halinde) çizilir:
+
+    fig = build_total_figure(filtered_df, 'Toplam Aranma', summary, average)
+    fig = build_leaders_figure(filtered_df, leaders, summary, average_counts, layout='facet')
+"""
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+
+DEFAULT_MAX_POINTS = 2000  # Seri başına çizilen en fazla nokta (tipik grafik genişliğinin ~2 katı)
+HOVER_TIME_FORMAT = '%Y-%m-%d %H:%M'
+
+
+def lttb_indices(values, max_points: int = DEFAULT_MAX_POINTS, x=None):
+    """LTTB ile seçilen satır konumlarını (sıralı) döndürür.
+
+    İlk ve son nokta her zaman seçilir; aradaki her kovadan, önceki seçili
+    nokta ve sonraki kovanın ortalamasıyla en büyük üçgeni oluşturan nokta
+    alınır. Serinin mutlak maksimumu ayrıca eklenir.
+    """
+    y = np.asarray(values, dtype='float64')
+    n = len(y)
+    if max_points >= n or max_points < 3:
+        return np.arange(n)
+    x = np.arange(n, dtype='float64') if x is None else np.asarray(x, dtype='float64')
+
+    # İlk ve son nokta hariç n-2 nokta, max_points-2 kovaya bölünür
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0] = previous = 0
+    for bucket in range(max_points - 2):
+        lo, hi = edges[bucket], edges[bucket + 1]
+        next_lo = hi
+        next_hi = edges[bucket + 2] if bucket + 2 < len(edges) else n
+        average_x = x[next_lo:next_hi].mean()
+        average_y = y[next_lo:next_hi].mean()
+        area = np.abs((x[previous] - average_x) * (y[lo:hi] - y[previous])
+                      - (x[previous] - x[lo:hi]) * (average_y - y[previous]))
+        previous = lo + int(area.argmax())
+        selected[bucket + 1] = previous
+    selected[-1] = n - 1
+    return np.union1d(selected, [int(np.nanargmax(y))] if n else [])
+
+
+def minmax_indices(values, max_points: int = DEFAULT_MAX_POINTS):
+    """Her sütun için kova başına ilk minimum ve ilk maksimum satırlarını seçer.
+
+    `values` (n x k) dizisidir; tüm sütunlar tek geçişte işlenir. Sütun
+    başına sıralı satır konumları listesi döndürür. Uç değerler kovalarda
+    korunduğundan her sütunun mutlak zirvesi de seçilir.
+    """
+    values = np.asarray(values)
+    if values.ndim == 1:
+        values = values[:, None]
+    n, k = values.shape
+    if n <= max_points or max_points < 4:
+        return [np.arange(n) for _ in range(k)]
+
+    starts = np.linspace(0, n, max(2, max_points // 2), endpoint=False).astype(np.int64)
+    counts = np.diff(np.append(starts, n))
+    rows = np.arange(n, dtype=np.int64)[:, None]
+    picks = []
+    for reduce in (np.fmax, np.fmin) if values.dtype.kind == 'f' else (np.maximum, np.minimum):
+        extrema = reduce.reduceat(values, starts, axis=0)
+        hit = values == np.repeat(extrema, counts, axis=0)
+        picks.append(np.minimum.reduceat(np.where(hit, rows, n - 1), starts, axis=0))
+    first_last = np.array([0, n - 1])
+    return [np.union1d(np.union1d(picks[0][:, col], picks[1][:, col]), first_last) for col in range(k)]
+
+
+def _peak_annotation(time, value, color, **position):
+    """'Zirve (değer)' ok etiketi (add_annotation argümanları)"""
+    return dict(
+        x=time,
+        y=value,
+        text=f"Zirve ({int(value)})",
+        showarrow=True,
+        arrowhead=1,
+        ax=20,
+        ay=-40,
+        bgcolor="rgba(255, 255, 255, 0.8)",
+        bordercolor=color,
+        borderwidth=1,
+        borderpad=4,
+        font=dict(color=color, size=10),
+        **position
+    )
+
+
+def build_total_figure(df: pd.DataFrame, column: str, summary: pd.DataFrame, average: float,
+                       max_points: int = DEFAULT_MAX_POINTS):
+    """Toplam aranma hacmi grafiği; seri LTTB ile seyreltilir, zirve noktası korunur"""
+    rows = lttb_indices(df[column].to_numpy(), max_points)
+    sampled = pd.DataFrame({'Zaman': df['Zaman'].to_numpy()[rows], column: df[column].to_numpy()[rows]})
+    fig = px.line(sampled, x='Zaman', y=column,
+                  title='Toplam Aranma Hacmi (Tüm Liderler)',
+                  labels={'Zaman': 'Tarih ve Saat', column: 'Toplam Aranma Hacmi'},
+                  hover_data={'Zaman': '|' + HOVER_TIME_FORMAT, column: True})
+
+    # Genel ortalama çizgisi
+    fig.add_hline(y=average, line_dash="dash", line_color="red", annotation_text=f"Ortalama: {average:.2f}",
+                  annotation_position="bottom right", annotation_font_color="red")
+    # Mutlak zirve noktası (en tepe nokta); zirve satırı seyreltmede korunur
+    fig.add_annotation(**_peak_annotation(summary.at[column, 'Zirve Zamanı'], summary.at[column, 'Maksimum'], "purple"))
+
+    fig.update_layout(hovermode="x unified", xaxis_rangeslider_visible=True)  # Zaman kaydırıcısı
+    return fig
+
+
+def build_leaders_figure(df: pd.DataFrame, columns: list, summary: pd.DataFrame, average_counts: dict,
+                         layout: str = 'facet', max_points: int = DEFAULT_MAX_POINTS):
+    """Tüm liderler için tek figür.
+
+    `layout='facet'` her lideri paylaşılan x eksenli ayrı bir panelde
+    (ortalama çizgisi ve zirve etiketiyle), `layout='overlay'` tüm
+    liderleri aynı eksende çizer. Seriler kova başına min/maks ile seyreltilir.
+    """
+    if layout not in ('facet', 'overlay'):
+        raise ValueError(f"Geçersiz layout: {layout} (seçenekler: 'facet', 'overlay')")
+    times = df['Zaman'].to_numpy()
+    values = df[columns].to_numpy()
+    sampled_rows = minmax_indices(values, max_points)
+    hover = '%{x|' + HOVER_TIME_FORMAT + '}<br>%{y}<extra>%{fullData.name}</extra>'
+
+    if layout == 'overlay':
+        fig = go.Figure()
+        for col_index, col in enumerate(columns):
+            rows = sampled_rows[col_index]
+            fig.add_trace(go.Scatter(x=times[rows], y=values[rows, col_index], mode='lines', name=col,
+                                     hovertemplate=hover))
+        # Ok etiketleri yerine tüm liderlerin zirveleri tek bir işaret serisinde gösterilir
+        peaks = summary.loc[columns]
+        fig.add_trace(go.Scatter(x=peaks['Zirve Zamanı'], y=peaks['Maksimum'], mode='markers', name='Zirve',
+                                 marker=dict(color='red', size=9, symbol='triangle-up'),
+                                 text=[f"{col}: Zirve ({int(value)})" for col, value in peaks['Maksimum'].items()],
+                                 hovertemplate='%{text}<extra></extra>'))
+        fig.update_layout(title='Liderlere Göre Aranma Hacmi', hovermode="x unified",
+                          xaxis_rangeslider_visible=True, xaxis_title='Tarih ve Saat',
+                          yaxis_title='Aranma Hacmi')
+        return fig
+
+    fig = make_subplots(rows=len(columns), cols=1, shared_xaxes=True, subplot_titles=columns,
+                        vertical_spacing=min(0.08, 0.3 / max(1, len(columns))))
+    # Panel başına add_hline/add_annotation çağrıları panel sayısıyla karesel yavaşlar;
+    # çizgiler ve etiketler toplanıp yerleşime tek seferde yazılır
+    shapes, annotations = [], list(fig.layout.annotations)  # Panel başlıkları
+    for col_index, col in enumerate(columns):
+        rows = sampled_rows[col_index]
+        fig.add_trace(go.Scatter(x=times[rows], y=values[rows, col_index], mode='lines', name=col,
+                                 showlegend=False, hovertemplate=hover), row=col_index + 1, col=1)
+        axis = str(col_index + 1) if col_index else ''
+        # Liderin ortalama çizgisi ve mutlak zirve noktası
+        leader_average = average_counts.get(f'{col} Ortalaması', 0)
+        shapes.append(dict(type='line', xref=f'x{axis} domain', x0=0, x1=1, yref=f'y{axis}',
+                           y0=leader_average, y1=leader_average, line=dict(color='blue', dash='dash')))
+        annotations.append(dict(text=f"Ort: {leader_average:.2f}", showarrow=False, font=dict(color='blue'),
+                                xref=f'x{axis} domain', x=1, xanchor='right', yref=f'y{axis}',
+                                y=leader_average, yanchor='top'))
+        annotations.append(_peak_annotation(summary.at[col, 'Zirve Zamanı'], summary.at[col, 'Maksimum'], "red",
+                                            xref=f'x{axis}', yref=f'y{axis}'))
+    fig.update_layout(shapes=shapes, annotations=annotations, height=max(300, 220 * len(columns)),
+                      hovermode="x unified", title='Liderlere Göre Aranma Hacmi ve Zirve Noktaları')
+    fig.update_xaxes(title_text='Tarih ve Saat', row=len(columns), col=1)
+    return fig
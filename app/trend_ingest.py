@@ -0,0 +1,185 @@
+"""Google Trends CSV dışa aktarımları için parça parça (chunked) okuma.
+
+Trends dışa aktarımlarının başında açıklama satırları vardır ("Kategori: ...",
+boş satır), ardından başlık ve saatlik değerler gelir. Dosyalar uç uca
+eklendiğinde (ör. `cat hafta1.csv hafta2.csv`) bu blok dosyanın ortasında
+tekrar eder. Bu modül:
+
+    * Dosyayı `chunksize` satırlık parçalar halinde okur; açıklama
+      satırlarını atlar, her başlık satırında yeni bir blok başlatır.
+    * Değerleri açık tiplerle (float32) okuyup parça bazında en küçük
+      tipe (genelde uint8) çevirir; '<1' değerleri 0 kabul edilir.
+    * 'Zaman' sütununu yalnızca bir kez, parça okunurken çözer.
+    * Birden fazla dosyayı (ör. anahtar kelime başına bir dosya) 'Zaman'
+      üzerinde hizalanmış tek bir saatlik tabloda birleştirir.
+
+Bellekte aynı anda yalnızca bir parçanın ham metni ve sonuç tablosunun
+kompakt hali bulunur:
+
+    df = read_trends_csv('multiTimeline.csv')
+    df = read_trends_files(['erdogan.csv', 'ozel.csv'], complete_hours=True)
+"""
+import io
+import os
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+from .trend_analyzer import compact_values
+
+
+TIME_COLUMN = 'Zaman'
+TIME_FORMAT = '%Y-%m-%dT%H'  # Saatlik dışa aktarımlar: 2025-06-17T15
+DEFAULT_CHUNKSIZE = 10_000
+_READ_BLOCK_SIZE = 1 << 20  # Dosyadan bir seferde okunan karakter sayısı
+
+
+@contextmanager
+def _open_text(source):
+    """Dosya yolu, bayt dizisi veya dosya benzeri nesneyi metin akışı olarak açar"""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'r', encoding='utf-8-sig', newline='') as f:
+            yield f
+    elif isinstance(source, io.TextIOBase):
+        yield source
+    else:
+        if isinstance(source, bytes):
+            source = io.BytesIO(source)
+        wrapper = io.TextIOWrapper(source, encoding='utf-8-sig', newline='')
+        try:
+            yield wrapper
+        finally:
+            wrapper.detach()  # Çağıranın akışı (ör. Streamlit yüklemesi) kapatılmaz
+
+
+def _iter_lines(stream):
+    """Akışı büyük bloklar halinde okuyup satır listeleri üretir (satır başına okuma yapmaz)"""
+    rest = ''
+    while True:
+        text = stream.read(_READ_BLOCK_SIZE)
+        if not text:
+            break
+        lines = (rest + text).splitlines()
+        # Blok satır ortasında bittiyse son satır bir sonraki bloğa taşınır
+        rest = '' if text.endswith(('\n', '\r')) else lines.pop()
+        yield lines
+    if rest:
+        yield [rest]
+
+
+def parse_trend_times(values):
+    """Trends zaman metinlerini datetime64'e çevirir (saatlik biçim, değilse ISO 8601)"""
+    try:
+        return pd.to_datetime(values, format=TIME_FORMAT)
+    except ValueError:
+        return pd.to_datetime(values, format='ISO8601')
+
+
+def _parse_chunk(lines, columns):
+    """Veri satırlarını açık tiplerle DataFrame'e çevirir; 'Zaman' burada bir kez çözülür"""
+    text = '\n'.join(lines).replace('<1', '0')
+    value_columns = columns[1:]
+    chunk = pd.read_csv(io.StringIO(text), header=None, names=columns,
+                        dtype={columns[0]: str, **{col: 'float32' for col in value_columns}})
+    times = parse_trend_times(chunk[columns[0]]).to_numpy()
+
+    values = np.nan_to_num(chunk[value_columns].to_numpy(dtype='float32'), nan=0.0)
+    if values.size and values.min() >= 0 and values.max() <= 255 and np.array_equal(values, np.floor(values)):
+        # Olağan durum: tüm değerler 0-100 arası tam sayı; parça tek uint8 blok olarak tutulur
+        frame = pd.DataFrame(values.astype('uint8'), columns=value_columns)
+    else:
+        frame = pd.DataFrame({col: compact_values(chunk[col]) for col in value_columns})
+    frame.insert(0, TIME_COLUMN, times)
+    return frame
+
+
+def iter_trend_chunks(source, chunksize: int = DEFAULT_CHUNKSIZE):
+    """Dosyayı (blok no, parça DataFrame) çiftleri olarak okur.
+
+    Her başlık satırı yeni bir blok başlatır; aynı bloğun parçaları aynı
+    sütunlara sahiptir. İlk sütun her zaman 'Zaman' olarak adlandırılır.
+    """
+    columns = None
+    block = -1
+    pending = []
+    with _open_text(source) as stream:
+        for lines in _iter_lines(stream):
+            for line in lines:
+                if line[:1].isdigit():
+                    if columns is not None:
+                        pending.append(line)
+                        if len(pending) >= chunksize:
+                            yield block, _parse_chunk(pending, columns)
+                            pending = []
+                elif ',' in line:
+                    # Yeni başlık satırı: önceki bloğun kalan satırları teslim edilir
+                    if pending:
+                        yield block, _parse_chunk(pending, columns)
+                        pending = []
+                    columns = [name.strip() for name in line.split(',')]
+                    columns[0] = TIME_COLUMN
+                    block += 1
+                # Diğer satırlar ("Kategori: ...", boş satırlar) atlanır
+        if pending:
+            yield block, _parse_chunk(pending, columns)
+
+
+def read_trends_csv(source, chunksize: int = DEFAULT_CHUNKSIZE, complete_hours: bool = False):
+    """Tek bir (uç uca eklenmiş olabilir) Trends dışa aktarımını okur.
+
+    Birden fazla blok varsa bloklar `merge_trend_frames` ile 'Zaman'
+    üzerinde birleştirilir.
+    """
+    blocks = {}
+    for block, chunk in iter_trend_chunks(source, chunksize):
+        blocks.setdefault(block, []).append(chunk)
+    frames = [pd.concat(chunks, ignore_index=True) if len(chunks) > 1 else chunks[0]
+              for chunks in blocks.values()]
+    if not frames:
+        return pd.DataFrame(columns=[TIME_COLUMN])
+    if len(frames) == 1 and not complete_hours:
+        return frames[0]
+    return merge_trend_frames(frames, complete_hours=complete_hours)
+
+
+def read_trends_files(sources, chunksize: int = DEFAULT_CHUNKSIZE, complete_hours: bool = False):
+    """Birden fazla dışa aktarımı (ör. anahtar kelime başına bir dosya) tek tabloda birleştirir"""
+    frames = [read_trends_csv(source, chunksize) for source in sources]
+    return merge_trend_frames(frames, complete_hours=complete_hours)
+
+
+def merge_trend_frames(frames, fill_value: int = 0, complete_hours: bool = False):
+    """Tabloları 'Zaman' üzerinde hizalar.
+
+    Aynı anahtar kelime birden fazla tabloda varsa zaman dilimleri uç uca
+    eklenir; çakışan saatlerde sonraki tablonun değeri geçerlidir (Trends
+    değerleri her dışa aktarımda ayrı ölçeklenir). Eksik saatler
+    `fill_value` ile doldurulur; `complete_hours` açıksa aradaki tüm
+    saatler tabloya eklenir. Sonuç zamana göre sıralıdır.
+    """
+    series_by_column = {}
+    for frame in frames:
+        times = pd.DatetimeIndex(frame[TIME_COLUMN])
+        for col in frame.columns:
+            if col != TIME_COLUMN:
+                series_by_column.setdefault(col, []).append(pd.Series(frame[col].to_numpy(), index=times))
+
+    merged = {}
+    for col, parts in series_by_column.items():
+        series = pd.concat(parts) if len(parts) > 1 else parts[0]
+        merged[col] = series[~series.index.duplicated(keep='last')]
+
+    if not merged:
+        times = pd.DatetimeIndex(np.concatenate([frame[TIME_COLUMN].to_numpy() for frame in frames])
+                                 if frames else [])
+        return pd.DataFrame({TIME_COLUMN: times.unique().sort_values()})
+
+    combined = pd.concat(merged, axis=1, sort=True)
+    if complete_hours and len(combined):
+        combined = combined.reindex(pd.date_range(combined.index[0], combined.index[-1], freq='h'))
+
+    result = {TIME_COLUMN: combined.index.to_numpy()}
+    for col in combined.columns:
+        result[col] = compact_values(combined[col].fillna(fill_value))
+    return pd.DataFrame(result)
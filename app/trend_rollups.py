@@ -0,0 +1,203 @@
+"""Trends anahtar kelimeleri için önceden hesaplanan toplam (rollup) tabloları.
+
+Günlük zirve, ortalama ve gün içi profil sorguları saatlik ham satırları
+her seferinde yeniden taramak yerine küçük toplam tablolarını okur. Her
+seviye için anahtar kelime başına şu istatistikler tutulur:
+
+    sum     - toplam
+    mean    - ortalama (sum / satır sayısı)
+    max     - maksimum
+    argmax  - maksimumun ilk görüldüğü zaman (eşitlikte en erken saat)
+
+Seviyeler:
+
+    'hour'         - saat (yinelenen zaman damgaları birleşir)
+    'day'          - gün
+    'week'         - hafta (Pazartesi başlangıçlı)
+    'hour_of_day'  - günün saati (0-23; gün içi profil)
+
+Tablolar birleştirilebilir (`merge`): yeni satırların toplamları mevcut
+tabloyla birleştirilince tüm veriden yeniden hesaplamakla aynı sonuç elde
+edilir. Böylece veri eklendiğinde yalnızca yeni satırlar taranır:
+
+    rollup = TrendRollup.build('day', times, values, columns)
+    rollup = rollup.merge(TrendRollup.build('day', new_times, new_values, columns))
+    rollup.to_frame()['max']
+"""
+import numpy as np
+import pandas as pd
+
+
+ROLLUP_LEVELS = ('hour', 'day', 'week', 'hour_of_day')
+ROLLUP_STATS = ('sum', 'mean', 'max', 'argmax')
+
+# build() ara dizilerini sınırlamak için bir seferde işlenen en fazla hücre (satır x sütun)
+BUILD_BLOCK_CELLS = 2_000_000
+
+# to_frame() indeks adları
+_LEVEL_INDEX_NAMES = {'hour': 'Zaman', 'day': 'Tarih', 'week': 'Hafta', 'hour_of_day': 'Saat'}
+
+
+def rollup_keys(times, level: str):
+    """Satır zamanlarını seviyenin grup anahtarlarına çevirir (datetime64 veya saat tam sayısı)"""
+    times = np.asarray(times)
+    if times.dtype.kind != 'M':
+        times = times.astype('datetime64[ns]')
+    if level == 'hour':
+        return times.astype('datetime64[h]')
+    days = times.astype('datetime64[D]')
+    if level == 'day':
+        return days
+    if level == 'week':
+        # 1970-01-01 Perşembe; (gün + 3) % 7 Pazartesi için 0 verir
+        return days - ((days.astype('int64') + 3) % 7).astype('timedelta64[D]')
+    if level == 'hour_of_day':
+        return (times - days).astype('timedelta64[h]').astype('int64')
+    raise ValueError(f"Geçersiz seviye: {level} (seçenekler: {', '.join(ROLLUP_LEVELS)})")
+
+
+class TrendRollup:
+    """Tek seviyenin grup x anahtar kelime toplam tablosu.
+
+    `keys` sıralı grup anahtarları; `sum`, `max` ve `argmax` (grup x sütun)
+    dizileri, `count` grup başına satır sayısıdır.
+    """
+
+    def __init__(self, level: str, columns: list, keys, sums, counts, maxima, argmax):
+        self.level = level
+        self.columns = list(columns)
+        self.keys = keys
+        self.sum = sums
+        self.count = counts
+        self.max = maxima
+        self.argmax = argmax
+
+    @classmethod
+    def build(cls, level: str, times, values, columns: list, starts=None):
+        """Satırlardan tabloyu tek geçişte hesaplar.
+
+        `times` sıralı olmalıdır (eşit maksimumlarda en erken saat seçilir).
+        Gruplar ardışık değilse (ör. 'hour_of_day') satırlar kararlı
+        sıralanır. Gün başlangıç ofsetleri zaten biliniyorsa `starts` ile
+        verilebilir ('day' seviyesinde anahtar karşılaştırması atlanır).
+        """
+        times = np.asarray(times)
+        if times.dtype.kind != 'M':
+            times = times.astype('datetime64[ns]')
+        values = np.asarray(values)
+        if values.ndim == 1:
+            values = values[:, None]
+        keys = rollup_keys(times, level)
+        if len(keys) and not (keys[1:] >= keys[:-1]).all():
+            order = np.argsort(keys, kind='stable')
+            keys, times, values = keys[order], times[order], values[order]
+            starts = None
+        if starts is None:
+            starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]]) if len(keys) else np.empty(0, dtype=np.intp)
+
+        k = values.shape[1]
+        if len(starts) == 0:
+            return cls(level, columns, keys[:0], np.zeros((0, k)), np.zeros(0, dtype=np.int64),
+                       np.zeros((0, k)), np.empty((0, k), dtype=times.dtype))
+
+        counts = np.diff(np.append(starts, len(keys))).astype(np.int64)
+        if len(starts) == len(keys):
+            # Her grup tek satır (ör. yinelenmeyen saatler): toplam = maksimum = değer
+            sums = values.astype('float64')
+            return cls(level, columns, keys, sums, counts, sums.copy(), np.repeat(times[:, None], k, axis=1))
+
+        sums = np.empty((len(starts), k))
+        maxima = np.empty((len(starts), k))
+        first_rows = np.empty((len(starts), k), dtype=np.intp)
+        rows = np.arange(len(keys), dtype=np.int32 if len(keys) < 2 ** 31 else np.int64)
+        maximum = np.fmax if values.dtype.kind == 'f' else np.maximum
+        # Ara diziler (kopya, eşitlik maskesi, satır numaraları) sütun blokları halinde kurulur;
+        # böylece tepe bellek tablonun boyutuyla değil blok boyutuyla sınırlı kalır
+        block = max(1, BUILD_BLOCK_CELLS // len(keys))
+        for lo in range(0, k, block):
+            hi = min(k, lo + block)
+            # reduceat satır ekseninde C sıralı dizide yavaştır; sütunlar satır olacak şekilde (k x n) çalışılır
+            by_column = np.ascontiguousarray(values[:, lo:hi].T)
+            sums[:, lo:hi] = np.add.reduceat(by_column, starts, axis=1, dtype='float64').T
+            block_max = maximum.reduceat(by_column, starts, axis=1)
+            maxima[:, lo:hi] = block_max.T
+            # Grup içinde maksimumun ilk görüldüğü satır
+            is_max = by_column == np.repeat(block_max, counts, axis=1)
+            first_rows[:, lo:hi] = np.minimum.reduceat(np.where(is_max, rows, len(keys) - 1), starts, axis=1).T
+        return cls(level, columns, keys[starts], sums, counts, maxima, times[first_rows])
+
+    def merge(self, other: 'TrendRollup'):
+        """İki tabloyu (aynı seviye ve sütunlar) birleştirir; toplamlar eklenir,
+        maksimumda eşitlikte daha erken zaman kazanır."""
+        if other.level != self.level or other.columns != self.columns:
+            raise ValueError("Yalnızca aynı seviye ve sütunlara sahip tablolar birleştirilebilir")
+        if len(self.keys) and len(other.keys) and other.keys[0] >= self.keys[-1] and len(self.keys) > 1:
+            # Sona ekleme (olağan durum): yalnızca sınırdaki grup birleştirilir, gerisi uç uca eklenir
+            boundary = self._take(slice(-1, None)).merge(other)
+            return self._take(slice(None, -1))._concat(boundary)
+        keys = np.union1d(self.keys, other.keys)
+        mine, theirs = np.searchsorted(keys, self.keys), np.searchsorted(keys, other.keys)
+        k = len(self.columns)
+
+        sums = np.zeros((len(keys), k))
+        counts = np.zeros(len(keys), dtype=np.int64)
+        maxima = np.full((len(keys), k), -np.inf)
+        argmax = np.full((len(keys), k), np.datetime64('NaT'), dtype=self.argmax.dtype)
+        sums[mine] += self.sum
+        sums[theirs] += other.sum
+        counts[mine] += self.count
+        counts[theirs] += other.count
+        maxima[mine] = self.max
+        argmax[mine] = self.argmax
+
+        current_max, current_time = maxima[theirs], argmax[theirs]
+        better = (other.max > current_max) | ((other.max == current_max) & (other.argmax < current_time))
+        maxima[theirs] = np.where(better, other.max, current_max)
+        argmax[theirs] = np.where(better, other.argmax, current_time)
+        return TrendRollup(self.level, self.columns, keys, sums, counts, maxima, argmax)
+
+    def truncate(self, key):
+        """`key`'den önceki grupların tablosu; sonraki gruplar yeniden hesaplanıp
+        `merge` ile eklenebilir (ör. çakışan veri eklendiğinde)"""
+        return self._take(slice(0, int(np.searchsorted(self.keys, key, 'left'))))
+
+    def _take(self, rows):
+        return TrendRollup(self.level, self.columns, self.keys[rows], self.sum[rows], self.count[rows],
+                           self.max[rows], self.argmax[rows])
+
+    def _concat(self, other: 'TrendRollup'):
+        return TrendRollup(self.level, self.columns, np.concatenate([self.keys, other.keys]),
+                           np.concatenate([self.sum, other.sum]), np.concatenate([self.count, other.count]),
+                           np.concatenate([self.max, other.max]), np.concatenate([self.argmax, other.argmax]))
+
+    def add_columns(self, other: 'TrendRollup'):
+        """Aynı satırlardan hesaplanmış başka sütunların tablosunu yanına ekler"""
+        if not np.array_equal(other.keys, self.keys):
+            raise ValueError("Sütun eklenecek tablo aynı gruplara sahip olmalıdır")
+        return TrendRollup(self.level, self.columns + other.columns, self.keys, np.hstack([self.sum, other.sum]),
+                           self.count, np.hstack([self.max, other.max]), np.hstack([self.argmax, other.argmax]))
+
+    def select(self, columns: list):
+        """Yalnızca verilen sütunların (verilen sırada) tablosu"""
+        if list(columns) == self.columns:
+            return self
+        positions = [self.columns.index(col) for col in columns]
+        return TrendRollup(self.level, columns, self.keys, self.sum[:, positions], self.count,
+                           self.max[:, positions], self.argmax[:, positions])
+
+    @property
+    def mean(self):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return self.sum / self.count[:, None]
+
+    def stat(self, name: str):
+        """'sum', 'mean', 'max' veya 'argmax' dizisi (grup x sütun)"""
+        if name not in ROLLUP_STATS:
+            raise ValueError(f"Geçersiz istatistik: {name} (seçenekler: {', '.join(ROLLUP_STATS)})")
+        return getattr(self, name)
+
+    def to_frame(self, stats=ROLLUP_STATS):
+        """(istatistik, anahtar kelime) çok seviyeli sütunlu DataFrame; satırlar grup anahtarlarıdır"""
+        index = pd.Index(self.keys, name=_LEVEL_INDEX_NAMES[self.level])
+        frames = {name: pd.DataFrame(self.stat(name), index=index, columns=self.columns) for name in stats}
+        return pd.concat(frames, axis=1)
@@ -0,0 +1,212 @@
+"""Google Trends geçmişi için kalıcı, sütunlu (Parquet) veri deposu.
+
+Her analiz oturumunun ham CSV yüklemesiyle başlamaması için saatlik
+Trends verisi diskte aylık bölümler (partition) halinde tutulur:
+
+    .yeb_cache/trends_store/
+        2025-05.parquet
+        2025-06.parquet
+
+    store = TrendStore()
+    store.append_csv(['hafta1.csv', 'hafta2.csv'])   # artımlı ekleme
+    df = store.query(start, end)                      # yalnızca gereken veri okunur
+    analyzer = TrendAnalyzer.from_store(store, start, end)
+
+Zaman aralığı sorguları iki aşamada daraltılır: aralık dışındaki aylar hiç
+açılmaz, aralığın kenarındaki aylarda ise Parquet satır gruplarının
+(haftalık) 'Zaman' istatistiklerine bakılır ve yalnızca aralığa değen
+gruplar okunur.
+Değerler yazılırken kompakt tiplerde (genelde uint8) saklanır.
+
+Ekleme yalnızca yeni verinin düştüğü ayları yeniden yazar; çakışan
+saatlerde yeni dışa aktarımın değeri geçerlidir (bkz.
+`merge_trend_frames`). Her ay dosyası geçici dosyaya yazılıp atomik olarak
+yer değiştirir, böylece okuyucular yarım yazılmış bir bölüm görmez.
+pyarrow gerekir.
+"""
+import hashlib
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from .trend_analyzer import compact_values
+from .trend_ingest import TIME_COLUMN, merge_trend_frames, read_trends_files
+
+
+def _row_groups_in_range(metadata, start, end):
+    """'Zaman' istatistikleri [start, end] aralığına değen satır gruplarının sıraları"""
+    index = metadata.schema.to_arrow_schema().get_field_index(TIME_COLUMN)
+    groups = []
+    for group in range(metadata.num_row_groups):
+        stats = metadata.row_group(group).column(index).statistics
+        if stats is None or not stats.has_min_max:
+            groups.append(group)
+        elif (start is None or pd.Timestamp(stats.max) >= start) and (end is None or pd.Timestamp(stats.min) <= end):
+            groups.append(group)
+    return groups
+
+
+class TrendStore:
+    """Aylık Parquet bölümlerinden oluşan Trends deposu"""
+
+    def __init__(self, path: str = '.yeb_cache/trends_store', row_group_hours: int = 24 * 7):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            raise ImportError("Trends deposu için pyarrow gerekli: pip install pyarrow") from e
+        self.path = path
+        self.row_group_hours = max(1, int(row_group_hours))
+        self._lock = threading.Lock()
+        os.makedirs(path, exist_ok=True)
+
+    def _month_path(self, month: str):
+        return os.path.join(self.path, f'{month}.parquet')
+
+    def months(self):
+        """Depodaki ayları ('2025-06' biçiminde) sıralı döndürür"""
+        return sorted(name[:-len('.parquet')] for name in os.listdir(self.path) if name.endswith('.parquet'))
+
+    def is_empty(self):
+        return not self.months()
+
+    def version(self):
+        """Depo içeriğinin özeti; her eklemede değişir (önbellek anahtarı olarak kullanılır)"""
+        digest = hashlib.sha1()
+        for month in self.months():
+            stat = os.stat(self._month_path(month))
+            digest.update(f'{month}:{stat.st_mtime_ns}:{stat.st_size};'.encode())
+        return digest.hexdigest()
+
+    def keywords(self):
+        """Depodaki tüm anahtar kelime sütunları (yalnızca dosya şemaları okunur)"""
+        import pyarrow.parquet as pq
+
+        names = {}
+        for month in self.months():
+            for name in pq.read_schema(self._month_path(month)).names:
+                if name != TIME_COLUMN:
+                    names.setdefault(name, None)
+        return list(names)
+
+    def time_bounds(self):
+        """(en eski, en yeni) zaman; depo boşsa (None, None).
+
+        Yalnızca ilk ve son ayın satır grubu istatistikleri okunur.
+        """
+        import pyarrow.parquet as pq
+
+        months = self.months()
+        if not months:
+            return None, None
+        bounds = []
+        for month, pick in ((months[0], min), (months[-1], max)):
+            metadata = pq.ParquetFile(self._month_path(month)).metadata
+            index = metadata.schema.to_arrow_schema().get_field_index(TIME_COLUMN)
+            values = []
+            for group in range(metadata.num_row_groups):
+                stats = metadata.row_group(group).column(index).statistics
+                if stats is not None and stats.has_min_max:
+                    values.append(stats.min if pick is min else stats.max)
+            bounds.append(pd.Timestamp(pick(values)) if values else None)
+        return bounds[0], bounds[1]
+
+    def append(self, df: pd.DataFrame):
+        """Saatlik tabloyu depoya ekler; güncellenen ayların listesini döndürür.
+
+        `df` 'Zaman' (datetime) ve anahtar kelime sütunlarını içermelidir
+        (ör. `read_trends_csv` çıktısı). Türetilmiş 'Tarih'/'Saat' sütunları
+        saklanmaz.
+        """
+        times = pd.DatetimeIndex(df[TIME_COLUMN])
+        if not len(times):
+            return []
+        keywords = [col for col in df.columns if col not in (TIME_COLUMN, 'Tarih', 'Saat')]
+        month_keys = times.to_numpy().astype('datetime64[M]')
+        codes, months = pd.factorize(month_keys, sort=True)
+
+        frame = df[[TIME_COLUMN] + keywords]
+        written = []
+        with self._lock:
+            for code, month in enumerate(months):
+                month = str(month)
+                part = frame.iloc[np.flatnonzero(codes == code)]
+                target = self._month_path(month)
+                if os.path.exists(target):
+                    part = merge_trend_frames([self._read_file(target), part])
+                elif not part[TIME_COLUMN].is_monotonic_increasing or part[TIME_COLUMN].duplicated().any():
+                    part = merge_trend_frames([part])
+                self._write_month(target, part.reset_index(drop=True))
+                written.append(month)
+        return written
+
+    def append_csv(self, sources, chunksize: int = None):
+        """Trends dışa aktarımlarını (yol, bayt veya dosya nesnesi) okuyup depoya ekler"""
+        kwargs = {'chunksize': chunksize} if chunksize else {}
+        return self.append(read_trends_files(sources, **kwargs))
+
+    def query(self, start=None, end=None, columns: list = None):
+        """[start, end] aralığındaki saatlik veriyi zamana göre sıralı döndürür.
+
+        Aralık dışındaki aylar okunmaz; kenar aylarda filtre Parquet satır
+        gruplarına iletilir. `columns` verilirse yalnızca o anahtar kelime
+        sütunları okunur. Bazı aylarda bulunmayan anahtar kelimeler 0 olur.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        start = pd.Timestamp(start) if start is not None else None
+        end = pd.Timestamp(end) if end is not None else None
+        first = start.strftime('%Y-%m') if start is not None else None
+        last = end.strftime('%Y-%m') if end is not None else None
+
+        tables = []
+        for month in self.months():
+            if (first is not None and month < first) or (last is not None and month > last):
+                continue
+            parquet = pq.ParquetFile(self._month_path(month))
+            read_columns = None
+            if columns is not None:
+                available = parquet.schema_arrow.names
+                read_columns = [TIME_COLUMN] + [col for col in columns if col in available]
+            if month in (first, last):
+                # Kenar ay: yalnızca aralığa değen satır grupları okunur
+                groups = _row_groups_in_range(parquet.metadata, start, end)
+                if groups:
+                    tables.append(parquet.read_row_groups(groups, columns=read_columns))
+            else:
+                tables.append(parquet.read(columns=read_columns))
+
+        tables = [table for table in tables if table.num_rows]
+        if not tables:
+            return pd.DataFrame(columns=[TIME_COLUMN] + list(columns or []))
+
+        table = pa.concat_tables(tables, promote_options='default') if len(tables) > 1 else tables[0]
+        df = table.to_pandas()
+        for col in df.columns:
+            if col != TIME_COLUMN and df[col].hasnans:
+                # Yalnızca bazı aylarda bulunan anahtar kelimeler
+                df[col] = compact_values(df[col])
+
+        # Satır grupları sınırda kısmen aralık dışında kalabilir; veri sıralı olduğundan kenarlar ikili aramayla kesilir
+        times = df[TIME_COLUMN].to_numpy()
+        lo = times.searchsorted(start.to_datetime64(), 'left') if start is not None else 0
+        hi = times.searchsorted(end.to_datetime64(), 'right') if end is not None else len(times)
+        if lo > 0 or hi < len(times):
+            df = df.iloc[lo:hi].reset_index(drop=True)
+        return df
+
+    def _read_file(self, path):
+        import pyarrow.parquet as pq
+
+        return pq.read_table(path).to_pandas()
+
+    def _write_month(self, target, df):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        temporary = target + '.tmp'
+        pq.write_table(table, temporary, row_group_size=self.row_group_hours)
+        os.replace(temporary, target)  # Okuyucular yarım yazılmış ayı görmez
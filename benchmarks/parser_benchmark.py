@@ -0,0 +1,130 @@
+"""Parser arka uçlarını kayıtlı haber sayfaları üzerinde karşılaştırır.
+
+Her sayfa her arka uçla parse edilir; başlık, tarih, içerik ve link çıkarımı
+çalıştırılır. Çıktılar referans arka uçla ('html.parser') karşılaştırılır ve
+sayfa başına ortalama süreler raporlanır.
+
+Kullanım:
+    # Örnek sayfaları kaydet (Hürriyet/NTV vb.)
+    python benchmarks/parser_benchmark.py --corpus corpus/ --save https://www.hurriyet.com.tr/gundem/...
+
+    # Karşılaştırmayı çalıştır
+    python benchmarks/parser_benchmark.py --corpus corpus/ --repeat 5
+"""
+import argparse
+import hashlib
+import os
+import sys
+import time
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.parsers import available_backends  # noqa: E402
+from app.scraper import NewsSiteConfig, UniversalNewsScraper  # noqa: E402
+
+REFERENCE_BACKEND = 'html.parser'
+
+
+def build_scraper(backend, base_url='https://example.com'):
+    """Evrensel seçicilerle, verilen parser arka ucunu kullanan bir scraper oluşturur"""
+    scraper = UniversalNewsScraper(parser=backend)
+    scraper.config = NewsSiteConfig(
+        base_url=base_url,
+        article_link_selectors=['a[href*="/haber/"]', 'a[href*="/gundem/"]', 'a[href*="/son-dakika/"]',
+                                '.news-item a', 'article a', 'a[data-story-channel="headline"]'],
+        title_selectors=scraper._get_universal_title_selectors(),
+        content_selectors=scraper._get_universal_content_selectors() + ['div.category-detail-content'],
+        date_selectors=scraper._get_universal_date_selectors(),
+        turkish_date_parsing_enabled=True
+    )
+    return scraper
+
+
+def extract_all(scraper, html):
+    """Bir sayfadan tüm alanları çıkarır (scraper'daki sırayla)"""
+    document = scraper.parser.parse(html)
+    links = sorted(scraper._extract_article_links(document))
+    matches = scraper._match_article_selectors(document)  # Tek geçişli seçici planı
+    title = scraper._extract_title(document, matches)
+    date = scraper._extract_date(document, matches)
+    content = scraper._extract_content(document, matches)  # Ağacı değiştirir, en son çalışır
+    return {'title': title, 'date': date, 'content': content, 'links': links}
+
+
+def save_pages(corpus_dir, urls):
+    scraper = UniversalNewsScraper(min_request_interval=1.0)
+    os.makedirs(corpus_dir, exist_ok=True)
+    for url in urls:
+        response = scraper._get(url)
+        name = f"{urlparse(url).netloc}-{hashlib.sha1(url.encode('utf-8')).hexdigest()[:10]}.html"
+        with open(os.path.join(corpus_dir, name), 'wb') as f:
+            f.write(response.content)
+        print(f"Kaydedildi: {name} ({len(response.content)} bayt)")
+
+
+def load_corpus(corpus_dir):
+    pages = []
+    for name in sorted(os.listdir(corpus_dir)):
+        if name.endswith(('.html', '.htm')):
+            with open(os.path.join(corpus_dir, name), 'rb') as f:
+                pages.append((name, f.read()))
+    return pages
+
+
+def run_benchmark(pages, backends, repeat):
+    results = {}
+    timings = {}
+    for backend in backends:
+        scraper = build_scraper(backend)
+        outputs = {}
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for name, html in pages:
+                outputs[name] = extract_all(scraper, html)
+        timings[backend] = (time.perf_counter() - start) / (repeat * len(pages))
+        results[backend] = outputs
+    return results, timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HTML parser arka uçlarını karşılaştırır")
+    parser.add_argument('--corpus', required=True, help="Kayıtlı .html sayfalarının klasörü")
+    parser.add_argument('--save', nargs='*', default=[], help="Önce bu URL'leri corpus klasörüne kaydet")
+    parser.add_argument('--backends', nargs='*', default=None, help="Karşılaştırılacak arka uçlar (varsayılan: kurulu olanlar)")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    if args.save:
+        save_pages(args.corpus, args.save)
+
+    pages = load_corpus(args.corpus)
+    if not pages:
+        print(f"{args.corpus} içinde .html sayfası bulunamadı.")
+        return 1
+
+    backends = args.backends or available_backends()
+    if REFERENCE_BACKEND not in backends:
+        backends.insert(0, REFERENCE_BACKEND)
+
+    results, timings = run_benchmark(pages, backends, args.repeat)
+    reference = results[REFERENCE_BACKEND]
+
+    print(f"\n{len(pages)} sayfa, {args.repeat} tekrar\n")
+    print(f"{'Arka uç':<14}{'ms/sayfa':>10}{'Hızlanma':>10}{'Farklı alan':>13}")
+    for backend in backends:
+        mismatches = []
+        for name, output in results[backend].items():
+            for field, value in output.items():
+                if value != reference[name][field]:
+                    mismatches.append((name, field))
+        speedup = timings[REFERENCE_BACKEND] / timings[backend] if timings[backend] else 0
+        print(f"{backend:<14}{timings[backend] * 1000:>10.2f}{speedup:>9.1f}x{len(mismatches):>13}")
+        for name, field in mismatches[:10]:
+            print(f"    {name}: '{field}' referanstan farklı")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,76 +1,112 @@
 import streamlit as st
-from datetime import datetime, time, timedelta, date
-import pandas as pd
-from urllib.parse import urlparse
-from app.scraper import NewsSiteConfig, UniversalNewsScraper
+from datetime import datetime, time, timedelta
 import io
-from app.streamlit_trend_app import run_trends_app
-
-
-def get_site_config(url: str) -> NewsSiteConfig:
-    # Bu fonksiyon, verilen URL'ye göre uygun NewsSiteConfig'i döndürür.
-    # Gerçek bir uygulamada, bu kısım bir veritabanından veya yapılandırma dosyasından
-    # siteye özgü seçicileri çekecek şekilde genişletilebilir.
-    # Şimdilik, sadece Hurriyet için sabit bir konfigürasyon döndürüyoruz.
-    # Gelecekte, burada daha akıllı bir URL analizi veya kullanıcıdan seçici girişi eklenebilir.
-
-    parsed_url = urlparse(url)
-    domain = parsed_url.netloc
-
-    if "hurriyet.com.tr" in domain:
-        return NewsSiteConfig(
-            base_url=f"https://{domain}",
-            listing_page_paths=["/gundem/", "/", "/son-dakika/"],
-            article_link_selectors=[
-                'a[href*="/gundem/"]',
-                'a[href*="/haber/"]',
-                '.news-item a',
-                '.article-link'
-            ],
-            title_selectors=['h1', '.news-title', '.article-title'],
-            content_selectors=[
-                '.news-content',
-                '.article-content',
-                '.content',
-                '.news-text',
-                'div[data-news-content]'
-            ],
-            date_selectors=[
-                'time[datetime]',
-                '.news-datetime',
-                '.article-date',
-                '[data-date]',
-                '.date-time'
-            ],
-            turkish_date_parsing_enabled=True
-        )
-    elif "ntv.com.tr" in domain:
-        return NewsSiteConfig(
-            base_url=f"https://{domain}",
-            listing_page_paths=["/", "/son-dakika", "/turkiye", "/dunya"], # NTV için ana sayfalar
-            article_link_selectors=[
-                'a[data-story-channel="headline"]',
-                'li.related-news-item a.card-link',
-                'h3.ntv-main-slider-item-first-title a',
-                'a[href*=".ntv.com.tr/"]' # Daha genel bir link seçici
-            ],
-            title_selectors=['h1', 'meta[property="og:title"]', 'meta[name="title"]'],
-            content_selectors=['div.category-detail-content', 'div[itemprop="articleBody"]', 'div#contentBodyArea'],
-            date_selectors=['meta[name="datePublished"]', 'span.date', 'time', '.pubdate'],
-            turkish_date_parsing_enabled=False # NTV ISO formatını kullandığı için
-        )
+
+# Not: pandas, scraper modülleri (requests, lxml) ve plotly burada içe aktarılmaz.
+# Her araç ağır bağımlılıklarını yalnızca seçildiğinde / gerçekten ihtiyaç
+# duyduğunda yükler; böylece portalın ilk açılışı ve yeniden çalıştırmaları hızlanır.
+
+
+def get_site_config(url: str) -> 'NewsSiteConfig':
+    # Siteye özgü seçiciler app/site_configs.py içinde tanımlıdır (CLI ile ortak).
+    # Bilinmeyen siteler için genel seçiciler kullanılır ve kullanıcı uyarılır.
+    from app import site_configs
+
+    if not site_configs.is_known_site(url):
+        st.warning(f"\'{url}\' için özel bir yapılandırma bulunamadı. Genel seçiciler denenecektir. \n\n**Not:** Bu sitenin doğru çalışması için \'app/site_configs.py\' dosyasında özel CSS seçicileri tanımlamanız gerekebilir.")
+    return site_configs.get_site_config(url)
+
+@st.cache_resource
+def get_http_cache() -> 'HttpResponseCache':
+    # Tüm oturumlar ve yeniden çalıştırmalar aynı disk önbelleğini paylaşır
+    from app.http_cache import HttpResponseCache
+    return HttpResponseCache()
+
+@st.cache_resource
+def get_crawl_state() -> 'CrawlStateStore':
+    # Daha önce işlenen haberler yeniden indirilmez
+    from app.crawl_state import CrawlStateStore
+    return CrawlStateStore()
+
+@st.cache_resource
+def get_job_manager() -> 'CrawlJobManager':
+    # Tüm oturumlar aynı iş yöneticisini paylaşır; fazla taramalar sırada bekler
+    from app.jobs import CrawlJobManager
+    return CrawlJobManager(max_concurrent_jobs=2)
+
+def get_session_id():
+    # İşler oturum bazında listelenir
+    if 'session_id' not in st.session_state:
+        import uuid
+        st.session_state['session_id'] = uuid.uuid4().hex
+    return st.session_state['session_id']
+
+@st.fragment(run_every=1.0)
+def show_crawl_job(job_id):
+    # Yalnızca bu bölüm saniyede bir yenilenir; sayfanın geri kalanı yeniden çalışmaz
+    import pandas as pd
+
+    job = get_job_manager().get(job_id)
+    if job is None:
+        st.session_state.pop('active_job_id', None)
+        st.session_state['button_clicked'] = False
+        st.rerun(scope="app")
+
+    if job.is_finished:
+        finish_crawl_job(job)
+        st.rerun(scope="app")
+
+    if job.status == 'queued':
+        st.info("Tarama sırada bekliyor; önceki taramalar bitince başlayacak.")
+    elif job.cancel_requested:
+        st.info("Tarama durduruluyor...")
+    else:
+        st.info(job.last_message or "Haberler çekiliyor, lütfen bekleyin...")
+    st.caption(f"İş {job.job_id} · {job.found} haber · {job.elapsed:.0f} sn")
+
+    if st.button("Taramayı Durdur", key='cancel_job_button', disabled=job.cancel_requested):
+        get_job_manager().cancel(job_id)
+
+    partial_results = job.results_since(0)
+    if partial_results:
+        st.dataframe(pd.DataFrame(partial_results))
+
+def finish_crawl_job(job):
+    # Biten (veya iptal edilen) işin sonuçları indirme bölümüne aktarılır
+    import pandas as pd
+
+    st.session_state.pop('active_job_id', None)
+    st.session_state['crawl_stats'] = job.get_stats()
+    news_data = job.results_since(0)
+
+    if job.status == 'failed':
+        st.session_state['crawl_message'] = ('error', f"Tarama hatası: {job.error}")
+    elif job.status == 'cancelled':
+        st.session_state['crawl_message'] = ('warning', f"Tarama durduruldu; o ana kadar {len(news_data)} haber bulundu.")
+    elif news_data:
+        st.session_state['crawl_message'] = ('success', f"✓ {len(news_data)} haber bulundu!")
     else:
-        # Varsayılan veya genel bir konfigürasyon, özelleştirme gerekebilir
-        st.warning(f"\'{url}\' için özel bir yapılandırma bulunamadı. Genel seçiciler denenecektir. \n\n**Not:** Bu sitenin doğru çalışması için \'scraper.py\' dosyasında özel CSS seçicileri tanımlamanız gerekebilir.")
-        return NewsSiteConfig(
-            base_url=url,
-            listing_page_paths=["/"] ,
-            article_link_selectors=['a[href]', '.news-link a', '.article-card a', '.article-item a', '.post-link'],
-            title_selectors=['h1', 'h2.title', '.article-title', 'meta[property="og:title"]', 'meta[name="title"]'],
-            content_selectors=['div.content-body', '.article-content', 'div[itemprop="articleBody"]', 'div.entry-content', 'div.single-post-content'],
-            date_selectors=['time', '.date', '.pubdate', '[data-timestamp]', 'span.post-date', 'div.date-time'],
-            turkish_date_parsing_enabled=False # Varsayılan olarak Türkçe olmayan siteler için False
-        )
+        st.session_state['crawl_message'] = ('warning', "Belirtilen kriterlere uygun haber bulunamadı.")
+
+    if news_data:
+        df = pd.DataFrame(news_data)
+        st.session_state['news_df'] = df
+        st.session_state['news_exports'] = build_news_exports(df)
+    else:
+        st.session_state['button_clicked'] = False # Haber bulunamazsa butonu tekrar göster
+
+def build_news_exports(df):
+    # CSV ve Excel çıktıları her yeniden çalıştırmada değil, veri değiştiğinde bir kez üretilir
+    import pandas as pd
+
+    csv_buffer = io.StringIO()
+    df.to_csv(csv_buffer, index=False, encoding='utf-8-sig')
+
+    excel_buffer = io.BytesIO()
+    with pd.ExcelWriter(excel_buffer, engine='xlsxwriter') as writer:
+        df.to_excel(writer, index=False, sheet_name='Haberler')
+
+    return {'csv': csv_buffer.getvalue(), 'excel': excel_buffer.getvalue()}
 
 # Ana uygulama mantığı
 def main():
@@ -90,6 +126,7 @@ def main():
     if app_mode == "Haber Scraper":
         run_news_scraper_app()
     elif app_mode == "Google Trends Analizi":
+        from app.streamlit_trend_app import run_trends_app  # plotly yalnızca bu araçta yüklenir
         run_trends_app()
 
 def run_news_scraper_app():
@@ -98,17 +135,18 @@ def run_news_scraper_app():
 
     # Session state'i başlat
     if 'news_df' not in st.session_state:
-        st.session_state['news_df'] = pd.DataFrame()
+        st.session_state['news_df'] = None  # Haber çekilene kadar pandas yüklenmez
     if 'button_clicked' not in st.session_state:
         st.session_state['button_clicked'] = False
 
     # --- Kullanıcı Girişleri ---
 
     st.header("1. Haber Sitesi Linki")
-    news_site_url = st.text_input(
-        "Lütfen haber sitesinin URL'sini girin (örneğin: https://www.hurriyet.com.tr)",
+    news_site_input = st.text_area(
+        "Lütfen haber sitesinin URL'sini girin (örneğin: https://www.hurriyet.com.tr). Birden fazla site için her satıra bir URL yazın.",
         "https://www.hurriyet.com.tr"
     )
+    news_site_urls = [line.strip() for line in news_site_input.splitlines() if line.strip()]
 
     st.header("2. Tarih ve Saat Aralığı")
 
@@ -125,9 +163,8 @@ def run_news_scraper_app():
     start_datetime = datetime.combine(start_date, start_time_input)
     end_datetime = datetime.combine(end_date, end_time_input)
 
-    # Hata ve durum mesajları için yer tutucular
+    # Hata mesajları için yer tutucu
     error_placeholder = st.empty()
-    status_placeholder = st.empty()
 
     if start_datetime >= end_datetime:
         error_placeholder.error("Başlangıç tarihi ve saati, bitiş tarihinden ve saatinden önce olmalıdır.")
@@ -135,74 +172,76 @@ def run_news_scraper_app():
     # --- Haber Çekme Butonu ---
     st.markdown("---")
 
-    if not st.session_state['button_clicked']:
+    active_job_id = st.session_state.get('active_job_id')
+
+    if active_job_id:
+        # Tarama arka planda sürer; widget etkileşimleri ve yeniden çalıştırmalar onu etkilemez
+        show_crawl_job(active_job_id)
+    elif not st.session_state['button_clicked']:
         if st.button("Haberleri Çek", type="primary", key='fetch_news_button'):
             if start_datetime < end_datetime:
                 error_placeholder.empty() # Önceki hatayı temizle
-                status_placeholder.info("Haberler çekiliyor, lütfen bekleyin...")
                 st.session_state['button_clicked'] = True # Butona tıklandığını işaretle
-                
-                config = get_site_config(news_site_url)
-                scraper = UniversalNewsScraper(config)
-                
-                # İlerleme raporlama fonksiyonu
-                def update_status(message):
-                    status_placeholder.info(message)
 
-                with st.spinner('Haberler çekiliyor...'):
-                    news_data = scraper.scrape_news_by_time_range(start_datetime, end_datetime, max_listing_pages=2, status_callback=update_status)
+                from app.scraper import load_learned_selectors
                 
-                if news_data:
-                    st.success(f"✓ {len(news_data)} haber bulundu!")
-                    df = pd.DataFrame(news_data)
-                    st.session_state['news_df'] = df
-                    st.rerun() # DataFrame güncellendiğinde uygulamayı yeniden çalıştır
-                else:
-                    st.warning("Belirtilen kriterlere uygun haber bulunamadı.")
-                    st.session_state['button_clicked'] = False # Haber bulunamazsa butonu tekrar göster
+                # Önceki taramalarda öğrenilen seçici sıralaması varsa uygulanır
+                configs = [load_learned_selectors(get_site_config(url)) for url in news_site_urls]
+                st.session_state['active_job_id'] = get_job_manager().submit(
+                    configs, start_datetime, end_datetime, max_listing_pages=2,
+                    owner=get_session_id(), cache=get_http_cache(), crawl_state=get_crawl_state()
+                )
+                st.rerun()
             else:
                 error_placeholder.error("Lütfen geçerli bir tarih aralığı seçin.")
                 st.session_state['button_clicked'] = False # Hata olursa butonu tekrar göster
 
+    if 'crawl_message' in st.session_state:
+        level, message = st.session_state.pop('crawl_message')
+        getattr(st, level)(message)
+
     # Eğer haberler çekildiyse, sonuçları ve indirme butonlarını göster
-    if not st.session_state['news_df'].empty:
+    if st.session_state['news_df'] is not None and not st.session_state['news_df'].empty:
+        import pandas as pd
+
         st.header("3. Çekilen Haberler")
         st.dataframe(st.session_state['news_df'])
 
+        if st.session_state.get('crawl_stats'):
+            with st.expander("Site Bazında Tarama İstatistikleri"):
+                st.dataframe(pd.DataFrame(st.session_state['crawl_stats']))
+
         st.subheader("4. Sonuçları İndir")
-        df_to_download = st.session_state['news_df']
+        if 'news_exports' not in st.session_state:
+            st.session_state['news_exports'] = build_news_exports(st.session_state['news_df'])
+        exports = st.session_state['news_exports']
 
         col_csv, col_excel = st.columns(2)
 
         with col_csv:
-            csv_buffer = io.StringIO()
-            df_to_download.to_csv(csv_buffer, index=False, encoding='utf-8-sig')
             st.download_button(
                 label="CSV Olarak İndir",
-                data=csv_buffer.getvalue(),
+                data=exports['csv'],
                 file_name=f"yeb_haberler_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
                 mime="text/csv",
                 key='download_csv'
             )
 
         with col_excel:
-            excel_buffer = io.BytesIO()
-            with pd.ExcelWriter(excel_buffer, engine='xlsxwriter') as writer:
-                df_to_download.to_excel(writer, index=False, sheet_name='Haberler')
-            excel_buffer.seek(0)
             st.download_button(
                 label="Excel Olarak İndir",
-                data=excel_buffer.getvalue(),
+                data=exports['excel'],
                 file_name=f"yeb_haberler_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
                 mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                 key='download_excel'
             )
 
     # Eğer yeniden çekmek isterse butonu tekrar göster
-    if st.session_state['button_clicked'] and not st.session_state['news_df'].empty:
+    if st.session_state['button_clicked'] and st.session_state['news_df'] is not None and not st.session_state['news_df'].empty:
         st.markdown("---")
         if st.button("Yeni Arama Yap", key='new_search_button'):
-            st.session_state['news_df'] = pd.DataFrame() # Mevcut veriyi temizle
+            st.session_state['news_df'] = None # Mevcut veriyi temizle
+            st.session_state.pop('news_exports', None)
             st.session_state['button_clicked'] = False # Butonu tekrar göster
             st.rerun()
 
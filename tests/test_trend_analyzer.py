@@ -0,0 +1,130 @@
+"""TrendAnalyzer günlük zirve tablolarının eski (tarih başına döngülü) hesapla eşdeğerliği.
+
+Referans fonksiyonlar, rollup tabanlı sürümden önceki ön işleme ve
+döngüleri aynen uygular; yeni sonuçlar bunlarla birebir karşılaştırılır.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.trend_analyzer import TrendAnalyzer
+
+
+def _reference_frame(df):
+    # Eski _preprocess_data: sayıya çevrilemeyen/boş değerler 0 olur, Tarih date nesnesidir
+    df = df.copy()
+    df['Zaman'] = pd.to_datetime(df['Zaman'], format='%Y-%m-%dT%H')
+    for col in df.columns:
+        if col != 'Zaman':
+            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
+    df['Tarih'] = df['Zaman'].dt.date
+    df['Saat'] = df['Zaman'].dt.hour
+    return df
+
+
+def reference_daily_peak_hours(df):
+    df = _reference_frame(df)
+    peak_hours_data = []
+    for date in df['Tarih'].unique():
+        daily_df = df[df['Tarih'] == date]
+        for col in df.columns:
+            if col not in ['Zaman', 'Tarih', 'Saat']:
+                max_value = daily_df[col].max()
+                if max_value > 0:
+                    peak_hour_row = daily_df[daily_df[col] == max_value]
+                    if not peak_hour_row.empty:
+                        peak_hour = peak_hour_row['Saat'].iloc[0]
+                        peak_hours_data.append({
+                            'Tarih': date,
+                            'Lider': col,
+                            'Peak Saat Aralığı': f"{peak_hour:02d}:00-{peak_hour+1:02d}:00",
+                            'Peak Değer': int(max_value)
+                        })
+    return pd.DataFrame(peak_hours_data)
+
+
+def reference_overall_daily_peaks(df):
+    df = _reference_frame(df)
+    search_columns = [col for col in df.columns if col not in ['Zaman', 'Tarih', 'Saat']]
+    if not search_columns:
+        return pd.DataFrame()
+    df['Toplam Aranma'] = df[search_columns].sum(axis=1)
+
+    daily_total_peaks = []
+    for date in df['Tarih'].unique():
+        daily_df = df[df['Tarih'] == date]
+        if not daily_df.empty:
+            max_total_value = daily_df['Toplam Aranma'].max()
+            peak_rows = daily_df[daily_df['Toplam Aranma'] == max_total_value]
+            if not peak_rows.empty:
+                peak_time_obj = peak_rows['Zaman'].iloc[0]
+                daily_total_peaks.append({
+                    'Tarih': date,
+                    'Zirve Zamanı': peak_time_obj.strftime('%H:%M'),
+                    'Zirve Değeri': int(max_total_value)
+                })
+    return pd.DataFrame(daily_total_peaks)
+
+
+def _hourly(start, values):
+    """`values` sözlüğündeki sütunlarla `start`tan itibaren saatlik Trends tablosu"""
+    length = len(next(iter(values.values())))
+    times = pd.date_range(start, periods=length, freq='h').strftime('%Y-%m-%dT%H')
+    return pd.DataFrame({'Zaman': times, **values})
+
+
+def _edge_case_frame():
+    # 1. gün: eşit maksimumlar (A: 03 ve 07, B: 05 ve 20; toplam 03 ve 05'te 80)
+    a = [0] * 24
+    b = [0] * 24
+    a[3], a[7] = 60, 60
+    b[5], b[20] = 40, 40
+    b[3] = 20
+    a[5] = 40
+    # 2. gün: tüm değerler sıfır
+    a += [0] * 24
+    b += [0] * 24
+    # 3. gün: boş ve sayıya çevrilemeyen hücreler (0 sayılır), zirve bunların arasında
+    day3_a = [np.nan] * 24
+    day3_b = ['<1'] * 24
+    day3_a[10], day3_a[11] = 55, np.nan
+    day3_b[11], day3_b[12] = '', 70
+    a += day3_a
+    b += day3_b
+    frame = _hourly('2025-06-15 00:00', {'A': a, 'B': b})
+    # 4. gün: tek satırlı gün
+    single = _hourly('2025-06-18 09:00', {'A': [12], 'B': [0]})
+    return pd.concat([frame, single], ignore_index=True)
+
+
+CASES = {
+    'edge_cases': _edge_case_frame,
+    'single_keyword': lambda: _hourly('2025-06-15 00:00', {
+        'A': [5, 9, 9, 1] + [0] * 20 + [0] * 24 + [np.nan, 3, 3, np.nan] + [0] * 20}),
+    'single_row': lambda: _hourly('2025-06-15 13:00', {'A': [7], 'B': [7]}),
+    'all_zero': lambda: _hourly('2025-06-15 00:00', {'A': [0] * 48, 'B': [np.nan] * 48}),
+    'random': lambda: _hourly('2025-06-15 05:00', {
+        col: np.random.default_rng(seed).integers(0, 4, 24 * 9 + 7) * 25
+        for seed, col in enumerate(['A', 'B', 'C'])}),
+}
+
+
+@pytest.mark.parametrize('case', CASES)
+def test_daily_peak_hours_matches_reference(case):
+    df = CASES[case]()
+    pd.testing.assert_frame_equal(TrendAnalyzer(df).get_daily_peak_hours(), reference_daily_peak_hours(df))
+
+
+@pytest.mark.parametrize('case', CASES)
+def test_overall_daily_peaks_matches_reference(case):
+    df = CASES[case]()
+    pd.testing.assert_frame_equal(TrendAnalyzer(df).get_overall_daily_peaks(), reference_overall_daily_peaks(df))
+
+
+def test_ties_pick_first_hour():
+    peaks = TrendAnalyzer(_edge_case_frame()).get_daily_peak_hours()
+    first_day = peaks[peaks['Tarih'] == pd.Timestamp('2025-06-15').date()]
+    assert first_day['Peak Saat Aralığı'].tolist() == ['03:00-04:00', '05:00-06:00']
+
+    overall = TrendAnalyzer(_edge_case_frame()).get_overall_daily_peaks()
+    assert overall['Zirve Zamanı'].iloc[0] == '03:00'